@@ -0,0 +1,52 @@
+"""
+Benchmark VTS output encodings: write time against file size for every encoding, compressor and precision.
+
+Usage:
+    python benchmarks/outputEncoding.py --divisions 60 --repeat 3
+"""
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import itertools
+import numpy as np
+
+from fame.FVM.mesh import StructuredMesh
+from fame.FVM.visualization import MeshWriter
+
+
+def benchmark(divisions, repeat, level):
+    mesh = StructuredMesh(((0, 1), (0, 1), (0, 1)), (divisions, divisions, divisions))
+    rng = np.random.default_rng(0)
+    variables = {
+        "temperature_cell": 300 + rng.random(mesh.GetNumberOfCells()),
+        "temperature_node": 300 + rng.random(mesh.GetNumberOfPoints()),
+        "velocity_node": rng.random((mesh.GetNumberOfPoints(), 3))
+    }
+
+    cases = [("ascii", "none")] + list(itertools.product(("binary", "appended"), MeshWriter.COMPRESSORS))
+    print(f"{'encoding':<10}{'compressor':<12}{'precision':<10}{'time [s]':>10}{'size [MB]':>12}")
+    for (encoding, compressor), precision in itertools.product(cases, MeshWriter.PRECISIONS):
+        writer = MeshWriter(mesh, encoding=encoding, compressor=compressor, precision=precision,
+                            compressionLevel=level if compressor != "none" else None)
+        output_dir = tempfile.mkdtemp()
+        try:
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                writer._writeSingleVTS(os.path.join(output_dir, "output.vts"), variables)
+                timings.append(time.perf_counter() - start)
+            size = os.path.getsize(os.path.join(output_dir, "output.vts")) / 1e6
+        finally:
+            shutil.rmtree(output_dir)
+        print(f"{encoding:<10}{compressor:<12}{precision:<10}{min(timings):>10.3f}{size:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark VTS output encodings")
+    parser.add_argument('--divisions', type=int, default=60, help="Cells per axis")
+    parser.add_argument('--repeat', type=int, default=3, help="Writes per case; the fastest is reported")
+    parser.add_argument('--level', type=int, default=None, help="Compression level (1-9)")
+    args = parser.parse_args()
+    benchmark(args.divisions, args.repeat, args.level)
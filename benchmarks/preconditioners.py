@@ -0,0 +1,74 @@
+"""
+Benchmark the scipy preconditioners: setup time, Krylov iterations and solve time per preconditioner on the
+heat diffusion example setups, with the divisions optionally refined.
+
+Usage:
+    python benchmarks/preconditioners.py --refine 1 2 4 --method bicgstab
+"""
+import os
+import time
+import argparse
+import numpy as np
+import scipy.sparse as sp
+from contextlib import redirect_stdout
+
+from fame.FVM.finiteVolumeMethod import FVM3D
+from fame.FVM.solver import Solver, pyamg
+from fame.main import loadInput
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "examples", "FVM", "HeatDiffusion")
+SETUPS = ("setup.yaml", "setup_small.yaml")
+KRYLOV = {"bicgstab": sp.linalg.bicgstab, "cg": sp.linalg.cg, "gmres": sp.linalg.gmres}
+
+
+def assemble(setup, refine):
+    config = loadInput(os.path.join(EXAMPLES, setup))
+    for axis, n in config['simulation']['domain']['divisions'].items():
+        config['simulation']['domain']['divisions'][axis] = n * refine
+    config['simulation']['meshCache'] = {'enabled': False}
+    fvm = FVM3D(config)
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        fvm.meshGeneration()
+        fvm.applyBoundaryConditions()
+        fvm.loadMaterialProperty()
+        fvm.discretize()
+    return fvm.mesh
+
+
+def benchmark(refinements, method, tolerance):
+    preconditioners = ["none", "jacobi", "ilu", "multigrid"] + (["amg"] if pyamg is not None else [])
+    print(f"{'setup':<18}{'cells':>8}  {'preconditioner':<15}{'setup [s]':>10}{'iterations':>12}{'solve [s]':>11}")
+    for setup in SETUPS:
+        for refine in refinements:
+            mesh = assemble(setup, refine)
+            A = mesh.A.tocsr()
+            for preconditioner in preconditioners:
+                solver = Solver(A, mesh.b, backend="scipy", gridShape=mesh.divisions)
+                start = time.perf_counter()
+                if preconditioner == "jacobi":
+                    M = sp.linalg.LinearOperator(A.shape, matvec=lambda x, d=A.diagonal(): x / d, dtype=np.float64)
+                elif preconditioner == "multigrid":
+                    M = solver._getMultigrid().asPreconditioner()
+                elif preconditioner in ("ilu", "amg"):
+                    M = solver._getPreconditioner(preconditioner)
+                else:
+                    M = None
+                setupTime = time.perf_counter() - start
+
+                iterations = [0]
+                callback = lambda *args: iterations.__setitem__(0, iterations[0] + 1)
+                start = time.perf_counter()
+                _, info = KRYLOV[method](A, mesh.b, rtol=tolerance, M=M, callback=callback, maxiter=10000)
+                solveTime = time.perf_counter() - start
+                status = "" if info == 0 else f"  (info={info})"
+                print(f"{setup:<18}{A.shape[0]:>8}  {preconditioner:<15}{setupTime:>10.3f}"
+                      f"{iterations[0]:>12}{solveTime:>11.3f}{status}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark scipy preconditioners on the example setups")
+    parser.add_argument('--refine', type=int, nargs='+', default=[1, 2, 4], help="Division refinement factors")
+    parser.add_argument('--method', choices=sorted(KRYLOV), default="bicgstab", help="Krylov method")
+    parser.add_argument('--tolerance', type=float, default=1e-8, help="Relative residual tolerance")
+    args = parser.parse_args()
+    benchmark(args.refine, args.method, args.tolerance)
@@ -0,0 +1,135 @@
+import os
+import json
+import shutil
+import tempfile
+import numpy as np
+
+
+def writeArrayDirectory(path, arrays, metadata, replace=True):
+    """
+    Atomically write arrays as one .npy file each, plus a metadata.json file, to a directory.
+
+    The files are written to a private temporary sibling directory that is renamed into place once complete,
+    so readers never see a partially written directory and concurrent writers never share a staging area.
+
+    Args:
+        path (str): Target directory.
+        arrays (dict): NumPy arrays keyed by name.
+        metadata (dict): JSON-serializable metadata. The array names are added under 'arrays'.
+        replace (bool): Replace the target if it exists. Otherwise an existing target, e.g. one published by
+            another process in the meantime, is kept and the new copy is discarded.
+
+    Returns:
+        bool: True if the arrays were published at path, False if an existing target was kept.
+    """
+    parent = os.path.dirname(os.path.abspath(path))
+    temporary = tempfile.mkdtemp(dir=parent, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        for name, array in arrays.items():
+            np.save(os.path.join(temporary, name + '.npy'), np.asarray(array))
+        with open(os.path.join(temporary, Checkpoint.METADATA_FILE), 'w') as f:
+            json.dump({**metadata, 'arrays': sorted(arrays)}, f, indent=2)
+
+        if replace:
+            shutil.rmtree(path, ignore_errors=True)
+        try:
+            os.replace(temporary, path)
+        except OSError:
+            # renaming onto a non-empty directory fails: another writer published the target first
+            if replace or not os.path.isdir(path):
+                raise
+            return False
+        return True
+    finally:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+
+class Checkpoint:
+    """
+    Directory of simulation checkpoints. Each checkpoint is a directory holding one .npy file per array and a
+    metadata.json file, so arrays can be memory-mapped on load instead of read into memory.
+
+    A checkpoint is written into a temporary directory and renamed into place once complete, so a job that
+    dies while writing never leaves a truncated checkpoint behind. Only the most recent ``keep`` checkpoints
+    are retained.
+    """
+    METADATA_FILE = 'metadata.json'
+
+    def __init__(self, directory, keep=2):
+        """
+        Initialize the checkpoint directory.
+
+        Args:
+            directory (str): Directory holding the checkpoints.
+            keep (int): Number of most recent checkpoints to retain.
+        """
+        self.directory = directory
+        self.keep = max(1, int(keep))
+
+    def save(self, step, arrays, metadata=None):
+        """
+        Write a checkpoint.
+
+        Args:
+            step (int): Step index; checkpoints are named and ordered by it.
+            arrays (dict): NumPy arrays to store, keyed by name.
+            metadata (dict, optional): JSON-serializable metadata, e.g. time, step and solver settings.
+
+        Returns:
+            str: Path to the written checkpoint.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        target = os.path.join(self.directory, f"checkpoint_{int(step):06d}")
+        writeArrayDirectory(target, arrays, {'step': int(step), **(metadata or {})})
+        self._prune()
+        return target
+
+    def list(self):
+        """
+        Return the paths of all complete checkpoints, oldest first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        names = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith('checkpoint_') and not name.endswith('.tmp')
+            and os.path.exists(os.path.join(self.directory, name, self.METADATA_FILE))
+        )
+        return [os.path.join(self.directory, name) for name in names]
+
+    def latest(self):
+        """
+        Return the path of the most recent checkpoint, or None if there is none.
+        """
+        checkpoints = self.list()
+        return checkpoints[-1] if checkpoints else None
+
+    def _prune(self):
+        for path in self.list()[:-self.keep]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def load(path, mmapMode='r'):
+        """
+        Load a checkpoint.
+
+        Args:
+            path (str): Path to a checkpoint directory.
+            mmapMode (str, optional): Memory-map mode passed to np.load, or None to read arrays into memory.
+
+        Returns:
+            tuple: (metadata, arrays) with the metadata dictionary and the arrays keyed by name.
+
+        Raises:
+            FileNotFoundError: If the path is not a complete checkpoint.
+        """
+        metadata_file = os.path.join(path, Checkpoint.METADATA_FILE)
+        if not os.path.exists(metadata_file):
+            raise FileNotFoundError(f"No checkpoint found at {path}.")
+        with open(metadata_file) as f:
+            metadata = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(path, name + '.npy'), mmap_mode=mmapMode)
+            for name in metadata['arrays']
+        }
+        return metadata, arrays
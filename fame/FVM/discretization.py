@@ -5,6 +5,7 @@ from .mesh import StructuredMesh
 from .solver import Solver
 from .property import MaterialProperty
 from .boundaryCondition import BoundaryCondition
+from .stencil import StencilOperator
 
 class Discretization:
     def __init__(self, mesh, solver, property, boundaryCondition):
@@ -22,27 +23,112 @@ class Discretization:
         self.boundaryCondition = boundaryCondition
         self.property = property
 
-    def discretizeHeatDiffusion(self):
+    def _evaluateThermalConductivity(self):
         """
-        Discretize the 3D heat diffusion equation and populate the sparse matrix A and vector b from the solver class.
+        Evaluate the thermal conductivity from the MaterialProperty class at the default temperature.
+        """
+        if 'thermalConductivity' not in self.property.properties:
+            raise ValueError("Material property must include 'thermalConductivity'")
+        return self.property.evaluate('thermalConductivity', 298.15)  # Default temp used for evaluation
+
+    def _heatDiffusionCoefficients(self):
+        """
+        Compute the heat diffusion coefficients from per-face conductance arrays.
+
+        Returns:
+            tuple: (faceConductance, boundaryDiagonal, cellDiagonal, b) where faceConductance holds k * A / d for
+            every face, boundaryDiagonal the diagonal contribution of every boundary face to its owner,
+            cellDiagonal the source contribution to every diagonal entry, and b the right-hand side.
+        """
+        thermalConductivity = self._evaluateThermalConductivity()
+
+        mesh = self.mesh
+        bc = self.boundaryCondition
+
+        faceConductance = thermalConductivity * mesh.faceAreas / mesh.faceDistances
+
+        # boundary faces only contribute to the diagonal of their owner and to b
+        boundary = mesh.boundaryFaces
+        boundaryOwner = mesh.faceOwner[boundary]
+        boundaryConductance = faceConductance[boundary]
+        boundaryValues = bc.bcValues.tocsc()[:, 0].toarray().ravel()[boundary]
+        boundaryDiagonal = boundaryConductance + bc.convectionCoefficient
+
+        # LIL to dense is row-by-row, so convert to CSR first
+        dependentSource = bc.dependentSource.tocsr().toarray().ravel()
+        independentSource = bc.independentSource.tocsr().toarray().ravel()
+        volumetricSource = bc.volumetricSource.tocsr().toarray().ravel()
+
+        boundaryFlux = boundaryConductance * boundaryValues + bc.convectionCoefficient * mesh.faceAreas[boundary] * bc.ambientTemperature
+        b = np.bincount(boundaryOwner, weights=boundaryFlux, minlength=mesh.numCells) + independentSource + volumetricSource * mesh.cellVolumes
+
+        return faceConductance, boundaryDiagonal, -dependentSource, b
+
+    def discretizeHeatDiffusion(self, matrixFormat="csr"):
+        """
+        Discretize the 3D heat diffusion equation and populate the operator A and vector b of the mesh.
         Uses temperature-dependent thermal conductivity from the MaterialProperty class.
+
+        The operator is assembled from per-face conductance arrays for all interior faces, boundary faces and
+        source terms at once. With the "csr" format, values are scattered into the cached CSR sparsity pattern
+        of the mesh, so repeated calls only overwrite the data array of the same matrix. With the "matrixFree"
+        format, A is a StencilOperator that never stores the matrix. With the "dia" format, A is a DIA matrix
+        holding only the 3 (1D) or 7 (3D) diagonals of the structured-grid operator.
+
+        Args:
+            matrixFormat (str): "csr", "dia" or "matrixFree".
+        """
+        if matrixFormat not in ("csr", "dia", "matrixFree"):
+            raise ValueError(f"Unsupported matrix format '{matrixFormat}'. Choose from 'csr', 'dia' or 'matrixFree'.")
+
+        mesh = self.mesh
+        faceConductance, boundaryDiagonal, cellDiagonal, b = self._heatDiffusionCoefficients()
+        interiorConductance = faceConductance[mesh.interiorFaces]
+
+        if matrixFormat == "csr":
+            # entry order follows mesh.getSparsityPattern()
+            values = np.concatenate([
+                -interiorConductance, -interiorConductance,
+                interiorConductance, interiorConductance,
+                boundaryDiagonal,
+                cellDiagonal
+            ])
+            mesh.A = mesh.getSparsityPattern().assemble(values)
+        else:
+            diagonal = (
+                np.bincount(mesh.faceOwner[mesh.interiorFaces], weights=interiorConductance, minlength=mesh.numCells)
+                + np.bincount(mesh.faceNeighbour[mesh.interiorFaces], weights=interiorConductance, minlength=mesh.numCells)
+                + np.bincount(mesh.faceOwner[mesh.boundaryFaces], weights=boundaryDiagonal, minlength=mesh.numCells)
+                + cellDiagonal
+            )
+            mesh.A = StencilOperator.fromMesh(mesh, faceConductance, diagonal)
+            if matrixFormat == "dia":
+                mesh.A = mesh.A.todia()
+
+        mesh.b[:] = b
+
+        if self.solver is not None:
+            self.solver.A = mesh.A
+
+    def discretizeHeatDiffusionLoop(self):
         """
+        Reference cell-by-cell implementation of :meth:`discretizeHeatDiffusion`. Writes into the LIL matrix A
+        and vector b of the mesh one entry at a time; kept for testing the vectorized assembly.
+
+        Face areas, centers, distances and cell volumes are recomputed face by face from the mesh points
+        rather than read from the precomputed geometry arrays, so the test also checks the batch geometry.
+        """
+        thermalConductivity = self._evaluateThermalConductivity()
 
         for cellID in range(self.mesh.numCells):
-            
-            if 'thermalConductivity' in self.property.properties:
-                thermalConductivity = self.property.evaluate('thermalConductivity', 298.15)  # Default temp used for evaluation
-            else:
-                raise ValueError("Material property must include 'thermalConductivity'")
+            cellCenter = self._cellCenter(cellID)
+            cellVolume = 0.0
             
             # off-diagonal matrix element construction
             for sharedCellID, sharedFace in zip (self.mesh.sharedCells[cellID]['shared_cells'], self.mesh.sharedCells[cellID]['shared_faces']): # the assumption is that sharedCells and sharedFaces are lists of the same length as only one face is shared between two cells.
-                points = vtk.vtkPoints()
-                for point in self.mesh.faces[sharedFace]:
-                    points.InsertNextPoint(self.mesh.GetPoint(point))
-                
-                faceArea = self.mesh.calculateArea(points)
-                cellDistance = np.linalg.norm(np.array(self.mesh.cellCenters[cellID]) - np.array(self.mesh.cellCenters[sharedCellID]))
+                faceArea = self._faceArea(sharedFace)
+                cellDistance = np.linalg.norm(cellCenter - self._cellCenter(sharedCellID))
+                cellVolume += faceArea * np.linalg.norm(cellCenter - self._faceCenter(sharedFace))
 
                 self.mesh.A[cellID, sharedCellID] = -thermalConductivity * (faceArea)/(cellDistance)
 
@@ -51,13 +137,37 @@ class Discretization:
             
             # diagonal marix element construction for boundary faces
             for sharedBoundaryFace in self.mesh.sharedCells[cellID]['boundary_faces']:
-                points = vtk.vtkPoints()
-                for point in self.mesh.faces[sharedBoundaryFace]:
-                    points.InsertNextPoint(self.mesh.GetPoint(point))
-                boundaryFaceArea = self.mesh.calculateArea(points)
-                distance_cell_to_boundary_face = np.linalg.norm(np.array(self.mesh.cellCenters[cellID]) - np.array(self.mesh.faceCenters[sharedBoundaryFace]))
+                boundaryFaceArea = self._faceArea(sharedBoundaryFace)
+                distance_cell_to_boundary_face = np.linalg.norm(cellCenter - self._faceCenter(sharedBoundaryFace))
+                cellVolume += boundaryFaceArea * distance_cell_to_boundary_face
                 self.mesh.A[cellID, cellID] += thermalConductivity * (boundaryFaceArea)/(distance_cell_to_boundary_face) + self.boundaryCondition.convectionCoefficient
                 self.mesh.b[cellID] += thermalConductivity * self.boundaryCondition.bcValues[sharedBoundaryFace, 0] * (boundaryFaceArea) / (distance_cell_to_boundary_face)+self.boundaryCondition.convectionCoefficient * boundaryFaceArea * self.boundaryCondition.ambientTemperature
+
+            # the cell is a union of pyramids (prisms in 1D) from its center to each face: V = 1/d * sum_f A_f h_f
+            cellVolume /= len(self.mesh.divisions)
                 
             self.mesh.A[cellID, cellID] += -self.boundaryCondition.dependentSource[cellID, 0]
-            self.mesh.b[cellID] += self.boundaryCondition.independentSource[cellID, 0] + self.boundaryCondition.volumetricSource[cellID, 0] * self.mesh.getCellVolume(cellID)
+            self.mesh.b[cellID] += self.boundaryCondition.independentSource[cellID, 0] + self.boundaryCondition.volumetricSource[cellID, 0] * cellVolume
+
+    def _faceArea(self, faceID):
+        """
+        Area of a face computed from its points with the mesh's own area routine.
+        """
+        points = vtk.vtkPoints()
+        for point in self.mesh.faces[faceID]:
+            points.InsertNextPoint(self.mesh.GetPoint(point))
+        return self.mesh.calculateArea(points)
+
+    def _faceCenter(self, faceID):
+        """
+        Center of a face as the mean of its points.
+        """
+        return np.mean([self.mesh.GetPoint(point) for point in self.mesh.faces[faceID]], axis=0)
+
+    def _cellCenter(self, cellID):
+        """
+        Center of a cell as the mean of the distinct points of its faces.
+        """
+        faceIDs = self.mesh.sharedCells[cellID]['shared_faces'] + self.mesh.sharedCells[cellID]['boundary_faces']
+        pointIDs = np.unique(np.concatenate([self.mesh.faces[faceID] for faceID in faceIDs]))
+        return np.mean([self.mesh.GetPoint(point) for point in pointIDs], axis=0)
@@ -1,4 +1,6 @@
 import vtk
+import copy
+import warnings
 import numpy as np
 import scipy.sparse as sp
 from .boundaryCondition import BoundaryCondition as bc
@@ -6,7 +8,10 @@ from .discretization import Discretization as disc
 from .mesh import StructuredMesh, StructuredMesh1D
 from .property import MaterialProperty as prop
 from .solver import Solver as sol
-from .visualization import MeshWriter, MeshWriter1D
+from .visualization import MeshWriter, AsyncMeshWriter, XDMFWriter
+from .stencil import StencilOperator
+from .checkpoint import Checkpoint
+from .meshCache import MeshCache
 from ..utils.utility import timing_decorator
 
 class FVM:
@@ -30,6 +35,9 @@ class FVM:
         self.visualization = None
         self.output = None
         self.nodalSolution = None
+        self.solution = None
+        self.step = 0
+        self.time = 0.0
 
     def meshGeneration(self):
         raise NotImplementedError("meshGeneration must be implemented by subclass.")
@@ -101,7 +109,8 @@ class FVM:
             raise ValueError("Mesh must be generated before discretization.")
         material_name = self.config['simulation']['material']['name']  # Get material name dynamically
         self.discretization = disc(self.mesh, self.solver, self.materialProperties[material_name], self.boundaryConditions)
-        self.discretization.discretizeHeatDiffusion()
+        matrix_format = self.config['simulation'].get('solver', {}).get('matrixFormat', 'csr')
+        self.discretization.discretizeHeatDiffusion(matrixFormat=matrix_format)
         print("Discretization applied.")
     
     @timing_decorator
@@ -110,27 +119,10 @@ class FVM:
         Interpolate the cell‐centered solution onto the mesh nodes
         by averaging all adjacent cell values at each mesh point,
         then let subclasses overwrite Dirichlet BCs in-place.
+        The averaging operator is cached on the mesh and reused on every call.
         """
-        # --- prepare in-place storage ---
-        num_pts = self.mesh.GetNumberOfPoints()
-        # reuse or (re)allocate the nodalSolution array
-        self.nodalSolution = np.zeros(num_pts, dtype=float)
-        counts = np.zeros(num_pts, dtype=int)
-
-        # --- accumulate cell contributions ---
-        cell_vals = self.solution[0]
-        for cid in range(self.mesh.GetNumberOfCells()):
-            v = cell_vals[cid]
-            pts_ids = self.mesh.GetCell(cid).GetPointIds()
-            for i in range(pts_ids.GetNumberOfIds()):
-                pid = pts_ids.GetId(i)
-                self.nodalSolution[pid] += v
-                counts[pid] += 1
-
-        # --- normalize to get averages ---
-        counts[counts == 0] = 1
-        # in-place division
-        self.nodalSolution /= counts
+        # --- average adjacent cell values with the cached point x cell operator ---
+        self.nodalSolution = self.mesh.getCellToPointMatrix() @ np.asarray(self.solution[0])
 
         # --- apply any Dirichlet BCs in-place ---
         self._apply_nodal_bc(self.nodalSolution)
@@ -142,21 +134,134 @@ class FVM:
         if not self.mesh:
             raise ValueError("Mesh must be generated before solving.")
         
-        backend = self.config['simulation'].get('solver', {}).get('module')
-        self.solver = sol(self.mesh.A, self.mesh.b, backend=backend)
-        solver_type = self.config['simulation'].get('solver', {}).get('method')
-        tolerance = self.config['simulation'].get('solver', {}).get('tolerance')
-        maxIterations = self.config['simulation'].get('solver', {}).get('maxIterations')
-        self.solution = self.solver.solve(method=solver_type, preconditioner="none")
-        print(f"Solver {solver_type} completed with tolerance {tolerance} and max iterations {maxIterations}.")        
+        solver_config = self.config['simulation'].get('solver', {})
+        backend = solver_config.get('module', 'scipy')
+        # keep the solver, and with it the operator caches, while the system is reassembled in place
+        if self.solver is None or self.solver.A is not self.mesh.A or self.solver.backend != backend.lower():
+            self.solver = sol(
+                self.mesh.A, self.mesh.b, backend=backend, gridShape=self.mesh.divisions,
+                preconditionerOptions=solver_config.get('preconditionerOptions'),
+                factorCacheSize=solver_config.get('factorCacheSize', 4)
+            )
+            # a new solver warm-starts from the previous or restored solution; it falls back to no guess
+            # if that solution does not fit the system
+            self.solver.solution = self.solution
+        self.solver.b = self.mesh.b
+        self.solver.warmStart = solver_config.get('warmStart', False)
+        solver_type = self._selectSolverMethod(solver_config)
+        if solver_config.get('method') is not None and solver_type != solver_config.get('method'):
+            print(f"Using the {solver_type} solver instead of the configured method '{solver_config['method']}'.")
+        tolerance = float(solver_config.get('tolerance', 1e-10))
+        maxIterations = solver_config.get('maxIterations')
+        self.solution = self.solver.solve(
+            method=solver_type, preconditioner=solver_config.get('preconditioner', 'none'),
+            tolerance=tolerance, maxIterations=None if maxIterations is None else int(maxIterations),
+            x0=self._initialGuess(solver_config)
+        )
+        status = "converged" if self.solution.converged else "did not converge"
+        if self.solution.iterations is not None:
+            status += f" in {self.solution.iterations} iterations"
+        print(f"Solver {solver_type} {status} "
+              f"({self.solution.wallTime:.3f} s, tolerance {tolerance}, max iterations {maxIterations}).")
     
+    def _selectSolverMethod(self, solver_config):
+        return solver_config.get('method')
+
+    def _initialGuess(self, solver_config):
+        """
+        Explicit initial guess of the iterative solve. A run without a solution is seeded from the solution on
+        a mesh coarsened by 'coarseInitialGuess'. Otherwise None, which leaves the guess to the solver: the
+        previous or restored solution with 'warmStart: true', else zero. None is also returned for the direct
+        methods since they ignore it.
+        """
+        if self._selectSolverMethod(solver_config) in ('banded', 'direct'):
+            return None
+        factor = int(solver_config.get('coarseInitialGuess', 1))
+        if factor > 1 and self.solution is None:
+            return self._coarseInitialGuess(factor)
+        return None
+
+    def _coarseInitialGuess(self, factor):
+        """
+        Solve the same problem on a mesh with 'factor' times fewer divisions per axis and interpolate the
+        cell solution onto the cells of this mesh.
+
+        Args:
+            factor (int): Coarsening factor of the divisions.
+
+        Returns:
+            np.ndarray: Initial guess on this mesh.
+        """
+        config = copy.deepcopy(self.config)
+        simulation = config['simulation']
+        simulation['solver'].pop('coarseInitialGuess', None)
+        divisions = simulation['domain']['divisions']
+        for axis, n in divisions.items():
+            divisions[axis] = [max(1, int(m) // factor) for m in n] if isinstance(n, list) else max(1, int(n) // factor)
+
+        coarse = type(self)(config)
+        coarse.meshGeneration()
+        coarse.applyBoundaryConditions()
+        coarse.loadMaterialProperty()
+        coarse.discretize()
+        coarse.solveEquations()
+        return coarse.mesh.interpolateCellValues(coarse.solution[0], self.mesh.cellCentroids)
+
+    def _outputWriter(self):
+        """
+        Create the mesh writer on first use: VTK files by default, or a single HDF5 file with an XDMF sidecar
+        with 'format: xdmf' in the 'visualization' config. With 'asynchronous: true', output goes through a
+        background AsyncMeshWriter with a bounded queue of 'queueSize' snapshots.
+        """
+        if self.visualization is None:
+            visualization_config = self.config['simulation'].get('visualization', {})
+            output_format = visualization_config.get('format', 'vtk')
+            if output_format == 'vtk':
+                self.visualization = MeshWriter(self.mesh, **self._writerOptions())
+            elif output_format == 'xdmf':
+                self.visualization = XDMFWriter(self.mesh, **self._writerOptions())
+            else:
+                raise ValueError(f"Unsupported output format '{output_format}'. Choose from 'vtk' or 'xdmf'.")
+            if visualization_config.get('asynchronous', False):
+                self.output = AsyncMeshWriter(self.visualization, maxQueueSize=visualization_config.get('queueSize', 2))
+        return self.output if self.output is not None else self.visualization
+
+    def closeOutput(self):
+        """
+        Flush pending output, stop the background writer, if any, and close the output files.
+        """
+        if self.output is not None:
+            output, self.output = self.output, None
+            output.close()
+        if self.visualization is not None:
+            visualization, self.visualization = self.visualization, None
+            visualization.close()
+
+    def _writerOptions(self):
+        """
+        Collect the output encoding, compression, precision and decimation settings from the 'visualization' config.
+        The xdmf format always writes the full mesh into HDF5, so it warns about the VTK-only 'encoding', 'region'
+        and 'stride' settings instead of silently dropping them.
+        """
+        visualization_config = self.config['simulation'].get('visualization', {})
+        keys = ('encoding', 'compressor', 'compressionLevel', 'precision', 'writeFrequency', 'region', 'stride')
+        if visualization_config.get('format', 'vtk') == 'xdmf':
+            ignored = [key for key in ('encoding', 'region', 'stride') if key in visualization_config]
+            if visualization_config.get('stride', 1) == 1 and 'stride' in ignored:
+                ignored.remove('stride')
+            if ignored:
+                warnings.warn(f"The xdmf output format ignores the visualization settings {', '.join(ignored)}; "
+                              f"the full mesh is written.")
+            keys = ('compressor', 'compressionLevel', 'precision', 'writeFrequency')
+        return {key: visualization_config[key] for key in keys if key in visualization_config}
+
     @timing_decorator
     def visualizeResults(self):
         if not self.solver or self.solver.solution is None:
             raise ValueError("Solution must exist before visualization.")
             
         # Initialize MeshWriter with the mesh
-        self.visualization = MeshWriter(self.mesh)
+        writer = self._outputWriter()
 
         # Read variable name from YAML or default to 'temperature_cell'
         variable_name = self.config['simulation'].get('visualization', {}).get('variableName', 'temperature') + "_cell"
@@ -173,16 +278,183 @@ class FVM:
         output_path = self.config['simulation'].get('visualization', {}).get('path', './')
         
         # Write the VTS file
-        self.visualization.writeVTS(output_path, variables)
+        writer.writeVTS(output_path, variables, time=self.time, step=self.step)
         print(f"Visualization generated and saved at {output_path} with variable '{variable_name}'.")
 
-    def simulate(self):
-        self.meshGeneration()
-        self.applyBoundaryConditions()
-        self.loadMaterialProperty()
-        self.discretize()
-        self.solveEquations()
-        self.visualizeResults()
+    def _buildMesh(self, bounds, divisions, **meshOptions):
+        """
+        Build the mesh, reusing the arrays of an identical mesh from the on-disk mesh cache if the 'meshCache'
+        section enables it. The cache is off by default, since it writes up to 'maxSizeMB' to 'path'.
+
+        Args:
+            bounds (tuple): Bounds of the mesh.
+            divisions (tuple): Number of divisions per axis.
+            **meshOptions: Further StructuredMesh arguments, e.g. faceArea of a 1D mesh.
+
+        Returns:
+            StructuredMesh: The mesh.
+        """
+        cache_config = self.config['simulation'].get('meshCache', {})
+        if not cache_config.get('enabled', False):
+            return StructuredMesh(bounds, divisions, **meshOptions)
+        cache = MeshCache(
+            cache_config.get('path', '~/.cache/fame/meshes'),
+            maxBytes=float(cache_config.get('maxSizeMB', 1024)) * 1024 ** 2
+        )
+        return cache.getMesh(bounds, divisions, **meshOptions)
+
+    def _checkpointConfig(self):
+        return self.config['simulation'].get('checkpoint', {})
+
+    @timing_decorator
+    def writeCheckpoint(self, force=False):
+        """
+        Save the mesh arrays, the assembled system, the solution, time and step index as a checkpoint, if a
+        'checkpoint' section is configured and the step is a multiple of its 'interval'.
+
+        Args:
+            force (bool): Write regardless of the interval.
+
+        Returns:
+            str: Path to the written checkpoint, or None if none was written.
+        """
+        checkpoint_config = self._checkpointConfig()
+        if not checkpoint_config and not force:
+            return None
+        if not force and self.step % max(1, int(checkpoint_config.get('interval', 1))):
+            return None
+
+        arrays = {f'mesh_{name}': array for name, array in self.mesh.getArrays().items()}
+        metadata = {
+            'time': float(self.time),
+            'divisions': [int(n) for n in np.atleast_1d(self.mesh.divisions)],
+            'solver': {
+                'backend': self.config['simulation'].get('solver', {}).get('module'),
+                'method': self._selectSolverMethod(self.config['simulation'].get('solver', {})),
+                'preconditioner': self.config['simulation'].get('solver', {}).get('preconditioner', 'none'),
+                # the key the solver caches its factorizations and preconditioners of this operator under
+                'operatorKey': sol.operatorKey(self.mesh.A)
+            }
+        }
+        if isinstance(self.mesh, StructuredMesh1D):
+            metadata['faceArea'] = float(self.mesh.faceArea)
+
+        A = self.mesh.A
+        if isinstance(A, StencilOperator):
+            metadata['matrixFormat'] = 'matrixFree'
+            arrays['A_diagonal'] = A.diagonalValues
+            for axis, conductance in enumerate(A.conductances):
+                arrays[f'A_conductance{axis}'] = conductance
+        else:
+            A_csr = A.tocsr()
+            metadata['matrixFormat'] = A.format
+            metadata['matrixShape'] = list(A_csr.shape)
+            arrays.update(A_data=A_csr.data, A_indices=A_csr.indices, A_indptr=A_csr.indptr)
+        arrays['b'] = self.mesh.b
+
+        if self.solution is not None:
+            solution, err, info = self.solution
+            arrays['solution'] = np.asarray(solution)
+            metadata['err'] = None if err is None else float(np.max(err))
+            metadata['info'] = None if info is None else int(np.max(info))
+
+        checkpoint = Checkpoint(checkpoint_config.get('path', './checkpoints'), keep=checkpoint_config.get('keep', 2))
+        path = checkpoint.save(self.step, arrays, metadata)
+        print(f"Checkpoint written to {path}.")
+        return path
+
+    @timing_decorator
+    def restoreCheckpoint(self, path='latest'):
+        """
+        Restore the mesh, assembled system, solution, time and step index from a checkpoint. The mesh is
+        rebuilt from its stored arrays rather than recomputed. The arrays are copied out of the memory-mapped
+        files, so later checkpoints may prune the restored one.
+
+        Args:
+            path (str): Checkpoint directory, or 'latest' for the most recent checkpoint of the configured
+                checkpoint path.
+
+        Returns:
+            bool: Whether the restored operator still applies: it is intact and was assembled in the configured
+                'matrixFormat'. Otherwise the system has to be discretized again.
+        """
+        if path == 'latest':
+            checkpoint_config = self._checkpointConfig()
+            path = Checkpoint(checkpoint_config.get('path', './checkpoints')).latest()
+            if path is None:
+                raise FileNotFoundError("No checkpoint found to restart from.")
+
+        metadata, arrays = Checkpoint.load(path)
+        mesh_arrays = {
+            name[len('mesh_'):]: np.array(array) for name, array in arrays.items() if name.startswith('mesh_')
+        }
+        mesh_options = {'faceArea': metadata['faceArea']} if 'faceArea' in metadata else {}
+        self.mesh = StructuredMesh(None, metadata['divisions'], arrays=mesh_arrays, **mesh_options)
+
+        if metadata['matrixFormat'] == 'matrixFree':
+            conductances = [np.array(arrays[f'A_conductance{axis}']) for axis in range(len(metadata['divisions']))]
+            self.mesh.A = StencilOperator(metadata['divisions'], np.array(arrays['A_diagonal']), conductances)
+        else:
+            self.mesh.A = sp.csr_matrix(
+                (np.array(arrays['A_data']), np.array(arrays['A_indices']), np.array(arrays['A_indptr'])),
+                shape=tuple(metadata['matrixShape'])
+            ).asformat(metadata['matrixFormat'])
+        self.mesh.b = np.array(arrays['b'])
+
+        if 'solution' in arrays:
+            self.solution = (np.array(arrays['solution']), metadata.get('err'), metadata.get('info'))
+        self.step = metadata['step']
+        self.time = metadata['time']
+        print(f"Restored checkpoint {path} at step {self.step}, time {self.time}.")
+
+        matrix_format = self.config['simulation'].get('solver', {}).get('matrixFormat', 'csr')
+        stored_key = metadata.get('solver', {}).get('operatorKey')
+        return metadata['matrixFormat'] == matrix_format and stored_key == sol.operatorKey(self.mesh.A)
+
+    def advance(self):
+        """
+        Move on to the next step and advance the time by the 'timeStep' of the 'timeControl' config, which
+        defaults to 1 so that the outputs of successive steps of a steady-state run stay ordered.
+        """
+        self.step += 1
+        self.time += float(self.config['simulation'].get('timeControl', {}).get('timeStep', 1.0))
+
+    def simulate(self, restart=None):
+        """
+        Run the simulation for the 'numberOfSteps' of the 'timeControl' config, one step by default.
+
+        The output writer stays open for the whole run, so with asynchronous output a step is written in the
+        background while the next one is solved; it is closed once at the end.
+
+        Args:
+            restart (str, optional): Checkpoint to restart from, or 'latest'. The mesh and assembled system
+                are restored from the checkpoint instead of being generated and discretized again, unless the
+                configured 'matrixFormat' changed since. The run continues at the step after the checkpoint,
+                so it never overwrites the checkpoint it reads.
+        """
+        if restart is not None:
+            operator_applies = self.restoreCheckpoint(restart)
+            self.advance()
+            if not operator_applies:
+                print("The checkpointed operator does not match the solver configuration; discretizing again.")
+                self.applyBoundaryConditions()
+                self.loadMaterialProperty()
+                self.discretize()
+        else:
+            self.meshGeneration()
+            self.applyBoundaryConditions()
+            self.loadMaterialProperty()
+            self.discretize()
+
+        numberOfSteps = int(self.config['simulation'].get('timeControl', {}).get('numberOfSteps', 1))
+        try:
+            for _ in range(numberOfSteps):
+                self.solveEquations()
+                self.writeCheckpoint()
+                self.visualizeResults()
+                self.advance()
+        finally:
+            self.closeOutput()
         print("Simulation complete.")
 
 
@@ -196,7 +468,7 @@ class FVM3D(FVM):
             tuple(domain['size']['z'])
         )
         divisions = (domain['divisions']['x'], domain['divisions']['y'], domain['divisions']['z'])
-        self.mesh = StructuredMesh(bounds, divisions)
+        self.mesh = self._buildMesh(bounds, divisions)
         print("3D Mesh initialized.")
 
     def _apply_nodal_bc(self, nodalSolution: np.ndarray):
@@ -209,43 +481,19 @@ class FVM3D(FVM):
                     .get('parameters', {})\
                     .get('tolerance', 1e-6)
 
-        n_pts = self.mesh.GetNumberOfPoints()
-        pts   = self.mesh.GetPoints()
-
         for axis, axis_cfg in bc_conf.items():
-            if axis == 'parameters':
+            if axis not in ('x', 'y', 'z'):
                 continue
 
             for coord_key, bc_list in axis_cfg.items():
                 # coord_key is the physical location (e.g. 0.0 or 1.0)
-                coord = float(coord_key)
-
-                # gather all pids on this plane
-                if axis == 'x':
-                    match_pids = [
-                        pid for pid in range(n_pts)
-                        if abs(pts.GetPoint(pid)[0] - coord) <= tol
-                    ]
-                elif axis == 'y':
-                    match_pids = [
-                        pid for pid in range(n_pts)
-                        if abs(pts.GetPoint(pid)[1] - coord) <= tol
-                    ]
-                elif axis == 'z':
-                    match_pids = [
-                        pid for pid in range(n_pts)
-                        if abs(pts.GetPoint(pid)[2] - coord) <= tol
-                    ]
-                else:
-                    continue
+                on_plane = self.mesh.getPointMaskOnPlane(axis, float(coord_key), tol)
 
                 # apply all BCs on that plane
                 for bc in (bc_list if isinstance(bc_list, list) else [bc_list]):
                     if bc.get('type') != 'temperature':
                         continue
-                    T = float(bc['value'])
-                    for pid in match_pids:
-                        nodalSolution[pid] = T
+                    nodalSolution[on_plane] = float(bc['value'])
 
 class FVM1D(FVM):
     @timing_decorator
@@ -253,16 +501,25 @@ class FVM1D(FVM):
         domain = self.config['simulation']['domain']
         bounds = tuple(domain['size']['x'])
         divisions = (domain['divisions']['x'])
-        self.mesh = StructuredMesh1D(bounds, divisions, faceArea=domain.get('area', 1.0))
+        self.mesh = self._buildMesh(bounds, divisions, faceArea=domain.get('area', 1.0))
         print("1D Mesh initialized.")
 
+    def _selectSolverMethod(self, solver_config):
+        """
+        1D problems are tridiagonal, so they use the banded direct solver instead of the configured 'method'
+        unless 'banded: false' is set.
+        """
+        if solver_config.get('banded', True):
+            return "banded"
+        return solver_config.get('method')
+
     @timing_decorator
     def visualizeResults(self):
         if not self.solver or self.solver.solution is None:
             raise ValueError("Solution must exist before visualization.")
             
         # Initialize MeshWriter with the mesh
-        self.visualization = MeshWriter1D(self.mesh)
+        writer = self._outputWriter()
 
         # Read variable name from YAML or default to 'temperature_cell'
         variable_name = self.config['simulation'].get('visualization', {}).get('variableName', 'temperature_cell')
@@ -277,7 +534,7 @@ class FVM1D(FVM):
         output_path = self.config['simulation'].get('visualization', {}).get('path', './')
         
         # Write the VTS file
-        self.visualization.writeVTS(output_path, variables)
+        writer.writeVTS(output_path, variables, time=self.time, step=self.step)
         print(f"Visualization generated and saved at {output_path} with variable '{variable_name}'.")
 
     def _apply_nodal_bc(self, nodalSolution: np.ndarray):
@@ -290,21 +547,12 @@ class FVM1D(FVM):
                     .get('parameters', {})\
                     .get('tolerance', 1e-6)
 
-        n_pts = self.mesh.GetDimensions()  # returns int
-        pts   = self.mesh.GetPoints()
-
         # pick any axis key (only 'x' makes sense in 1D)
         axis_cfg = bc_conf.get('x', {})
         for coord_key, bc_list in axis_cfg.items():
-            coord = float(coord_key)
-            match_pids = [
-                pid for pid in range(n_pts)
-                if abs(pts.GetPoint(pid)[0] - coord) <= tol
-            ]
+            on_plane = self.mesh.getPointMaskOnPlane('x', float(coord_key), tol)
 
             for bc in (bc_list if isinstance(bc_list, list) else [bc_list]):
                 if bc.get('type') != 'temperature':
                     continue
-                T = float(bc['value'])
-                for pid in match_pids:
-                    nodalSolution[pid] = T
\ No newline at end of file
+                nodalSolution[on_plane] = float(bc['value'])
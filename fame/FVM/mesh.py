@@ -2,11 +2,108 @@ import vtk
 import numpy as np
 import scipy.sparse as sp
 
+from collections.abc import Mapping, Sequence
 from scipy.spatial import ConvexHull
+from scipy.interpolate import RegularGridInterpolator
+from vtkmodules.util import numpy_support
 from tqdm import tqdm
 
 
+class FaceTableView(Mapping):
+    """
+    Read-only, dictionary-like view over a row-wise face array, keyed by face ID.
+    Rows are returned as tuples so that existing code indexing ``faces`` and ``faceCenters`` keeps working.
+    """
+    def __init__(self, array):
+        self.array = array
+
+    def __getitem__(self, face_id):
+        if not isinstance(face_id, (int, np.integer)) or not 0 <= face_id < len(self.array):
+            raise KeyError(face_id)
+        return tuple(self.array[face_id].tolist())
+
+    def __iter__(self):
+        return iter(range(len(self.array)))
+
+    def __len__(self):
+        return len(self.array)
+
+
+class CellTableView(Sequence):
+    """
+    Read-only, list-like view over a row-wise cell array, indexed by cell ID.
+    Rows are returned as tuples so that existing code indexing ``cellCenters`` keeps working.
+    """
+    def __init__(self, array):
+        self.array = array
+
+    def __getitem__(self, cell_id):
+        if not -len(self.array) <= cell_id < len(self.array):
+            raise IndexError(cell_id)
+        return tuple(self.array[cell_id].tolist())
+
+    def __len__(self):
+        return len(self.array)
+
+
+class SparsityPattern:
+    """
+    CSR sparsity pattern of the cell-to-cell operator of a mesh, together with the nonzero slot that every
+    assembly entry accumulates into. Entries are expected in the order
+    (owner, neighbour), (neighbour, owner), (owner, owner), (neighbour, neighbour) for the interior faces,
+    (owner, owner) for the boundary faces and (cell, cell) for every cell.
+    """
+    def __init__(self, mesh):
+        numCells = mesh.numCells
+        cells = np.arange(numCells)
+        owner = mesh.faceOwner[mesh.interiorFaces]
+        neighbour = mesh.faceNeighbour[mesh.interiorFaces]
+        boundaryOwner = mesh.faceOwner[mesh.boundaryFaces]
+
+        rows = np.concatenate([owner, neighbour, owner, neighbour, boundaryOwner, cells]).astype(np.int64)
+        cols = np.concatenate([neighbour, owner, owner, neighbour, boundaryOwner, cells]).astype(np.int64)
+
+        keys, self.slots = np.unique(rows * numCells + cols, return_inverse=True)
+        self.shape = (numCells, numCells)
+        self.nnz = len(keys)
+        self.indices = (keys % numCells).astype(np.int32)
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(keys // numCells, minlength=numCells))]).astype(np.int32)
+        self.diagonalSlots = self.slots[-numCells:]
+        self.matrix = None
+
+    def assemble(self, values):
+        """
+        Accumulate assembly entries into their nonzero slots and return the CSR matrix on this pattern.
+        The matrix is created on the first call; later calls only overwrite its data array in place.
+
+        Args:
+            values (np.ndarray): Entry values in the order documented on the class.
+
+        Returns:
+            scipy.sparse.csr_matrix: The assembled matrix.
+        """
+        data = np.bincount(self.slots, weights=values, minlength=self.nnz)
+
+        if self.matrix is None or self.matrix.nnz != self.nnz:
+            self.matrix = sp.csr_matrix((data, self.indices.copy(), self.indptr.copy()), shape=self.shape)
+        else:
+            self.matrix.data[:] = data
+        return self.matrix
+
+
 class StructuredMesh:
+    """
+    Structured finite volume mesh. The point coordinates, connectivity and geometry are NumPy arrays; the VTK
+    points and cells of the underlying dataset are only built on first use, see ensureVTKDataset(), so runs
+    that never write VTK output never pay for them.
+    """
+    # NumPy arrays that fully describe the connectivity and geometry of a mesh, see getArrays()
+    ARRAY_NAMES = (
+        'pointCoordinates', 'cellFaces', 'cellNeighbors', 'faceOwner', 'faceNeighbour', 'faceOrientation',
+        'interiorFaces', 'boundaryFaces', 'faceConnectivity', 'faceCentroids', 'faceAxis', 'cellCentroids',
+        'faceAreas', 'faceNormals', 'faceDistances', 'cellVolumes'
+    )
+
     def __new__(cls, bounds, divisions, **kwargs):
         """
         Dynamically instantiate the correct subclass based on the dimensionality.
@@ -16,155 +113,467 @@ class StructuredMesh:
         else:
             return vtk.vtkStructuredGrid.__new__(StructuredMesh3D)    
     
-    def __init__(self, bounds, divisions):
+    def __init__(self, bounds, divisions, arrays=None):
         """
         Initializes the StructuredMesh.
         
         Args:
             bounds (tuple): Bounds of the grid as ((x_min, x_max), (y_min, y_max), (z_min, z_max)).
             divisions (tuple): Number of divisions along x, y, z as (div_x, div_y, div_z).
+            arrays (dict, optional): Mesh arrays from getArrays(). When given, the grid is rebuilt from the
+                stored point coordinates and the connectivity and geometry are restored instead of recomputed.
         """
         super().__init__()
         
-        self.sharedCells = []
-        self.cellCenters = []
-        self.faces = {}
-        self.faceCenters = {}
+        self._sharedCells = None
+        self._sparsityPattern = None
+        self._cellToPointMatrix = None
+        self._pointCoordinates = None
+        self._vtkDatasetBuilt = False
+        self._planeMasks = {}
         self.divisions = divisions
+        self.numCells = int(np.prod(divisions))
         # self.is_1D = len(divisions) == 1
 
 
         # Create vtkStructuredGrid or vtkPolyData depending on 1D or 3D mesh
         # self.mesh = vtk.vtkPolyData() if self.is_1D else vtk.vtkStructuredGrid()
 
-        # Generate grid points
-        self._generateGrid(bounds, divisions)
-        self._computeCellFaces()
-        self._computeCellCenter()
-        self._computeNeighbors()
-        
-        self.numCells = self.GetNumberOfCells()
+        if arrays is not None:
+            self._restoreArrays(arrays)
+        else:
+            # Generate grid points
+            self._setPointCoordinates(self._generatePointCoordinates(bounds, divisions))
+            self._computeCellFaces()
+            self._computeCellCenter()
+            self._computeNeighbors()
+            self._computeGeometry()
 
         self.A = sp.lil_matrix((self.numCells, self.numCells))  # Use LIL format for construction
         self.b = np.zeros(self.numCells)
 
+    @property
+    def faces(self):
+        """
+        Face point IDs keyed by face ID, as a read-only view over ``faceConnectivity``.
+        """
+        return FaceTableView(self.faceConnectivity)
+
+    @property
+    def faceCenters(self):
+        """
+        Face center coordinates keyed by face ID, as a read-only view over ``faceCentroids``.
+        """
+        return FaceTableView(self.faceCentroids)
+
+    @property
+    def cellCenters(self):
+        """
+        Cell center coordinates indexed by cell ID, as a read-only view over ``cellCentroids``.
+        """
+        return CellTableView(self.cellCentroids)
+
+    @property
+    def sharedCells(self):
+        """
+        Per-cell connectivity as a list of dictionaries with the keys 'cell_id', 'shared_cells',
+        'shared_faces' and 'boundary_faces'. Derived lazily from ``cellNeighbors`` and ``cellFaces``.
+        """
+        if self._sharedCells is None:
+            self._sharedCells = self._buildSharedCells()
+        return self._sharedCells
+
+    @property
+    def pointCoordinates(self):
+        """
+        Mesh point coordinates as a read-only (nPoints, 3) float64 array, indexed by point ID.
+        """
+        return self._pointCoordinates
+
+    @property
+    def points(self):
+        """
+        The vtkPoints of the mesh, built on first access.
+        """
+        return self.GetPoints()
+
+    def _setPointCoordinates(self, coordinates):
+        """
+        Stores the canonical point coordinates and derives the grid origin and spacing from them.
+        """
+        coordinates = np.array(coordinates, dtype=np.float64)
+        coordinates.flags.writeable = False
+        self._pointCoordinates = coordinates
+
+        ndim = len(self.divisions)
+        self.origin = coordinates[0, :ndim].copy()
+        self.spacing = (coordinates[-1, :ndim] - self.origin) / np.asarray(self.divisions, dtype=np.float64)
+
+    def ensureVTKDataset(self):
+        """
+        Build the VTK points and cells of the mesh from the point coordinates, if not done yet. Called by the
+        mesh writers and by the VTK getters that need the dataset.
+
+        Returns:
+            StructuredMesh: The mesh itself, ready to be passed to VTK filters and writers.
+        """
+        if not self._vtkDatasetBuilt:
+            self._setGridPoints(self.pointCoordinates)
+            self._vtkDatasetBuilt = True
+        return self
+
+    def GetNumberOfCells(self):
+        return self.numCells
+
+    def GetNumberOfPoints(self):
+        return len(self.pointCoordinates)
+
+    def GetPoint(self, point_id):
+        return tuple(self.pointCoordinates[point_id].tolist())
+
+    def GetBounds(self):
+        lower, upper = self.pointCoordinates.min(axis=0), self.pointCoordinates.max(axis=0)
+        return tuple(float(v) for pair in zip(lower, upper) for v in pair)
+
+    def GetPoints(self):
+        self.ensureVTKDataset()
+        return super().GetPoints()
+
+    def GetCell(self, *args):
+        self.ensureVTKDataset()
+        return super().GetCell(*args)
+
+    def getPointMaskOnPlane(self, axis, coordinate, tolerance=1e-6):
+        """
+        Retrieve a boolean mask of the points lying on an axis-aligned plane. Masks are cached per plane.
+
+        Args:
+            axis (str or int): 'x', 'y', 'z' or the axis index.
+            coordinate (float): Coordinate of the plane along the axis.
+            tolerance (float): Tolerance to identify points on the plane.
+
+        Returns:
+            np.ndarray: Read-only boolean mask of length nPoints.
+        """
+        axis = 'xyz'.index(axis) if isinstance(axis, str) else int(axis)
+        key = (axis, float(coordinate), float(tolerance))
+        if key not in self._planeMasks:
+            mask = np.abs(self.pointCoordinates[:, axis] - key[1]) <= key[2]
+            mask.flags.writeable = False
+            self._planeMasks[key] = mask
+        return self._planeMasks[key]
+
+    def interpolateCellValues(self, values, points):
+        """
+        Evaluate a cell-centered field at arbitrary points by multilinear interpolation between the cell
+        centers, e.g. to transfer a coarse-mesh solution onto a finer mesh. Beyond the outermost cell centers
+        the field is held constant.
+
+        Args:
+            values (np.ndarray): One value per cell.
+            points (np.ndarray): (nPoints, 3) coordinates to evaluate at.
+
+        Returns:
+            np.ndarray: Interpolated values of shape (nPoints,).
+        """
+        gridShape = tuple(int(n) for n in self.divisions)
+        field = np.asarray(values, dtype=np.float64).reshape(gridShape, order='F')
+        points = np.asarray(points, dtype=np.float64)
+
+        # Axes with a single cell carry no variation and are dropped before interpolating
+        active = [axis for axis, n in enumerate(gridShape) if n > 1]
+        field = field.reshape([gridShape[axis] for axis in active])
+        if not active:
+            return np.full(len(points), float(field))
+
+        centers = [self.origin[axis] + (np.arange(gridShape[axis]) + 0.5) * self.spacing[axis] for axis in active]
+        clipped = np.column_stack([
+            np.clip(points[:, axis], center[0], center[-1]) for axis, center in zip(active, centers)
+        ])
+        return RegularGridInterpolator(centers, field)(clipped)
+
+    def getArrays(self):
+        """
+        Retrieve the NumPy arrays describing the mesh connectivity and geometry, e.g. for checkpoints.
+
+        Returns:
+            dict: Arrays keyed by the names in ``ARRAY_NAMES``.
+        """
+        return {name: getattr(self, name) for name in self.ARRAY_NAMES}
+
+    def _restoreArrays(self, arrays):
+        """
+        Restores the mesh from the arrays of getArrays(). The VTK points and cells are rebuilt on demand.
+        """
+        missing = set(self.ARRAY_NAMES) - set(arrays)
+        if missing:
+            raise ValueError(f"Missing mesh arrays: {', '.join(sorted(missing))}.")
+        for name in self.ARRAY_NAMES[1:]:
+            setattr(self, name, arrays[name])
+        self._setPointCoordinates(arrays['pointCoordinates'])
+
+    def getSparsityPattern(self):
+        """
+        Retrieve the CSR sparsity pattern of the cell-to-cell operator. It depends only on the mesh
+        connectivity, so it is computed once and cached.
+
+        Returns:
+            SparsityPattern: The cached sparsity pattern.
+        """
+        if self._sparsityPattern is None:
+            self._sparsityPattern = SparsityPattern(self)
+        return self._sparsityPattern
+
+    def getCellToPointMatrix(self):
+        """
+        Retrieve the sparse (nPoints, nCells) operator averaging cell values onto the mesh points. Every point
+        takes the mean of its adjacent cells, with the 1 / count weights folded into the matrix, so nodal
+        interpolation is a single matvec. It depends only on the mesh connectivity, so it is computed once
+        and cached.
+
+        Returns:
+            sp.csr_matrix: The cached averaging operator.
+        """
+        if self._cellToPointMatrix is None:
+            cellPoints = self._computeCellPoints()
+            numCells, pointsPerCell = cellPoints.shape
+            rows = cellPoints.ravel()
+            cols = np.repeat(np.arange(numCells), pointsPerCell)
+            counts = np.bincount(rows, minlength=self.GetNumberOfPoints())
+            self._cellToPointMatrix = sp.csr_matrix(
+                (1.0 / counts[rows], (rows, cols)), shape=(len(counts), numCells)
+            )
+        return self._cellToPointMatrix
+
+    def _buildSharedCells(self):
+        """
+        Builds the dict-of-lists connectivity view from the neighbour and face arrays.
+        Shared cells and shared faces are listed in the same order.
+        """
+        sharedCells = []
+        for cell_id, (neighbors, faces) in enumerate(zip(self.cellNeighbors.tolist(), self.cellFaces.tolist())):
+            sharedCells.append({
+                "cell_id": cell_id,
+                "shared_cells": [n for n in neighbors if n >= 0],
+                "shared_faces": [f for n, f in zip(neighbors, faces) if n >= 0],
+                "boundary_faces": [f for n, f in zip(neighbors, faces) if n < 0]
+            })
+        return sharedCells
+
+    def _computeFaceOwnership(self):
+        """
+        Computes face-owner and face-neighbour arrays from ``cellFaces`` and ``cellNeighbors``.
+
+        The columns of ``cellFaces`` come in (minus, plus) pairs per axis. A cell always owns its plus face;
+        it owns its minus face only when that face is on the boundary, otherwise it is the face neighbour.
+        Boundary faces have a neighbour of -1. ``faceOrientation`` is +1 when the face normal pointing out of
+        the owner is along the positive axis direction and -1 otherwise.
+        """
+        num_faces = len(self.faceConnectivity)
+        cell_ids = np.arange(self.cellFaces.shape[0], dtype=np.int32)
+
+        self.faceOwner = np.full(num_faces, -1, dtype=np.int32)
+        self.faceNeighbour = np.full(num_faces, -1, dtype=np.int32)
+        self.faceOrientation = np.ones(num_faces, dtype=np.int8)
+
+        for minus in range(0, self.cellFaces.shape[1], 2):
+            plus = minus + 1
+            self.faceOwner[self.cellFaces[:, plus]] = cell_ids
+
+            interior = self.cellNeighbors[:, minus] >= 0
+            self.faceNeighbour[self.cellFaces[interior, minus]] = cell_ids[interior]
+            self.faceOwner[self.cellFaces[~interior, minus]] = cell_ids[~interior]
+            self.faceOrientation[self.cellFaces[~interior, minus]] = -1
+
+        self.interiorFaces = np.flatnonzero(self.faceNeighbour >= 0)
+        self.boundaryFaces = np.flatnonzero(self.faceNeighbour < 0)
+
+    def _computeFaceDistances(self):
+        """
+        Computes ``faceDistances``: the owner-to-neighbour cell center distance for interior faces and the
+        owner-center-to-face-center distance for boundary faces.
+        """
+        other_centers = self.faceCentroids.copy()
+        other_centers[self.interiorFaces] = self.cellCentroids[self.faceNeighbour[self.interiorFaces]]
+        self.faceDistances = np.linalg.norm(other_centers - self.cellCentroids[self.faceOwner], axis=1)
+
+    def getCellVolume(self, cell_id):
+        """
+        Retrieve the precomputed volume of a cell.
+
+        Args:
+            cell_id (int): ID of the cell.
+
+        Returns:
+            float: Volume of the cell.
+
+        Raises:
+            ValueError: If the cell ID is out of range.
+        """
+        if cell_id < 0 or cell_id >= self.numCells:
+            raise ValueError(f"Cell ID {cell_id} is out of range.")
+
+        return float(self.cellVolumes[cell_id])
+
+    def getCellIdByFaceId(self, face_id):
+        """
+        Retrieve the cell ID that owns a specific face ID.
+
+        Args:
+            face_id (int): ID of the face to search for.
+
+        Returns:
+            int: The cell ID that owns the specified face.
+        
+        Raises:
+            ValueError: If the face ID does not belong to any cell.
+        """
+        if 0 <= face_id < len(self.faceOwner):
+            return int(self.faceOwner[face_id])
+
+        raise ValueError(f"Face ID {face_id} does not belong to any cell.")
+
 
 
 class StructuredMesh3D(StructuredMesh, vtk.vtkStructuredGrid):
     
-    def __init__(self, bounds, divisions):
+    def __init__(self, bounds, divisions, arrays=None):
         vtk.vtkStructuredGrid.__init__(self)
-        super().__init__(bounds, divisions)
+        super().__init__(bounds, divisions, arrays=arrays)
 
-    def GetNumberOfCells(self):
-        return super().GetNumberOfCells()
-    
-    def _generateGrid(self, bounds, divisions):
+    def GetDimensions(self):
+        return tuple(int(n) + 1 for n in self.divisions)
+
+    def _generatePointCoordinates(self, bounds, divisions):
+        """
+        Generates the (nPoints, 3) grid point coordinates, ordered with x varying fastest, then y, then z.
+        """
+        x, y, z = (
+            lower + np.arange(n + 1) * ((upper - lower) / n) for (lower, upper), n in zip(bounds, divisions)
+        )
+        z, y, x = np.meshgrid(z, y, x, indexing='ij')
+        return np.stack([x.ravel(), y.ravel(), z.ravel()], axis=1)
+
+    def _setGridPoints(self, coordinates):
         """
-        Generates the structured grid points and sets dimensions.
+        Sets the grid dimensions and points from an (nPoints, 3) coordinate array ordered with x fastest.
         """
-        # Create points
+        nx, ny, nz = self.divisions
         points = vtk.vtkPoints()
-        
-        (x_min, x_max), (y_min, y_max), (z_min, z_max) = bounds
-        div_x, div_y, div_z = divisions
-
-        dx = (x_max - x_min) / div_x
-        dy = (y_max - y_min) / div_y
-        dz = (z_max - z_min) / div_z
-
-        nx = div_x + 1
-        ny = div_y + 1
-        nz = div_z + 1
-
-        for k in range(nz):
-            for j in range(ny):
-                for i in range(nx):
-                    x = x_min + i * dx
-                    y = y_min + j * dy
-                    z = z_min + k * dz
-                    points.InsertNextPoint(x, y, z)
-
-        self.SetDimensions(nx, ny, nz)
+        points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(coordinates), deep=True))
+        self.SetDimensions(nx + 1, ny + 1, nz + 1)
         self.SetPoints(points)
 
     def _computeCellCenter(self):
         """
-        Computes the centers of all cells using vtkCellCenters.
+        Computes the centers of all cells as the mean of their eight corner points.
         """
-        cell_centers_filter = vtk.vtkCellCenters()
-        cell_centers_filter.SetInputData(self)
-        cell_centers_filter.Update()
+        nx, ny, nz = self.divisions
+        corners = self.pointCoordinates.reshape(nz + 1, ny + 1, nx + 1, 3)
 
-        cell_centers_output = cell_centers_filter.GetOutput()
-        self.cellCenters = [
-            cell_centers_output.GetPoint(i)
-            for i in range(cell_centers_output.GetNumberOfPoints())
-        ]
+        centers = np.zeros((nz, ny, nx, 3))
+        for dk in (0, 1):
+            for dj in (0, 1):
+                for di in (0, 1):
+                    centers += corners[dk:dk + nz, dj:dj + ny, di:di + nx]
+
+        self.cellCentroids = (centers / 8.0).reshape(-1, 3)
+
+    def _computeCellPoints(self):
+        """
+        Computes the (nCells, 8) corner point IDs of every cell in closed form from the (i, j, k) cell indices.
+        """
+        nx, ny, nz = self.divisions
+        i, j, k = np.meshgrid(np.arange(nx), np.arange(ny), np.arange(nz), indexing='ij')
+        i, j, k = (a.ravel(order='F') for a in (i, j, k))
+        return np.stack([
+            (i + di) + (nx + 1) * ((j + dj) + (ny + 1) * (k + dk))
+            for dk in (0, 1) for dj in (0, 1) for di in (0, 1)
+        ], axis=1)
 
     def _computeNeighbors(self):
         """
-        Computes shared cell information for all cells.
+        Computes cell connectivity in closed form from the (i, j, k) cell indices.
+
+        ``cellNeighbors`` and ``cellFaces`` hold, per cell, the neighbouring cell ID and the face ID in the
+        order (-x, +x, -y, +y, -z, +z). Missing neighbours on the domain boundary are marked with -1.
         """
-        self.sharedCells = []
-        for cell_id in range(self.GetNumberOfCells()):
-            currentCell = self.GetCell(cell_id)
-            points = currentCell.GetPoints()
+        nx, ny, nz = self.divisions
+        num_x_faces = (nx + 1) * ny * nz
+        num_y_faces = nx * (ny + 1) * nz
 
-            vertices = {tuple(points.GetPoint(i)) for i in range(points.GetNumberOfPoints())}
-            shared_cells = []
-            shared_faces = set()
+        k, j, i = np.indices((nz, ny, nx)).reshape(3, -1)
+        cell_ids = i + nx * (j + ny * k)
 
-            for other_cell_id in range(self.GetNumberOfCells()):
-                if other_cell_id == cell_id:
-                    continue
+        x_face = lambda i, j, k: i + (nx + 1) * (j + ny * k)
+        y_face = lambda i, j, k: num_x_faces + i + nx * (j + (ny + 1) * k)
+        z_face = lambda i, j, k: num_x_faces + num_y_faces + i + nx * (j + ny * k)
 
-                other_cell = self.GetCell(other_cell_id)
-                other_points = other_cell.GetPoints()
-                other_vertices = {tuple(other_points.GetPoint(i)) for i in range(other_points.GetNumberOfPoints())}
-                
-                shared_points = vertices.intersection(other_vertices)
+        self.cellFaces = np.stack([
+            x_face(i, j, k), x_face(i + 1, j, k),
+            y_face(i, j, k), y_face(i, j + 1, k),
+            z_face(i, j, k), z_face(i, j, k + 1)
+        ], axis=1).astype(np.int32)
 
-                if len(shared_points) > 2:
-                    shared_cells.append(other_cell_id)
-                    shared_faces.update(face_id for face_id, face_points in self.faces.items()
-                                        if set(self.GetPoint(pt) for pt in face_points) == shared_points)
+        self.cellNeighbors = np.stack([
+            np.where(i > 0, cell_ids - 1, -1), np.where(i < nx - 1, cell_ids + 1, -1),
+            np.where(j > 0, cell_ids - nx, -1), np.where(j < ny - 1, cell_ids + nx, -1),
+            np.where(k > 0, cell_ids - nx * ny, -1), np.where(k < nz - 1, cell_ids + nx * ny, -1)
+        ], axis=1).astype(np.int32)
 
-            # Identify boundary faces by subtracting shared faces from all faces of the cell
-            all_faces = {
-                face_id for face_id, face_points in self.faces.items()
-                if set(self.GetPoint(pt) for pt in face_points).issubset(vertices)
-            }
-            boundary_faces = all_faces - shared_faces
+        self._computeFaceOwnership()
 
-            self.sharedCells.append({
-                "cell_id": cell_id,
-                "shared_cells": shared_cells,
-                "shared_faces": list(shared_faces),
-                "boundary_faces": list(boundary_faces)
-            })
+    def _computeGeometry(self):
+        """
+        Computes face areas, unit normals, face distances and cell volumes in batch.
+
+        Face normals point out of the owner cell. Cell volumes follow from the Gauss divergence theorem,
+        V = 1/3 * sum_f (x_f . n_f) A_f, summed over the faces of each cell with outward normals.
+        """
+        face_points = self.pointCoordinates[self.faceConnectivity]
+        area_vectors = 0.5 * np.cross(face_points[:, 2] - face_points[:, 0], face_points[:, 3] - face_points[:, 1])
+
+        self.faceAreas = np.linalg.norm(area_vectors, axis=1)
+        self.faceNormals = area_vectors / self.faceAreas[:, np.newaxis]
+
+        owner_offset = self.faceCentroids - self.cellCentroids[self.faceOwner]
+        self.faceNormals[np.einsum('ij,ij->i', self.faceNormals, owner_offset) < 0] *= -1
+
+        self._computeFaceDistances()
+
+        num_cells = len(self.cellCentroids)
+        flux = np.einsum('ij,ij->i', self.faceCentroids, self.faceNormals) * self.faceAreas
+        interior = self.interiorFaces
+        self.cellVolumes = (
+            np.bincount(self.faceOwner, weights=flux, minlength=num_cells)
+            - np.bincount(self.faceNeighbour[interior], weights=flux[interior], minlength=num_cells)
+        ) / 3.0
 
     def _computeCellFaces(self):
-        face_set = set()
-        face_id = 0
+        """
+        Enumerates the faces of the structured grid in closed form from the (i, j, k) point indices.
+
+        Faces are numbered in three blocks: x-normal, y-normal and z-normal faces, each ordered with i
+        varying fastest, then j, then k. ``faceConnectivity`` stores the four face points in cyclic order,
+        ``faceCentroids`` the face centers and ``faceAxis`` the axis (0, 1, 2) normal to each face.
+        """
+        nx, ny, nz = self.divisions
+        point_id = lambda i, j, k: i + (nx + 1) * (j + (ny + 1) * k)
+
+        k, j, i = np.indices((nz, ny, nx + 1)).reshape(3, -1)
+        x_faces = np.stack([point_id(i, j, k), point_id(i, j + 1, k), point_id(i, j + 1, k + 1), point_id(i, j, k + 1)], axis=1)
 
-        cell_iter = self.NewCellIterator()
+        k, j, i = np.indices((nz, ny + 1, nx)).reshape(3, -1)
+        y_faces = np.stack([point_id(i, j, k), point_id(i + 1, j, k), point_id(i + 1, j, k + 1), point_id(i, j, k + 1)], axis=1)
 
-        while not cell_iter.IsDoneWithTraversal():
-            cell = vtk.vtkGenericCell()
-            cell_iter.GetCell(cell)
-            faces = self._extractCellFaces(cell, hexahedron=True)
+        k, j, i = np.indices((nz + 1, ny, nx)).reshape(3, -1)
+        z_faces = np.stack([point_id(i, j, k), point_id(i + 1, j, k), point_id(i + 1, j + 1, k), point_id(i, j + 1, k)], axis=1)
 
-            for face in faces:
-                face_tuple = tuple(sorted(face))
-                if face_tuple not in face_set:
-                    face_set.add(face_tuple)
-                    self.faces[face_id] = face_tuple
-                    center = np.mean([self.GetPoint(idx) for idx in face_tuple], axis=0)
-                    self.faceCenters[face_id] = tuple(center)
-                    face_id += 1
+        coordinates = self.pointCoordinates
 
-            cell_iter.GoToNextCell()
+        self.faceConnectivity = np.concatenate([x_faces, y_faces, z_faces]).astype(np.int32)
+        self.faceCentroids = coordinates[self.faceConnectivity].mean(axis=1)
+        self.faceAxis = np.repeat(np.arange(3, dtype=np.int8), [len(x_faces), len(y_faces), len(z_faces)])
 
     def getCellCenter(self, cell_id):
         """
@@ -216,12 +625,10 @@ class StructuredMesh3D(StructuredMesh, vtk.vtkStructuredGrid):
         if not isinstance(center, (tuple, list)) or len(center) != 3:
             raise ValueError("Center must be a tuple or list of length 3.")
         
-        target = np.array(center)
+        distances = np.linalg.norm(self.faceCentroids - np.array(center), axis=1)
+        matching_faces = np.flatnonzero(distances <= tolerance)
 
-        distances = {fid: np.linalg.norm(np.array(self.faceCenters[fid]) - target)
-                    for fid in self.faceCenters}
-
-        return sorted([fid for fid, dist in distances.items() if dist <= tolerance], key=lambda fid: distances[fid])
+        return matching_faces[np.argsort(distances[matching_faces], kind='stable')].tolist()
 
 
     def getFacesByCoordinates(self, x=None, y=None, z=None, tolerance=None):
@@ -247,41 +654,12 @@ class StructuredMesh3D(StructuredMesh, vtk.vtkStructuredGrid):
         if tolerance is None:
             tolerance = 1e-6
 
-        matching_faces = []
-        
-        for fid, center in self.faceCenters.items():
-            match = True
-            if x is not None and not (abs(center[0] - x) <= tolerance):
-                match = False
-            if y is not None and not (abs(center[1] - y) <= tolerance):
-                match = False
-            if z is not None and not (abs(center[2] - z) <= tolerance):
-                match = False
-            
-            if match:
-                matching_faces.append(fid)
-        
-        return matching_faces
-
-    def getCellIdByFaceId(self, face_id):
-        """
-        Retrieve the cell ID that owns a specific face ID.
-
-        Args:
-            face_id (int): ID of the face to search for.
-
-        Returns:
-            int: The cell ID that owns the specified face.
-        
-        Raises:
-            ValueError: If the face ID does not belong to any cell.
-        """
-        for cell in self.sharedCells:
-            if face_id in cell['shared_faces'] or face_id in cell['boundary_faces']:
-                return cell['cell_id']
-        
-        raise ValueError(f"Face ID {face_id} does not belong to any cell.")
+        match = np.ones(len(self.faceCentroids), dtype=bool)
+        for axis, coordinate in enumerate((x, y, z)):
+            if coordinate is not None:
+                match &= np.abs(self.faceCentroids[:, axis] - coordinate) <= tolerance
 
+        return np.flatnonzero(match).tolist()
 
     def listFacesByPoint(self, point_id):
         """
@@ -370,158 +748,105 @@ class StructuredMesh3D(StructuredMesh, vtk.vtkStructuredGrid):
         else:
             return area
 
-    def getCellVolume(self, cell_id):
-        """
-        Calculate the volume of a cell using the Gauss Divergence Theorem.
-
-        Args:
-            cell_id (int): ID of the cell.
-
-        Returns:
-            float: Volume of the cell.
-        """
-        if cell_id < 0 or cell_id >= self.GetNumberOfCells():
-            raise ValueError(f"Cell ID {cell_id} is out of range.")
-        
-        # Retrieve shared and boundary faces for the cell
-        shared_faces_info = self.sharedCells[cell_id]
-        face_ids = shared_faces_info['shared_faces'] + shared_faces_info['boundary_faces']
-        
-        volume = 0.0
-        for face_id in face_ids:
-            face_pts = self.faces[face_id]
-
-            # Calculate face area and normal using existing calculateArea method
-            vtk_points = vtk.vtkPoints()
-            for pt_id in face_pts:
-                vtk_points.InsertNextPoint(self.GetPoint(pt_id))
-            
-            area = self.calculateArea(vtk_points)
-            
-            volume += area
-        
-        volume /= len(face_ids)
-
-        return abs(volume)
-
 
 class StructuredMesh1D(StructuredMesh, vtk.vtkPolyData):
-    def __init__(self, bounds, divisions, faceArea=1.0):
+    def __init__(self, bounds, divisions, faceArea=1.0, arrays=None):
         vtk.vtkPolyData.__init__(self)
-        super().__init__(bounds, divisions)
 
         # Define faceArea as a float variable specific to 1D mesh
         self.faceArea = np.float64(faceArea)
 
-    def GetNumberOfCells(self):
-        return self.GetNumberOfLines()
+        super().__init__(bounds, divisions, arrays=arrays)
 
-    def _generateGrid(self, bounds, divisions):
+    def GetLines(self):
+        self.ensureVTKDataset()
+        return super().GetLines()
+
+    def GetNumberOfLines(self):
+        return self.numCells
+
+    def _generatePointCoordinates(self, bounds, divisions):
         """
-        Generates the structured grid points and sets dimensions.
+        Generates the (nPoints, 3) point coordinates along the x-axis; y and z are 0.
         """
-        # Create points
-        points = vtk.vtkPoints()
-        
-        # 1D mesh: Generate points along a line
-        (x_min, x_max) = bounds
-        div_x = divisions[0]
-        dx = (x_max - x_min) / div_x
+        (x_min, x_max), div_x = bounds, divisions[0]
+        coordinates = np.zeros((div_x + 1, 3))
+        coordinates[:, 0] = x_min + np.arange(div_x + 1) * ((x_max - x_min) / div_x)
+        return coordinates
 
-        for i in range(div_x + 1):
-            x = x_min + i * dx
-            points.InsertNextPoint(x, 0, 0)  # 1D is along x-axis, y/z set to 0
+    def _setGridPoints(self, coordinates):
+        """
+        Sets the points and the line cells between consecutive points from an (nPoints, 3) coordinate array.
+        """
+        points = vtk.vtkPoints()
+        points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(coordinates), deep=True))
 
-        # Create vtkPolyData for 1D mesh
         lines = vtk.vtkCellArray()
-        for i in range(div_x):
-            line = vtk.vtkLine()
-            line.GetPointIds().SetId(0, i)
-            line.GetPointIds().SetId(1, i + 1)
-            lines.InsertNextCell(line)
+        lines.SetData(
+            numpy_support.numpy_to_vtkIdTypeArray(np.arange(0, 2 * len(coordinates) - 1, 2), deep=True),
+            numpy_support.numpy_to_vtkIdTypeArray(self._computeCellPoints().ravel(), deep=True)
+        )
 
         self.SetPoints(points)
         self.SetLines(lines)
-        
-    def _computeCellFaces(self):
-
-        # Directly use point IDs to represent unique faces
-        self.faces = {}  # Reset face storage
-        self.faceCenters = {}
-
-        num_points = self.GetNumberOfPoints()
-
-        for i in range(num_points):
-            # Use the point ID as the face ID
-            point_id = i
-            self.faces[point_id] = (point_id,)
-            self.faceCenters[point_id] = self.GetPoint(point_id)
 
     def _computeCellCenter(self):
         """
-        Computes the centers of all cells using vtkCellCenters.
+        Computes the centers of all cells as the midpoints of their line segments.
         """
-        # For 1D, compute center of each line segment
-        self.cellCenters = []
-        for i in range(self.GetNumberOfCells()):
-            line = self.GetCell(i)
-            p1 = np.array(self.GetPoint(line.GetPointId(0)))
-            p2 = np.array(self.GetPoint(line.GetPointId(1)))
-            center = (p1 + p2) / 2
-            self.cellCenters.append(center)
+        coordinates = self.pointCoordinates
+        self.cellCentroids = 0.5 * (coordinates[:-1] + coordinates[1:])
 
-    def _computeNeighbors(self):
+    def _computeGeometry(self):
         """
-        Computes shared cell information for all cells.
+        Computes face areas, unit normals, face distances and cell volumes in batch.
+        Face normals point out of the owner cell along the x-axis; the face area is the constant cross-section.
         """
-        self.sharedCells = []
-        num_cells = self.GetNumberOfCells()
+        num_faces = len(self.faceConnectivity)
 
-        # Iterate over cells (line segments)
-        for cell_id in range(num_cells):
-            line = self.GetCell(cell_id)
-            p1 = line.GetPointId(0)  # Start point of line segment
-            p2 = line.GetPointId(1)  # End point of line segment
+        self.faceAreas = np.full(num_faces, self.faceArea)
+        self.faceNormals = np.zeros((num_faces, 3))
+        self.faceNormals[:, 0] = self.faceOrientation
 
-            # Shared cells and faces
-            shared_cells = []
-            shared_faces = set()
+        self._computeFaceDistances()
 
-            if cell_id > 0:
-                shared_cells.append(cell_id - 1)  # Left neighbor
-                shared_faces.add(p1)  # Shared face at left endpoint
+        cell_lengths = np.linalg.norm(np.diff(self.pointCoordinates, axis=0), axis=1)
+        self.cellVolumes = cell_lengths * self.faceArea
 
-            if cell_id < num_cells - 1:
-                shared_cells.append(cell_id + 1)  # Right neighbor
-                shared_faces.add(p2)  # Shared face at right endpoint
+    def _computeCellPoints(self):
+        """
+        Computes the (nCells, 2) end point IDs of every line cell.
+        """
+        cell_ids = np.arange(self.divisions[0])
+        return np.stack([cell_ids, cell_ids + 1], axis=1)
 
-            # Boundary faces
-            boundary_faces = set()
-            if cell_id == 0:  # Leftmost cell
-                boundary_faces.add(p1)
-            if cell_id == num_cells - 1:  # Rightmost cell
-                boundary_faces.add(p2)
+    def _computeNeighbors(self):
+        """
+        Computes cell connectivity in closed form from the cell index.
 
-            # Store results
-            self.sharedCells.append({
-                "cell_id": cell_id,
-                "shared_cells": shared_cells,
-                "shared_faces": list(shared_faces),
-                "boundary_faces": list(boundary_faces)
-            })
+        ``cellNeighbors`` and ``cellFaces`` hold, per cell, the neighbouring cell ID and the face ID in the
+        order (-x, +x). Missing neighbours at the domain ends are marked with -1.
+        """
+        num_cells = self.divisions[0]
+        cell_ids = np.arange(num_cells)
 
-    def _computeCellFaces(self):
-        # Directly use point IDs to represent unique faces
-        self.faces = {}  # Reset face storage
-        self.faceCenters = {}
+        self.cellFaces = np.stack([cell_ids, cell_ids + 1], axis=1).astype(np.int32)
+        self.cellNeighbors = np.stack([
+            np.where(cell_ids > 0, cell_ids - 1, -1),
+            np.where(cell_ids < num_cells - 1, cell_ids + 1, -1)
+        ], axis=1).astype(np.int32)
+
+        self._computeFaceOwnership()
 
+    def _computeCellFaces(self):
+        """
+        Uses the point IDs directly as face IDs; every face of a 1D mesh is a single point.
+        """
         num_points = self.GetNumberOfPoints()
 
-        for i in range(num_points):
-            # Use the point ID as the face ID
-            point_id = i
-            self.faces[point_id] = (point_id,)
-            self.faceCenters[point_id] = self.GetPoint(point_id)
+        self.faceConnectivity = np.arange(num_points, dtype=np.int32).reshape(-1, 1)
+        self.faceCentroids = self.pointCoordinates.copy()
+        self.faceAxis = np.zeros(num_points, dtype=np.int8)
 
     def GetDimensions(self):
         """
@@ -533,7 +858,7 @@ class StructuredMesh1D(StructuredMesh, vtk.vtkPolyData):
         Returns:
             tuple: (nx, ny, nz)
         """
-        n = self.GetNumberOfCells() + 1  # Number of points is cells + 1
+        n = self.numCells + 1  # Number of points is cells + 1
         return n
 
     def getSharedCellsInfo(self, cell_id):
@@ -568,12 +893,7 @@ class StructuredMesh1D(StructuredMesh, vtk.vtkPolyData):
         if x is None:
             raise ValueError("x-coordinate must be provided for 1D mesh.")
 
-        matching_faces = []
-        for fid, center in self.faceCenters.items():
-            if abs(center[0] - x) <= tolerance:
-                matching_faces.append(fid)
-        
-        return matching_faces
+        return np.flatnonzero(np.abs(self.faceCentroids[:, 0] - x) <= tolerance).tolist()
         
     def calculateArea(self, vtk_points, includeNormal=False):
         """
@@ -581,32 +901,3 @@ class StructuredMesh1D(StructuredMesh, vtk.vtkPolyData):
         """
 
         return self.faceArea
-    
-    def getCellVolume(self, cell_id):
-        """
-        Calculate the volume of a 1D cell using its length and face area.
-
-        Args:
-            cell_id (int): ID of the cell.
-
-        Returns:
-            float: Volume of the cell.
-        
-        Raises:
-            ValueError: If the cell ID is out of range.
-        """
-        if cell_id < 0 or cell_id >= self.GetNumberOfCells():
-            raise ValueError(f"Cell ID {cell_id} is out of range.")
-        
-        # Get the line segment representing the cell
-        line = self.GetCell(cell_id)
-        p1 = np.array(self.GetPoint(line.GetPointId(0)))
-        p2 = np.array(self.GetPoint(line.GetPointId(1)))
-
-        # Calculate the length of the line segment
-        cell_length = np.linalg.norm(p2 - p1)
-
-        # Calculate volume (length * cross-sectional area)
-        volume = cell_length * self.faceArea
-
-        return volume
\ No newline at end of file
@@ -0,0 +1,135 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import numpy as np
+
+from .mesh import StructuredMesh
+from .checkpoint import Checkpoint, writeArrayDirectory
+
+
+class MeshCache:
+    """
+    On-disk cache of StructuredMesh connectivity and geometry arrays, keyed by a hash of the bounds, divisions
+    and mesh options. Cached arrays are memory-mapped on load, so a hit only rebuilds the VTK points and cells.
+
+    The cache is bounded in size: after storing a mesh, the least recently used entries are evicted until the
+    total size is within ``maxBytes``.
+    """
+    VERSION = 2
+    MIN_AGE = 60.0
+
+    def __init__(self, directory, maxBytes=1e9):
+        """
+        Initialize the mesh cache.
+
+        Args:
+            directory (str): Cache directory.
+            maxBytes (float): Maximum total size of the cached entries in bytes.
+        """
+        self.directory = os.path.expanduser(directory)
+        self.maxBytes = float(maxBytes)
+
+    def key(self, bounds, divisions, **meshOptions):
+        """
+        Hash of the parameters that determine the mesh.
+
+        Args:
+            bounds (tuple): Bounds of the mesh.
+            divisions (tuple): Number of divisions per axis.
+            **meshOptions: Further mesh parameters, e.g. faceArea of a 1D mesh.
+
+        Returns:
+            str: Hexadecimal cache key.
+        """
+        parameters = {
+            'version': self.VERSION,
+            'bounds': np.asarray(bounds, dtype=np.float64).tolist(),
+            'divisions': [int(n) for n in np.atleast_1d(divisions)],
+            'options': {name: float(value) for name, value in sorted(meshOptions.items())}
+        }
+        return hashlib.sha256(json.dumps(parameters, sort_keys=True).encode()).hexdigest()[:32]
+
+    def getMesh(self, bounds, divisions, **meshOptions):
+        """
+        Return the mesh for the given parameters, from the cache if possible, otherwise generated and cached.
+
+        Args:
+            bounds (tuple): Bounds of the mesh.
+            divisions (tuple): Number of divisions per axis.
+            **meshOptions: Further StructuredMesh arguments, e.g. faceArea of a 1D mesh.
+
+        Returns:
+            StructuredMesh: The mesh.
+        """
+        path = os.path.join(self.directory, self.key(bounds, divisions, **meshOptions))
+        try:
+            metadata, arrays = Checkpoint.load(path)
+        except FileNotFoundError:
+            mesh = StructuredMesh(bounds, divisions, **meshOptions)
+            os.makedirs(self.directory, exist_ok=True)
+            published = writeArrayDirectory(
+                path, mesh.getArrays(), {'divisions': [int(n) for n in np.atleast_1d(divisions)]}, replace=False
+            )
+            if published:
+                self._evict(keep=path)
+                return mesh
+            # another process cached the same mesh first: use its copy and drop ours
+            try:
+                metadata, arrays = Checkpoint.load(path)
+            except FileNotFoundError:
+                return mesh
+
+        # mark the entry as recently used; it may have been evicted by another process meanwhile
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return StructuredMesh(bounds, divisions, arrays=arrays, **meshOptions)
+
+    def _entries(self):
+        """
+        Return (last use, size, path) of every complete cache entry.
+        """
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for entry in os.scandir(self.directory):
+            if not entry.is_dir() or entry.name.endswith('.tmp'):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+                entries.append((entry.stat().st_mtime, size, entry.path))
+            except FileNotFoundError:
+                # removed by another process while scanning
+                continue
+        return entries
+
+    def _evict(self, keep=None):
+        """
+        Remove least recently used entries until the cache fits into ``maxBytes``.
+
+        Entries used within the last ``MIN_AGE`` seconds are never removed, since other processes may still be
+        loading them.
+
+        Args:
+            keep (str, optional): Path of an entry that must not be removed, e.g. the one just written.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        cutoff = time.time() - self.MIN_AGE
+        for lastUse, size, path in entries:
+            if total <= self.maxBytes:
+                break
+            if path == keep or lastUse > cutoff:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """
+        Remove every cached mesh.
+        """
+        for _, _, path in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,216 @@
+import numpy as np
+import scipy.sparse as sp
+
+from .stencil import StencilOperator
+
+
+class GeometricMultigrid:
+    """
+    Geometric multigrid V-cycle on the cell-centered structured grid of a StructuredMesh1D or StructuredMesh3D.
+
+    Every level halves the number of cells along each axis that still has more than one cell and whose spacing
+    is less than twice the smallest one. On anisotropic cells this semi-coarsening leaves the weakly coupled
+    axes alone until the spacing has caught up, which keeps the convergence rate independent of the mesh size.
+    Coarse-grid corrections are interpolated linearly between coarse cell centers, the coarse operators are the
+    Galerkin products P^T A P, and the coarsest level is solved with a sparse LU factorization. The cycle is used either
+    as a stationary solver, see solve(), or as a preconditioner for the Krylov methods, see asPreconditioner().
+
+    Cells are numbered with i varying fastest, as on the meshes, so the prolongation is the Kronecker product
+    of the per-axis prolongations in reversed axis order.
+    """
+    SMOOTHERS = ("jacobi", "gaussSeidel")
+
+    def __init__(self, A, gridShape, spacing=None, smoother="jacobi", preSmooth=2, postSmooth=2, omega=0.8,
+                 coarseSize=64, maxLevels=10):
+        """
+        Build the multigrid hierarchy.
+
+        Args:
+            A (sp.spmatrix or StencilOperator): Operator on the finest grid.
+            gridShape (tuple): Number of cells along each axis, (nx,) or (nx, ny, nz).
+            spacing (tuple, optional): Cell size along each axis. If not given, it is estimated from the couplings
+                of neighboring cells in A, which scale with the inverse square of the spacing.
+            smoother (str): "jacobi" for damped Jacobi, or "gaussSeidel" for a forward Gauss-Seidel sweep before
+                and a backward sweep after the coarse-grid correction, which keeps the cycle symmetric.
+            preSmooth (int): Smoothing sweeps before the coarse-grid correction.
+            postSmooth (int): Smoothing sweeps after the coarse-grid correction.
+            omega (float): Damping factor of the Jacobi smoother.
+            coarseSize (int): Stop coarsening once a level has at most this many cells.
+            maxLevels (int): Maximum number of levels, including the finest.
+        """
+        if smoother not in self.SMOOTHERS:
+            raise ValueError(f"Unsupported smoother '{smoother}'. Choose from {', '.join(self.SMOOTHERS)}.")
+
+        A = A.tocsr() if isinstance(A, StencilOperator) else sp.csr_matrix(A)
+        gridShape = tuple(int(n) for n in gridShape)
+        if int(np.prod(gridShape)) != A.shape[0]:
+            raise ValueError(f"Grid shape {gridShape} does not match an operator of size {A.shape[0]}.")
+
+        self.smoother = smoother
+        self.preSmooth = int(preSmooth)
+        self.postSmooth = int(postSmooth)
+        self.omega = float(omega)
+
+        # Per level: operator, grid shape and the prolongation from the next coarser level
+        self.operators = [A]
+        self.gridShapes = [gridShape]
+        self.prolongations = []
+        spacing = self._estimateSpacing(A, gridShape) if spacing is None else np.asarray(spacing, dtype=np.float64)
+        while (len(self.operators) < maxLevels and A.shape[0] > coarseSize and max(gridShape) > 1):
+            coarsen = self._coarsenedAxes(gridShape, spacing)
+            P = self._prolongation(gridShape, coarsen)
+            A = (P.T @ A @ P).tocsr()
+            gridShape = tuple((n + 1) // 2 if c else n for n, c in zip(gridShape, coarsen))
+            spacing = np.where(coarsen, 2.0 * spacing, spacing)
+            self.prolongations.append(P)
+            self.operators.append(A)
+            self.gridShapes.append(gridShape)
+
+        self._diagonals = [A.diagonal() for A in self.operators]
+        self._lower = [sp.tril(A, format='csr') for A in self.operators]
+        self._upper = [sp.triu(A, format='csr') for A in self.operators]
+        self._coarseSolver = sp.linalg.splu(self.operators[-1].tocsc(), permc_spec="COLAMD")
+
+    @classmethod
+    def fromMesh(cls, A, mesh, **options):
+        """
+        Build the multigrid hierarchy on the grid of a structured mesh.
+
+        Args:
+            A (sp.spmatrix or StencilOperator): Operator assembled on the mesh.
+            mesh (StructuredMesh): The mesh.
+            **options: Further arguments of GeometricMultigrid.
+
+        Returns:
+            GeometricMultigrid: The multigrid hierarchy.
+        """
+        return cls(A, mesh.divisions, spacing=mesh.spacing, **options)
+
+    @property
+    def numLevels(self):
+        return len(self.operators)
+
+    @staticmethod
+    def _estimateSpacing(A, gridShape):
+        """
+        Relative cell size along each axis, 1 / sqrt of the mean coupling between neighbors along the axis.
+        """
+        coo = A.tocoo()
+        offsets = coo.col - coo.row
+        spacing = np.ones(len(gridShape))
+        stride = 1
+        for axis, n in enumerate(gridShape):
+            coupling = np.abs(coo.data[offsets == stride]) if n > 1 else np.empty(0)
+            if coupling.size and coupling.mean() > 0:
+                spacing[axis] = 1.0 / np.sqrt(coupling.mean())
+            stride *= n
+        return spacing
+
+    @staticmethod
+    def _coarsenedAxes(gridShape, spacing):
+        """
+        Axes to coarsen: those with more than one cell and a spacing below twice the smallest such spacing.
+        """
+        active = [n > 1 for n in gridShape]
+        smallest = min(h for h, a in zip(spacing, active) if a)
+        return [a and h < 2.0 * smallest for h, a in zip(spacing, active)]
+
+    @staticmethod
+    def _axisProlongation(n):
+        """
+        Linear interpolation from the (n + 1) // 2 coarse cells of an axis onto its n fine cells. Fine cells
+        2I and 2I + 1 form coarse cell I; beyond the outermost coarse centers the correction is held constant.
+        """
+        numCoarse = (n + 1) // 2
+        fine = np.arange(n) + 0.5
+        coarseCenters = np.array([fine[2 * c:2 * c + 2].mean() for c in range(numCoarse)])
+
+        parent = np.arange(n) // 2
+        other = np.clip(np.where(fine < coarseCenters[parent], parent - 1, parent + 1), 0, numCoarse - 1)
+        span = coarseCenters[other] - coarseCenters[parent]
+        weight = np.divide(fine - coarseCenters[parent], span, out=np.zeros(n), where=span != 0)
+
+        rows = np.concatenate([np.arange(n), np.arange(n)])
+        cols = np.concatenate([parent, other])
+        values = np.concatenate([1.0 - weight, weight])
+        return sp.csr_matrix((values, (rows, cols)), shape=(n, numCoarse))
+
+    def _prolongation(self, gridShape, coarsen=None):
+        """
+        Prolongation from the next coarser grid, kron(P_z, P_y, P_x) for the i-fastest cell numbering. Axes
+        that are not coarsened contribute an identity.
+        """
+        coarsen = [True] * len(gridShape) if coarsen is None else coarsen
+        P = sp.identity(1, format='csr')
+        for n, c in zip(gridShape, coarsen):
+            axis = self._axisProlongation(n) if c else sp.identity(n, format='csr')
+            P = sp.kron(axis, P, format='csr')
+        return P
+
+    def _smooth(self, level, x, b, sweeps, backward=False):
+        A = self.operators[level]
+        for _ in range(sweeps):
+            if self.smoother == "jacobi":
+                x = x + self.omega * (b - A @ x) / self._diagonals[level]
+            else:
+                triangle = self._upper[level] if backward else self._lower[level]
+                x = x + sp.linalg.spsolve_triangular(triangle, b - A @ x, lower=not backward)
+        return x
+
+    def vcycle(self, b, x=None, level=0):
+        """
+        Apply one V-cycle to A x = b on a level.
+
+        Args:
+            b (np.ndarray): Right-hand side.
+            x (np.ndarray, optional): Initial guess; zero if not given.
+            level (int): Level index, 0 being the finest.
+
+        Returns:
+            np.ndarray: The improved solution.
+        """
+        if level == self.numLevels - 1:
+            return self._coarseSolver.solve(b)
+
+        x = np.zeros_like(b) if x is None else x
+        x = self._smooth(level, x, b, self.preSmooth)
+        residual = b - self.operators[level] @ x
+        P = self.prolongations[level]
+        x = x + P @ self.vcycle(P.T @ residual, level=level + 1)
+        return self._smooth(level, x, b, self.postSmooth, backward=True)
+
+    def solve(self, b, x0=None, rtol=1e-10, maxiter=100, callback=None):
+        """
+        Solve A x = b with repeated V-cycles.
+
+        Args:
+            b (np.ndarray): Right-hand side.
+            x0 (np.ndarray, optional): Initial guess; zero if not given.
+            rtol (float): Stop once the residual norm is below rtol times the norm of b.
+            maxiter (int): Maximum number of V-cycles.
+            callback (callable, optional): Called with the residual norm after every V-cycle.
+
+        Returns:
+            tuple: (solution, iterations).
+        """
+        b = np.asarray(b, dtype=np.float64)
+        x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=np.float64)
+        target = rtol * np.linalg.norm(b)
+        for iteration in range(1, int(maxiter) + 1):
+            x = self.vcycle(b, x)
+            residual = np.linalg.norm(b - self.operators[0] @ x)
+            if callback is not None:
+                callback(residual)
+            if residual <= target:
+                return x, iteration
+        return x, int(maxiter)
+
+    def asPreconditioner(self):
+        """
+        Wrap one V-cycle from a zero initial guess as a LinearOperator, usable as the M argument of the scipy
+        Krylov solvers.
+
+        Returns:
+            sp.linalg.LinearOperator: Approximate inverse of A.
+        """
+        return sp.linalg.LinearOperator(self.operators[0].shape, matvec=self.vcycle, dtype=np.float64)
@@ -1,24 +1,141 @@
+import time
+import hashlib
 import numpy as np
+import scipy.linalg
 import jax
 import jax.numpy as jnp
 import scipy.sparse as sp
 import matplotlib.pyplot as plt
 
+from collections import OrderedDict
 from petsc4py import PETSc
 from jax.experimental.sparse import BCOO
+from .stencil import StencilOperator
+from .multigrid import GeometricMultigrid
+
+try:
+    import pyamg
+except ImportError:  # pyamg is only needed for the amg preconditioner
+    pyamg = None
+
+
+class _PETScShellContext:
+    """
+    Python context for a PETSc shell matrix that applies a matrix-free operator.
+    """
+    def __init__(self, operator):
+        self.operator = operator
+
+    def mult(self, mat, x, y):
+        y.array[:] = self.operator.matvec(x.array_r)
+
+    def getDiagonal(self, mat, d):
+        d.array[:] = self.operator.diagonal()
+
+
+class _PETScPreconditionerContext:
+    """
+    Python context for a PETSc shell preconditioner that applies a scipy LinearOperator.
+    """
+    def __init__(self, operator):
+        self.operator = operator
+
+    def apply(self, pc, x, y):
+        y.array[:] = self.operator.matvec(x.array_r)
+
+
+def solveTridiagonal(lower, diagonal, upper, rhs):
+    """
+    Solve tridiagonal systems with the Thomas algorithm, vectorized over any leading batch axes.
+
+    Parameters:
+        lower: numpy array (..., n), sub-diagonal; lower[..., 0] is ignored
+        diagonal: numpy array (..., n), main diagonal
+        upper: numpy array (..., n), super-diagonal; upper[..., -1] is ignored
+        rhs: numpy array (..., n), right-hand sides
+
+    Returns:
+        solution: numpy array (..., n)
+    """
+    lower, diagonal, upper, rhs = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (lower, diagonal, upper, rhs)))
+    n = diagonal.shape[-1]
+
+    # Forward elimination
+    c = np.empty_like(diagonal)
+    d = np.empty_like(diagonal)
+    c[..., 0] = upper[..., 0] / diagonal[..., 0]
+    d[..., 0] = rhs[..., 0] / diagonal[..., 0]
+    for i in range(1, n):
+        denominator = diagonal[..., i] - lower[..., i] * c[..., i - 1]
+        c[..., i] = upper[..., i] / denominator
+        d[..., i] = (rhs[..., i] - lower[..., i] * d[..., i - 1]) / denominator
+
+    # Back substitution
+    solution = np.empty_like(diagonal)
+    solution[..., -1] = d[..., -1]
+    for i in range(n - 2, -1, -1):
+        solution[..., i] = d[..., i] - c[..., i] * solution[..., i + 1]
+    return solution
+
+
+class SolverResult(tuple):
+    """
+    Outcome of Solver.solve(). Unpacks and indexes like the (solution, residual, info) tuple returned before,
+    and records the convergence history of the solve.
+
+    Attributes:
+        solution (np.ndarray): The solution vector.
+        residual (float): Norm of the final residual b - A x.
+        info: Backend convergence flag (scipy and JAX) or iteration count (PETSc); 0 for the direct methods.
+        iterations (int or None): Number of iterations, or None if the backend does not report it (JAX).
+        residualHistory (np.ndarray): Residual norm after every iteration, if a callback was given or the history
+            was requested. The scipy cg/bicgstab and multigrid methods record the true residual; gmres and
+            PETSc record the residual estimate of the method.
+        wallTime (float): Wall time of the solve in seconds.
+        converged (bool): Whether the requested tolerance was reached.
+    """
+    def __new__(cls, solution, residual, info, iterations=None, residualHistory=(), wallTime=None, converged=True):
+        result = super().__new__(cls, (solution, residual, info))
+        result.iterations = iterations
+        result.residualHistory = np.asarray(residualHistory, dtype=np.float64)
+        result.wallTime = wallTime
+        result.converged = bool(converged)
+        return result
+
+    @property
+    def solution(self):
+        return self[0]
+
+    @property
+    def residual(self):
+        return self[1]
+
+    @property
+    def info(self):
+        return self[2]
+
 
 class Solver:
-    def __init__(self, A, b, backend="scipy"):
+    def __init__(self, A, b, backend="scipy", gridShape=None, preconditionerOptions=None, warmStart=False,
+                 factorCacheSize=4):
         """
         Initialize the solver with the matrix A, vector b, and backend.
 
         Parameters:
-        A: scipy.sparse matrix (A in Ax = b)
+        A: scipy.sparse matrix or scipy.sparse.linalg.LinearOperator such as a StencilOperator (A in Ax = b)
         b: numpy array (b in Ax = b)
         backend: str, one of ["scipy", "jax", "petsc"]
+        gridShape: tuple, optional, cells per axis of the structured grid A is assembled on; required by
+            multigrid unless A is a StencilOperator
+        preconditionerOptions: dict, optional, options per preconditioner name, e.g.
+            {"multigrid": {"smoother": "gaussSeidel"}} for the GeometricMultigrid arguments,
+            {"ilu": {"dropTolerance": 1e-4, "fillFactor": 10}} or {"amg": {"maxCoarse": 64, "cycle": "V"}}
+        warmStart: bool, optional, start every solve without an explicit x0 from the previous solution
+        factorCacheSize: int, optional, number of sparse LU factorizations of the "direct" method kept by this
+            solver, least recently used first out; 0 disables the cache, see clearFactorCache()
         """
-        if not sp.isspmatrix(A):
-            raise TypeError("A must be a scipy sparse matrix.")
+        if not sp.isspmatrix(A) and not isinstance(A, sp.linalg.LinearOperator):
+            raise TypeError("A must be a scipy sparse matrix or a LinearOperator.")
         if not isinstance(b, np.ndarray):
             raise TypeError("b must be a numpy array.")
 
@@ -26,37 +143,307 @@ class Solver:
         self.b = b
         self.solution = None
         self.backend = backend.lower()
+        self.gridShape = gridShape
+        self.preconditionerOptions = preconditionerOptions or {}
+        self.warmStart = warmStart
+        self._multigrid = None
+        self._preconditioners = {}
+        self._operatorKey = None
+        self._banded = None
+        self.factorCacheSize = max(0, int(factorCacheSize))
+        self._factorCache = OrderedDict()
+        self._history = []
+        self._iterations = 0
+        self._converged = True
+        self._callback = None
+        self._recordHistory = False
 
         if self.backend not in ["scipy", "jax", "petsc"]:
             raise ValueError("Unsupported backend. Choose from 'scipy', 'jax', or 'petsc'.")
 
-    def solve(self, method="bicgstab", preconditioner="none"):
+    def solve(self, method="bicgstab", preconditioner="none", tolerance=1e-10, maxIterations=None, callback=None,
+              x0=None, recordHistory=False):
         """
         Solve the system Ax = b using the selected backend and method.
 
         Parameters:
             method: str, optional (default="bicgstab")
                 The solver method to use (e.g., "bicgstab", "cg", "gmres").
+                "banded" solves a tridiagonal system directly with LAPACK, independent of the backend,
+                and accepts a batch of right-hand sides as the columns of b.
+                "direct" solves with a sparse LU factorization (SuperLU for scipy and jax, PETSc LU for petsc)
+                that is cached, so later solves with the same matrix only cost the triangular solves.
+                "multigrid" iterates geometric multigrid V-cycles, independent of the backend.
             preconditioner: str, optional (default="none")
-                Preconditioner type (e.g., "jacobi") or "none" for no preconditioning.
-                For PETSc, passed directly to pc.setType().
+                Preconditioner type (e.g., "jacobi", or "multigrid" for one geometric multigrid V-cycle with
+                the scipy and petsc backends) or "none" for no preconditioning.
+                The scipy backend also supports "ilu" (incomplete LU) and "amg" (smoothed aggregation
+                algebraic multigrid, requires pyamg); PETSc uses its own ILU and GAMG for them.
+                Other PETSc preconditioners are passed directly to pc.setType().
+            tolerance: float, optional (default=1e-10)
+                Relative residual tolerance ||b - A x|| <= tolerance * ||b|| of the iterative methods.
+            maxIterations: int, optional (default=None)
+                Maximum number of iterations of the iterative methods; None for the backend default.
+            callback: callable, optional (default=None)
+                Called as callback(iteration, residualNorm) after every iteration of the scipy, petsc and
+                multigrid methods.
+            x0: numpy array, optional (default=None)
+                Initial guess of the iterative methods, e.g. the solution of the previous time step. Without
+                it, the previous solution is used if the solver was created with warmStart=True and the
+                solution has the shape of b, else zero.
+            recordHistory: bool, optional (default=False)
+                Record the residual norm of every iteration in the residualHistory of the result. This is implied
+                by a callback. The scipy cg and bicgstab methods then compute the true residual, which costs an
+                extra matrix-vector product per iteration; otherwise the iterations are only counted.
 
         Returns:
-            solution: numpy array
-                The solution vector.
+            SolverResult: Unpacks as (solution, residual, info) and carries the iteration count, residual
+                history and wall time.
         """
+        self._history = []
+        self._iterations = 0
+        self._converged = True
+        self._callback = callback
+        self._recordHistory = recordHistory or callback is not None
+        if x0 is None and self.warmStart and self.solution is not None and np.shape(self.solution[0]) == self.b.shape:
+            x0 = self.solution[0]
+        if x0 is not None:
+            x0 = np.array(x0, dtype=np.float64).reshape(self.b.shape)
+        start = time.perf_counter()
 
-        if self.backend == "scipy":
-            self.solution = self._solve_scipy(method, preconditioner)
+        if method == "banded":
+            solution, err, info = self._solve_banded()
+        elif method == "direct":
+            solution, err, info = self._solve_direct()
+        elif method == "multigrid":
+            solution, err, info = self._solve_multigrid(tolerance, maxIterations, x0)
+        elif self.backend == "scipy":
+            solution, err, info = self._solve_scipy(method, preconditioner, tolerance, maxIterations, x0)
         elif self.backend == "jax":
-            self.solution = self._solve_jax(method, preconditioner)
+            solution, err, info = self._solve_jax(method, preconditioner, tolerance, maxIterations, x0)
         elif self.backend == "petsc":
-            self.solution = self._solve_petsc(method, preconditioner)
+            solution, err, info = self._solve_petsc(method, preconditioner, tolerance, maxIterations, x0)
+
+        wallTime = time.perf_counter() - start
+        self.solution = SolverResult(solution, err, info, iterations=self._iterations,
+                                     residualHistory=self._history, wallTime=wallTime, converged=self._converged)
         return self.solution
 
-    def _solve_scipy(self, method, preconditioner):
+    def _recordIteration(self, residualNorm):
+        """
+        Count an iteration, record its residual norm if the history was requested and forward it to the user
+        callback.
+        """
+        self._iterations += 1
+        if self._recordHistory:
+            self._history.append(float(residualNorm))
+        if self._callback is not None:
+            self._callback(self._iterations, float(residualNorm))
+
+    def _countIteration(self, *args):
+        """
+        Count an iteration without computing its residual.
+        """
+        self._iterations += 1
+
+    def _solve_banded(self):
+        """
+        Solve a tridiagonal system, e.g. from a StructuredMesh1D, with scipy.linalg.solve_banded.
+        """
+        A = self.A.tocsr() if isinstance(self.A, StencilOperator) else self.A
+        if not sp.isspmatrix(A):
+            raise TypeError("Banded method requires a scipy sparse matrix or a StencilOperator.")
+        A = A.tocsr()
+
+        positions, inside = self._bandedLayout(A)
+        if not np.all(inside) and np.any(A.data[~inside] != 0):
+            raise ValueError("Banded method requires a tridiagonal matrix.")
+        n = A.shape[0]
+        banded = np.bincount(positions[inside], weights=A.data[inside], minlength=3 * n).reshape(3, n)
+
+        solution = scipy.linalg.solve_banded((1, 1), banded, self.b)
+        err = np.linalg.norm(A @ solution - self.b)
+        self._iterations = 0
+        return solution, err, 0
+
+    def _bandedLayout(self, A):
+        """
+        Return the flat index of every stored entry of the CSR matrix A in the (3, n) layout of solve_banded,
+        and a mask of the entries inside the tridiagonal band. The layout only depends on the sparsity pattern,
+        so it is built once and reused while assembly merely overwrites the values.
+        """
+        key = self._hashArrays(np.asarray(A.shape), A.indptr, A.indices)
+        if self._banded is None or self._banded[0] != key:
+            n = A.shape[0]
+            rows = np.repeat(np.arange(n), np.diff(A.indptr))
+            offsets = A.indices - rows
+            inside = np.abs(offsets) <= 1
+            # solve_banded stores a[i, j] at ab[1 + i - j, j]
+            positions = (1 - offsets) * n + A.indices
+            self._banded = (key, positions, inside)
+        return self._banded[1], self._banded[2]
+
+    def _solve_direct(self):
+        """
+        Solve with a cached sparse LU factorization. Accepts a batch of right-hand sides as the columns of b.
+        """
+        factor = self._factorize()
+        if self.backend == "petsc":
+            columns = self.b.reshape(self.b.shape[0], -1)
+            solution = np.empty_like(columns, dtype=np.float64)
+            vec_x, vec_b = factor.getOperators()[0].createVecs()
+            for i in range(columns.shape[1]):
+                vec_b.setArray(np.ascontiguousarray(columns[:, i]))
+                factor.solve(vec_b, vec_x)
+                solution[:, i] = vec_x.getArray()
+            solution = solution.reshape(self.b.shape)
+        else:
+            solution = factor.solve(np.asarray(self.b, dtype=np.float64))
+
+        err = np.linalg.norm(self.A @ solution - self.b)
+        print(f"Direct LU solver residual: {err}")
+        self._iterations = 0
+        return solution, err, 0
+
+    def _factorize(self):
         """
-        Solve using Scipy's iterative solvers with optional Jacobi preconditioning.
+        Return the LU factorization of A, computed with a fill-reducing ordering (COLAMD for SuperLU, nested
+        dissection for PETSc) on first use. Up to factorCacheSize factors are cached on the solver under a hash
+        of the matrix pattern and values, so transient steps or boundary condition sweeps that only change b
+        skip the factorization.
+        """
+        A = self.A.tocsr() if isinstance(self.A, StencilOperator) else self.A
+        if not sp.isspmatrix(A):
+            raise TypeError("Direct method requires a scipy sparse matrix or a StencilOperator.")
+        A = sp.csr_matrix(A, dtype=np.float64)
+        if not A.has_canonical_format:
+            A = A.copy()
+            A.sum_duplicates()
+
+        key = ("petsc" if self.backend == "petsc" else "superlu",
+               self._hashArrays(np.asarray(A.shape), A.indptr, A.indices, A.data))
+
+        if key in self._factorCache:
+            self._factorCache.move_to_end(key)
+            return self._factorCache[key]
+
+        if self.backend == "petsc":
+            mat = PETSc.Mat().createAIJ(size=A.shape, csr=(A.indptr, A.indices, A.data))
+            factor = PETSc.KSP().create()
+            factor.setOperators(mat)
+            factor.setType("preonly")
+            pc = factor.getPC()
+            pc.setType("lu")
+            pc.setFactorOrdering("nd")
+            factor.setUp()
+        else:
+            factor = sp.linalg.splu(A.tocsc(), permc_spec="COLAMD")
+
+        if self.factorCacheSize > 0:
+            self._factorCache[key] = factor
+            while len(self._factorCache) > self.factorCacheSize:
+                self._factorCache.popitem(last=False)
+        return factor
+
+    def clearFactorCache(self):
+        """
+        Release the cached LU factorizations of the solver.
+        """
+        self._factorCache.clear()
+
+    @staticmethod
+    def _hashArrays(*arrays):
+        digest = hashlib.sha1()
+        for array in arrays:
+            digest.update(np.ascontiguousarray(array).view(np.uint8))
+        return digest.hexdigest()
+
+    @classmethod
+    def operatorKey(cls, A):
+        """
+        Hash of the shape, pattern and values of an operator, under which the solver caches its setup.
+
+        Args:
+            A: scipy sparse matrix or StencilOperator.
+
+        Returns:
+            str: Hexadecimal hash, or None for an operator whose values cannot be inspected.
+        """
+        if isinstance(A, StencilOperator):
+            return cls._hashArrays(np.asarray(A.gridShape), A.diagonalValues, *A.conductances)
+        if sp.isspmatrix(A):
+            A = A.tocsr()
+            return cls._hashArrays(np.asarray(A.shape), A.indptr, A.indices, A.data)
+        return None
+
+    def _refreshOperatorCaches(self):
+        """
+        Drop the cached multigrid hierarchy and preconditioners if the values of A changed since they were built.
+        Assembly overwrites the data of the matrix in place, so the caches are keyed on a hash of the operator
+        rather than on the identity of A.
+        """
+        key = self.operatorKey(self.A) or id(self.A)
+        if key != self._operatorKey:
+            self._multigrid = None
+            self._preconditioners = {}
+            self._operatorKey = key
+
+    def _getMultigrid(self):
+        """
+        Build the geometric multigrid hierarchy of A on first use and cache it on the solver until A changes.
+        """
+        self._refreshOperatorCaches()
+        if self._multigrid is None:
+            gridShape = self.gridShape
+            if gridShape is None and isinstance(self.A, StencilOperator):
+                gridShape = self.A.gridShape
+            if gridShape is None:
+                raise ValueError("Multigrid requires the grid shape of the operator.")
+            self._multigrid = GeometricMultigrid(self.A, gridShape, **self.preconditionerOptions.get("multigrid", {}))
+        return self._multigrid
+
+    def _solve_multigrid(self, tolerance, maxIterations, x0=None):
+        """
+        Solve with repeated geometric multigrid V-cycles.
+        """
+        solution, iterations = self._getMultigrid().solve(
+            self.b, x0=x0, rtol=tolerance, maxiter=maxIterations or 100, callback=self._recordIteration
+        )
+        err = np.linalg.norm(self.A @ solution - self.b)
+        self._converged = err <= tolerance * np.linalg.norm(self.b)
+        print(f"Multigrid solver residual: {err}, Iterations: {iterations}")
+        return solution, err, iterations
+
+    def _getPreconditioner(self, name):
+        """
+        Build the "ilu" or "amg" preconditioner of A for the scipy backend on first use and cache it on the
+        solver, so repeated solves with the same matrix values skip the setup.
+        """
+        self._refreshOperatorCaches()
+        if name in self._preconditioners:
+            return self._preconditioners[name]
+
+        A = self.A.tocsr() if isinstance(self.A, StencilOperator) else sp.csr_matrix(self.A)
+        options = self.preconditionerOptions.get(name, {})
+        if name == "ilu":
+            factor = sp.linalg.spilu(
+                A.tocsc(), drop_tol=options.get("dropTolerance", 1e-4), fill_factor=options.get("fillFactor", 10)
+            )
+            operator = sp.linalg.LinearOperator(A.shape, matvec=factor.solve, dtype=np.float64)
+        elif name == "amg":
+            if pyamg is None:
+                raise ImportError("The amg preconditioner requires pyamg.")
+            hierarchy = pyamg.smoothed_aggregation_solver(A, max_coarse=options.get("maxCoarse", 64))
+            operator = hierarchy.aspreconditioner(cycle=options.get("cycle", "V"))
+        else:
+            raise ValueError(f"Unsupported preconditioner '{name}'.")
+
+        self._preconditioners[name] = operator
+        return operator
+
+    def _solve_scipy(self, method, preconditioner, tolerance, maxIterations, x0=None):
+        """
+        Solve using Scipy's iterative solvers with optional preconditioning.
         """
         solverMethods = {
             "bicgstab": sp.linalg.bicgstab,
@@ -68,6 +455,8 @@ class Solver:
 
         if preconditioner == "jacobi":
         # Construct the Jacobi preconditioner
+            if not hasattr(self.A, "diagonal"):
+                raise ValueError("Jacobi preconditioner requires an operator that provides its diagonal.")
             jacobi_diag = self.A.diagonal()
             if np.any(jacobi_diag == 0):
                 raise ValueError("Jacobi preconditioner cannot be constructed: zero diagonal entries.")
@@ -76,17 +465,34 @@ class Solver:
                 shape=self.A.shape,
                 matvec=lambda x: x / jacobi_diag,
             )
+        elif preconditioner == "multigrid":
+            preconditioner_fn = self._getMultigrid().asPreconditioner()
+        elif preconditioner in ("ilu", "amg"):
+            preconditioner_fn = self._getPreconditioner(preconditioner)
         elif preconditioner == "none":
             preconditioner_fn = None
         else:
             raise ValueError(f"Unsupported preconditioner '{preconditioner}' for scipy backend.")
 
-        solution, info = solverMethods[method](self.A, self.b, rtol=1e-10, atol=1e-10, maxiter=None, M=preconditioner_fn)
+        if not self._recordHistory:
+            options = {"callback": self._countIteration}
+            if method == "gmres":
+                options["callback_type"] = "pr_norm"
+        elif method == "gmres":
+            # gmres reports its relative residual estimate per inner iteration
+            b_norm = np.linalg.norm(self.b)
+            options = {"callback": lambda r: self._recordIteration(r * b_norm), "callback_type": "pr_norm"}
+        else:
+            options = {"callback": lambda x: self._recordIteration(np.linalg.norm(self.b - self.A @ x))}
+        solution, info = solverMethods[method](
+            self.A, self.b, x0=x0, rtol=tolerance, atol=0.0, maxiter=maxIterations, M=preconditioner_fn, **options
+        )
         err = np.linalg.norm(self.A @ solution - self.b)
+        self._converged = info == 0
         print(f"Scipy {method} solver residual: {err}")
         return solution, err, info
 
-    def _solve_jax(self, method, preconditioner):
+    def _solve_jax(self, method, preconditioner, tolerance, maxIterations, x0=None):
         """
         Solve using JAX's iterative solvers with optional Jacobi preconditioning.
         """
@@ -98,8 +504,15 @@ class Solver:
         if method not in solver_methods:
             raise ValueError(f"Unsupported method '{method}' for JAX backend. Supported methods: {list(solver_methods.keys())}.")
 
-        # Convert scipy sparse matrix to JAX sparse matrix
-        A_jax = BCOO.from_scipy_sparse(self.A).sort_indices()
+        # Convert scipy sparse matrix to JAX sparse matrix, or the stencil to a jitted matvec
+        if isinstance(self.A, StencilOperator):
+            A_jax = self.A.toJax()
+            apply_A = A_jax
+        elif sp.isspmatrix(self.A):
+            A_jax = BCOO.from_scipy_sparse(self.A).sort_indices()
+            apply_A = lambda x: A_jax @ x
+        else:
+            raise TypeError("JAX backend requires a scipy sparse matrix or a StencilOperator.")
 
         # Prepare the right-hand side vector
         b_jax = jnp.array(self.b)
@@ -116,29 +529,33 @@ class Solver:
             raise ValueError(f"Unsupported preconditioner '{preconditioner}' for JAX backend.")
 
         # Solve using the selected JAX method
-        x0_jax = jnp.zeros_like(b_jax)
-        solution, info = solver_methods[method](A_jax, b_jax, tol=1e-10, atol=1e-10, maxiter=None, M=preconditioner_fn, x0=x0_jax, )
+        x0_jax = jnp.zeros_like(b_jax) if x0 is None else jnp.asarray(x0)
+        solution, info = solver_methods[method](A_jax, b_jax, tol=tolerance, atol=0.0, maxiter=maxIterations, M=preconditioner_fn, x0=x0_jax, )
 
         # Flatten the solution if necessary and convert to NumPy
         if isinstance(solution, (tuple, list)):
             solution = solution[0]  # Use the first element of the tuple if applicable
         solution = np.array(solution)
 
-        # Verify convergence
-        residual = jnp.linalg.norm(A_jax @ solution - b_jax)
+        # Verify convergence; JAX reports neither the iteration count nor a convergence flag
+        residual = jnp.linalg.norm(apply_A(solution) - b_jax)
         print(f"JAX {method} solver residual: {residual}")
         if info is not None and info != 0:
             raise RuntimeError(f"JAX solver failed to converge: info={info}")
-        
+        self._iterations = None
+        self._converged = float(residual) <= tolerance * float(jnp.linalg.norm(b_jax))
+
         return solution, residual, info
 
-    def _solve_petsc(self, method, preconditioner):
+    def _solve_petsc(self, method, preconditioner, tolerance, maxIterations, x0=None):
         """
         Solve using PETSc solver.
 
         Available Preconditioners:
         - jacobi: Diagonal scaling preconditioner.
         - ilu: Incomplete LU factorization.
+        - amg: Algebraic multigrid, mapped to PETSc GAMG.
+        - multigrid: Geometric multigrid V-cycle, see GeometricMultigrid.
         - sor: Successive over-relaxation.
         - none: No preconditioning.
         - asm: Additive Schwarz method.
@@ -152,23 +569,40 @@ class Solver:
         if method not in petscMethods:
             raise ValueError(f"Unsupported method '{method}' for petsc backend.")
         
-        if not isinstance(self.A, sp.csr_matrix):
-            self.A = self.A.tocsr()
-
-        mat = PETSc.Mat().createAIJ(size=self.A.shape, csr=(self.A.indptr, self.A.indices, self.A.data))
+        if isinstance(self.A, sp.linalg.LinearOperator):
+            # Matrix-free operators are wrapped in a PETSc shell matrix
+            mat = PETSc.Mat().createPython(self.A.shape, context=_PETScShellContext(self.A))
+            mat.setUp()
+        else:
+            # PETSc needs CSR; other storage formats such as DIA are converted only here
+            A_csr = self.A if isinstance(self.A, sp.csr_matrix) else self.A.tocsr()
+            mat = PETSc.Mat().createAIJ(size=A_csr.shape, csr=(A_csr.indptr, A_csr.indices, A_csr.data))
         vec_b = PETSc.Vec().createWithArray(self.b)
-        vec_x = PETSc.Vec().createWithArray(np.zeros_like(self.b))
+        vec_x = PETSc.Vec().createWithArray(np.zeros_like(self.b) if x0 is None else x0)
 
         ksp = PETSc.KSP().create()
         ksp.setOperators(mat)
         ksp.setType(petscMethods[method])  # Use corrected PETSc solver type
         pc = ksp.getPC()
-        pc.setType(preconditioner)
+        if preconditioner == "multigrid":
+            pc.setType("python")
+            pc.setPythonContext(_PETScPreconditionerContext(self._getMultigrid().asPreconditioner()))
+        elif preconditioner == "amg":
+            pc.setType("gamg")
+        else:
+            pc.setType(preconditioner)
+
+        ksp.setTolerances(rtol=tolerance, max_it=maxIterations)
+        ksp.setInitialGuessNonzero(x0 is not None)
+        if self._recordHistory:
+            ksp.setMonitor(lambda ksp, iteration, residualNorm: iteration > 0 and self._recordIteration(residualNorm))
 
         ksp.solve(vec_b, vec_x)
         solution = vec_x.getArray()
         err = np.linalg.norm(self.A @ solution - self.b)
         iteration_number = ksp.getIterationNumber()
+        self._iterations = iteration_number
+        self._converged = ksp.getConvergedReason() > 0
 
         print(f"PETSc {method} solver residual: {err}, Iterations: {iteration_number}")
 
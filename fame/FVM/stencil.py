@@ -0,0 +1,159 @@
+import numpy as np
+import scipy.sparse as sp
+import jax
+import jax.numpy as jnp
+
+
+class StencilOperator(sp.linalg.LinearOperator):
+    """
+    Matrix-free diffusion stencil on a structured grid: 3-point on a StructuredMesh1D and 7-point on a
+    StructuredMesh3D. The operator stores one diagonal value per cell and one conductance per interior face,
+    and applies A @ x with strided slicing over the (nx,) or (nx, ny, nz) shaped field, so memory scales with
+    the number of cells instead of the number of nonzeros.
+
+    Cells are numbered with i varying fastest, which is the Fortran-order ravel of the grid-shaped field.
+    """
+    def __init__(self, gridShape, diagonal, conductances):
+        """
+        Initialize the stencil operator.
+
+        Args:
+            gridShape (tuple): Number of cells along each axis, (nx,) or (nx, ny, nz).
+            diagonal (np.ndarray): Diagonal of the operator, one value per cell.
+            conductances (list): Per axis, the interior face conductances shaped like the grid with one
+                fewer entry along that axis. The off-diagonal coupling across a face is -conductance.
+        """
+        self.gridShape = tuple(int(n) for n in gridShape)
+        self.diagonalValues = np.asarray(diagonal, dtype=np.float64)
+        self.conductances = [np.asarray(c, dtype=np.float64) for c in conductances]
+
+        numCells = int(np.prod(self.gridShape))
+        if self.diagonalValues.shape != (numCells,):
+            raise ValueError(f"Diagonal must have {numCells} entries, got {self.diagonalValues.shape}.")
+        for axis, conductance in enumerate(self.conductances):
+            expected = tuple(n - 1 if a == axis else n for a, n in enumerate(self.gridShape))
+            if conductance.shape != expected:
+                raise ValueError(f"Conductances along axis {axis} must have shape {expected}, got {conductance.shape}.")
+
+        super().__init__(dtype=np.float64, shape=(numCells, numCells))
+
+    @classmethod
+    def fromMesh(cls, mesh, faceConductance, diagonal):
+        """
+        Build the stencil operator from per-face conductances of a structured mesh.
+
+        Args:
+            mesh (StructuredMesh): Mesh whose faces are numbered in structured axis blocks.
+            faceConductance (np.ndarray): Conductance of every face; boundary entries are ignored.
+            diagonal (np.ndarray): Diagonal of the operator, one value per cell.
+
+        Returns:
+            StencilOperator: The matrix-free operator.
+        """
+        gridShape = tuple(int(n) for n in mesh.divisions)
+        conductances = []
+        for axis, n in enumerate(gridShape):
+            faceShape = tuple(m + 1 if a == axis else m for a, m in enumerate(gridShape))
+            block = faceConductance[mesh.faceAxis == axis].reshape(faceShape, order='F')
+            conductances.append(np.take(block, np.arange(1, n), axis=axis))
+        return cls(gridShape, diagonal, conductances)
+
+    @staticmethod
+    def _faceSlices(ndim, axis):
+        """
+        Index tuples selecting the lower and upper cell of every interior face along an axis.
+        """
+        lower = tuple(slice(None, -1) if a == axis else slice(None) for a in range(ndim))
+        upper = tuple(slice(1, None) if a == axis else slice(None) for a in range(ndim))
+        return lower, upper
+
+    def _matvec(self, x):
+        x = np.asarray(x).reshape(self.gridShape, order='F')
+        y = self.diagonalValues.reshape(self.gridShape, order='F') * x
+        for axis, conductance in enumerate(self.conductances):
+            lower, upper = self._faceSlices(len(self.gridShape), axis)
+            y[lower] -= conductance * x[upper]
+            y[upper] -= conductance * x[lower]
+        return y.reshape(-1, order='F')
+
+    def _rmatvec(self, x):
+        # The stencil is symmetric
+        return self._matvec(x)
+
+    def _adjoint(self):
+        return self
+
+    def diagonal(self):
+        """
+        Return the diagonal of the operator, e.g. for Jacobi preconditioning.
+        """
+        return self.diagonalValues
+
+    def toJax(self):
+        """
+        Build a jitted JAX function applying the stencil, usable as the ``A`` argument of the
+        ``jax.scipy.sparse.linalg`` solvers.
+
+        Returns:
+            callable: Function mapping a JAX vector x to A @ x.
+        """
+        gridShape = self.gridShape
+        diagonal = jnp.asarray(self.diagonalValues.reshape(gridShape, order='F'))
+        conductances = [jnp.asarray(c) for c in self.conductances]
+        slices = [self._faceSlices(len(gridShape), axis) for axis in range(len(gridShape))]
+
+        def matvec(x):
+            x = x.reshape(gridShape, order='F')
+            y = diagonal * x
+            for conductance, (lower, upper) in zip(conductances, slices):
+                y = y.at[lower].add(-conductance * x[upper])
+                y = y.at[upper].add(-conductance * x[lower])
+            return y.reshape(-1, order='F')
+
+        return jax.jit(matvec)
+
+    def tocsr(self):
+        """
+        Assemble the stencil into an explicit CSR matrix, e.g. for backends that need one.
+        """
+        numCells = self.shape[0]
+        cellIds = np.arange(numCells).reshape(self.gridShape, order='F')
+        rows, cols, values = [np.arange(numCells)], [np.arange(numCells)], [self.diagonalValues]
+        for axis, conductance in enumerate(self.conductances):
+            lower, upper = self._faceSlices(len(self.gridShape), axis)
+            lowerIds = cellIds[lower].ravel(order='F')
+            upperIds = cellIds[upper].ravel(order='F')
+            coupling = -conductance.ravel(order='F')
+            rows += [lowerIds, upperIds]
+            cols += [upperIds, lowerIds]
+            values += [coupling, coupling]
+        return sp.coo_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))), shape=self.shape
+        ).tocsr()
+
+    def todia(self):
+        """
+        Store the stencil as a DIA matrix: one offset array per diagonal (3 in 1D, 7 in 3D) and no index per
+        nonzero. Matvec and diagonal extraction stay in compiled code.
+        """
+        numCells = self.shape[0]
+        cellIds = np.arange(numCells).reshape(self.gridShape, order='F')
+        offsets, data = [0], [self.diagonalValues]
+        for axis, conductance in enumerate(self.conductances):
+            if conductance.size == 0:
+                continue
+            lower, upper = self._faceSlices(len(self.gridShape), axis)
+            lowerIds = cellIds[lower].ravel(order='F')
+            upperIds = cellIds[upper].ravel(order='F')
+            stride = int(np.prod(self.gridShape[:axis]))
+            coupling = -conductance.ravel(order='F')
+
+            # DIA data is column-aligned: entry A[j - offset, j] is stored at data[k, j]
+            superDiagonal = np.zeros(numCells)
+            superDiagonal[upperIds] = coupling
+            subDiagonal = np.zeros(numCells)
+            subDiagonal[lowerIds] = coupling
+
+            offsets += [stride, -stride]
+            data += [superDiagonal, subDiagonal]
+        return sp.dia_matrix((np.array(data), np.array(offsets)), shape=self.shape)
@@ -1,30 +1,254 @@
 import os
 import vtk
+import queue
+import threading
 import numpy as np
+from vtkmodules.util import numpy_support
 from .mesh import StructuredMesh, StructuredMesh1D
 
+try:
+    import h5py
+except ImportError:  # h5py is only needed for the XDMF output backend
+    h5py = None
+
+class PVDCollection:
+    """
+    ParaView collection (.pvd) file that grows in constant time per entry.
+
+    The file always ends with its closing tags. Appending locates them from the tail of the file, writes the
+    new entry followed by the closing tags in place and flushes, so a run that stops at any point leaves a
+    collection ParaView can still open, and the cost of an entry does not depend on how many came before it.
+    """
+    HEADER = b'<VTKFile type="Collection" version="0.1">\n  <Collection>\n'
+    FOOTER = b'  </Collection>\n</VTKFile>\n'
+
+    def __init__(self, path):
+        """
+        Open a collection file, creating an empty one if it does not exist.
+
+        Args:
+            path (str): Path to the .pvd file.
+        """
+        self.path = path
+        if not os.path.exists(path):
+            # write to a temporary file first so a crash never leaves a half-written header
+            temporary = path + '.tmp'
+            with open(temporary, 'wb') as f:
+                f.write(self.HEADER + self.FOOTER)
+            os.replace(temporary, path)
+
+    def _footerOffset(self, f):
+        """
+        Return the byte offset of the line holding the closing </Collection> tag.
+        """
+        size = f.seek(0, os.SEEK_END)
+        tailSize = min(size, 256)
+        f.seek(size - tailSize)
+        tail = f.read()
+        index = tail.rfind(b'</Collection>')
+        if index < 0:
+            raise ValueError(f"No closing </Collection> tag found in {self.path}.")
+        return size - tailSize + tail.rfind(b'\n', 0, index) + 1
+
+    def append(self, fileName, time, **attributes):
+        """
+        Append a dataset entry to the collection.
+
+        Args:
+            fileName (str): Dataset file, relative to the collection file.
+            time (float): Time value of the dataset.
+            **attributes: Additional DataSet attributes such as group and part, written in the given order.
+        """
+        fields = [f'timestep="{time}"'] + [f'{key}="{value}"' for key, value in attributes.items()] + [f'file="{fileName}"']
+        entry = f'    <DataSet {" ".join(fields)}/>\n'.encode()
+        with open(self.path, 'r+b') as f:
+            f.seek(self._footerOffset(f))
+            f.write(entry + self.FOOTER)
+            f.truncate()
+            f.flush()
+
+
 class MeshWriter:
-    def __new__(cls, mesh):
+    ENCODINGS = ("ascii", "binary", "appended")
+    COMPRESSORS = ("none", "zlib", "lz4", "lzma")
+    PRECISIONS = {"float64": (np.float64, vtk.VTK_DOUBLE), "float32": (np.float32, vtk.VTK_FLOAT)}
+
+    def __new__(cls, mesh, *args, **kwargs):
         if isinstance(mesh, StructuredMesh1D):
             return super().__new__(MeshWriter1D)
         return super().__new__(MeshWriter3D)
     
-    def __init__(self, mesh):
+    def __init__(self, mesh, encoding="appended", compressor="zlib", compressionLevel=None, precision="float64",
+                 writeFrequency=1, region=None, stride=1):
         """
         Initialize with a StructuredMesh instance.
 
         Args:
             mesh (StructuredMesh): The structured mesh object containing the grid and scalar data.
+            encoding (str): "ascii", "binary" (inline base64) or "appended" (raw binary block at the end of the file).
+            compressor (str): "none", "zlib", "lz4" or "lzma". Ignored for ascii output.
+            compressionLevel (int, optional): Compression level from 1 (fastest) to 9 (smallest).
+            precision (str): "float64" or "float32"; fields are down-cast to float32 before export when requested.
+            writeFrequency (int): Only steps that are a multiple of this value are written.
+            region (dict, optional): Cell index range [start, stop) per axis, e.g. {'x': [10, 20]}, to write only
+                a sub-box of the mesh. Axes that are not listed are written in full.
+            stride (int or list): Keep every n-th point (and cell) along each axis.
         """
         if not isinstance(mesh, StructuredMesh):
             raise TypeError("The provided mesh must be an instance of StructuredMesh.")
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"Unsupported encoding '{encoding}'. Choose from {', '.join(self.ENCODINGS)}.")
+        if compressor not in self.COMPRESSORS:
+            raise ValueError(f"Unsupported compressor '{compressor}'. Choose from {', '.join(self.COMPRESSORS)}.")
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unsupported precision '{precision}'. Choose from {', '.join(self.PRECISIONS)}.")
+        if compressionLevel is not None and not 1 <= int(compressionLevel) <= 9:
+            raise ValueError("Compression level must be between 1 and 9.")
+
         self.mesh = mesh
+        self.encoding = encoding
+        self.compressor = compressor
+        self.compressionLevel = compressionLevel
+        self.precision = precision
+        self.writeFrequency = max(1, int(writeFrequency))
+        self._exportedArrays = {}
+        self._axisSlices = self._computeAxisSlices(region or {}, stride)
+        self._subset = None
+
+    def close(self):
+        """
+        Release output resources. VTK files are complete after every write, so there is nothing to do.
+        """
+
+    def _computeAxisSlices(self, region, stride):
+        """
+        Computes the point and cell slices of the written region along each axis, or None for the full mesh.
+        """
+        divisions = [int(n) for n in self.mesh.divisions]
+        strides = [int(stride)] * len(divisions) if np.isscalar(stride) else [int(n) for n in stride]
+        if len(strides) != len(divisions) or min(strides) < 1:
+            raise ValueError(f"Stride must be a positive integer or a list of {len(divisions)} positive integers.")
+        unknown = set(region) - set('xyz'[:len(divisions)])
+        if unknown:
+            raise ValueError(f"Unknown region axes: {', '.join(sorted(unknown))}.")
+        if not region and max(strides) == 1:
+            return None
+
+        slices = []
+        for axis, (n, step) in enumerate(zip(divisions, strides)):
+            start, stop = region.get('xyz'[axis], (0, n))
+            if not 0 <= start < stop <= n:
+                raise ValueError(f"Region along {'xyz'[axis]} must satisfy 0 <= start < stop <= {n}, got [{start}, {stop}).")
+            num_points = len(range(start, stop + 1, step))
+            slices.append((slice(start, stop + 1, step), slice(start, start + (num_points - 1) * step, step)))
+        return slices
+
+    def _isOutputStep(self, step):
+        """
+        Whether a step is written under the configured write frequency.
+        """
+        return (0 if step is None else step) % self.writeFrequency == 0
+
+    def _outputDataset(self):
+        """
+        Return the dataset to write: the mesh itself, with its VTK points and cells built on first use, or the
+        cached sub-box/strided subset of it.
+        """
+        if self._axisSlices is None:
+            return self.mesh.ensureVTKDataset()
+        if self._subset is None:
+            self._subset = self._buildSubset()
+        return self._subset
+
+    def _extractField(self, var_data, num_points):
+        """
+        Slice a point or cell field down to the written region. The slicing works on a reshaped view of the
+        field, so only the extracted values are copied.
+        """
+        if self._axisSlices is None:
+            return var_data
+        on_points = var_data.shape[0] == num_points
+        grid_shape = [int(n) + 1 if on_points else int(n) for n in self.mesh.divisions]
+        # ids run with x fastest, so the C-order view has the axes reversed
+        view = var_data.reshape(tuple(reversed(grid_shape)) + var_data.shape[1:])
+        index = tuple(reversed([p if on_points else c for p, c in self._axisSlices]))
+        return view[index].reshape((-1,) + var_data.shape[1:])
+
+    def _configureWriter(self, writer):
+        """
+        Apply the encoding and compression settings to a VTK XML writer.
+
+        Args:
+            writer (vtk.vtkXMLWriter): The writer to configure.
+        """
+        if self.encoding == "ascii":
+            writer.SetDataModeToAscii()
+        elif self.encoding == "binary":
+            writer.SetDataModeToBinary()
+        else:
+            writer.SetDataModeToAppended()
+            writer.EncodeAppendedDataOff()
+
+        if self.compressor == "none":
+            writer.SetCompressorTypeToNone()
+        elif self.compressor == "zlib":
+            writer.SetCompressorTypeToZLib()
+        elif self.compressor == "lz4":
+            writer.SetCompressorTypeToLZ4()
+        else:
+            writer.SetCompressorTypeToLZMA()
+
+        if self.compressionLevel is not None:
+            writer.SetCompressionLevel(int(self.compressionLevel))
+
+    def _exportArray(self, var_name, var_data):
+        """
+        Wrap a field as a VTK array that shares the NumPy buffer instead of copying it value by value.
+
+        The writer keeps a reference to the buffer for as long as the array is attached to the mesh, so the
+        data must not be modified in place until it has been written.
+
+        Args:
+            var_name (str): Name of the VTK array.
+            var_data (np.ndarray): (n,) scalar or (n, components) vector/tensor data.
+
+        Returns:
+            vtk.vtkDataArray: vtkDoubleArray, or vtkFloatArray for float32 precision, backed by the NumPy data.
+        """
+        dtype, array_type = self.PRECISIONS[self.precision]
+        data = np.ascontiguousarray(var_data, dtype=dtype)
+        var_array = numpy_support.numpy_to_vtk(data, deep=False, array_type=array_type)
+        var_array.SetName(var_name)
+        self._exportedArrays[var_name] = data
+        return var_array
 
 
 class MeshWriter3D(MeshWriter):
     """
     Definition of 3D mesh writer.
     """
+    def _buildSubset(self):
+        """
+        Builds the vtkStructuredGrid of the written region. Its extent starts at the region origin, in units of
+        the stride, so sub-boxes keep their position in the IJK index space of the full grid.
+        """
+        nx, ny, nz = (int(n) for n in self.mesh.divisions)
+        x_points, y_points, z_points = (p for p, c in self._axisSlices)
+        coordinates = self.mesh.pointCoordinates.reshape(nz + 1, ny + 1, nx + 1, 3)[z_points, y_points, x_points]
+
+        points = vtk.vtkPoints()
+        points.SetData(numpy_support.numpy_to_vtk(coordinates.reshape(-1, 3), deep=True))
+
+        extent = []
+        for (point_slice, _), n in zip(self._axisSlices, coordinates.shape[2::-1]):
+            origin = point_slice.start // point_slice.step
+            extent += [origin, origin + n - 1]
+
+        grid = vtk.vtkStructuredGrid()
+        grid.SetExtent(*extent)
+        grid.SetPoints(points)
+        return grid
+
     def _writeSingleVTS(self, output_file, variables):
         """
         Writes variables (scalar, vector, tensor) of the StructuredMesh to a .vts file.
@@ -40,44 +264,35 @@ class MeshWriter3D(MeshWriter):
         if not hasattr(self.mesh, 'dimensions') or not hasattr(self.mesh, 'GetPoints'):
             raise ValueError("The provided mesh must have 'dimensions' and 'GetPoints' attributes.")
 
-        points = self.mesh.GetPoints()
-        num_points = points.GetNumberOfPoints()
+        num_points = self.mesh.GetNumberOfPoints()
         num_cells = self.mesh.GetNumberOfCells()
 
-        if not points or num_points == 0:
+        if num_points == 0:
             raise ValueError("The provided mesh must have valid vtkPoints.")
 
+        dataset = self._outputDataset()
         for var_name, var_data in variables.items():
-            var_array = vtk.vtkDoubleArray()
-            var_array.SetName(var_name)
-
             if var_data.shape[0] == num_points:
                 # Write to point data
-                target = self.mesh.GetPointData()
+                target = dataset.GetPointData()
             elif var_data.shape[0] == num_cells:
                 # Write to cell data
-                target = self.mesh.GetCellData()
+                target = dataset.GetCellData()
             else:
                 raise ValueError(
                     f"Mismatch between '{var_name}' size and grid dimensions. "
                     f"Expected {num_points} for points or {num_cells} for cells."
                 )
 
-            # Set number of components for scalar, vector, or tensor data
-            if var_data.ndim == 1:
-                var_array.SetNumberOfComponents(1)  # Explicit for scalar
-                for value in var_data:
-                    var_array.InsertNextValue(value)
-            else:
-                var_array.SetNumberOfComponents(var_data.shape[1])  # Vector or tensor
-                for value in var_data:
-                    var_array.InsertNextTuple(value)
+            # Share the buffer; the component count follows the data shape (scalar, vector, tensor)
+            var_array = self._exportArray(var_name, self._extractField(var_data, num_points))
 
             target.AddArray(var_array)
 
         writer = vtk.vtkXMLStructuredGridWriter()
         writer.SetFileName(output_file)
-        writer.SetInputData(self.mesh)
+        self._configureWriter(writer)
+        writer.SetInputData(dataset)
         writer.Write()
         print(f"Structured mesh with variables written to {output_file}")
 
@@ -91,16 +306,11 @@ class MeshWriter3D(MeshWriter):
             time (float, optional): Time value for the current timestep. Defaults to 0.0 for steady-state.
             step (int, optional): Step index for naming the .vts file. Defaults to 0 for steady-state.
         """
+        if not self._isOutputStep(step):
+            return
         os.makedirs(output_dir, exist_ok=True)
         pvd_file = os.path.join(output_dir, os.path.basename(output_dir) + '.pvd')
-
-        if not os.path.exists(pvd_file):
-            # Initialize a new PVD file if it doesn't exist
-            with open(pvd_file, 'w', newline='') as f:
-                f.write('<VTKFile type="Collection" version="0.1">\n')
-                f.write('  <Collection>\n')
-                f.write('  </Collection>\n')
-                f.write('</VTKFile>\n')
+        collection = PVDCollection(pvd_file)
 
         time = 0.0 if time is None else time
         step = 0 if step is None else step
@@ -108,74 +318,75 @@ class MeshWriter3D(MeshWriter):
         vts_file = os.path.join(output_dir, f"output_{step:04d}.vts")
         self._writeSingleVTS(vts_file, variables)
 
-        # Update the PVD file
-        with open(pvd_file, 'r+', newline='') as f:
-            lines = f.readlines()
-            insert_index = len(lines) - 2
-            lines.insert(insert_index, f'    <DataSet timestep="{time}" group="" part="0" file="{os.path.basename(vts_file)}"/>\n')
-            f.seek(0)
-            f.writelines(lines)
+        # Append the entry to the PVD file
+        collection.append(os.path.basename(vts_file), time, group="", part=0)
 
         print(f"Updated PVD file: {pvd_file} with timestep {time} and file {vts_file}")
 
 
 class MeshWriter1D(MeshWriter):
+    def _buildSubset(self):
+        """
+        Builds the vtkPolyData of the written range of points and the lines between them.
+        """
+        coordinates = self.mesh.pointCoordinates[self._axisSlices[0][0]]
+
+        points = vtk.vtkPoints()
+        points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(coordinates), deep=True))
+        lines = vtk.vtkCellArray()
+        for i in range(len(coordinates) - 1):
+            line = vtk.vtkLine()
+            line.GetPointIds().SetId(0, i)
+            line.GetPointIds().SetId(1, i + 1)
+            lines.InsertNextCell(line)
+
+        polyData = vtk.vtkPolyData()
+        polyData.SetPoints(points)
+        polyData.SetLines(lines)
+        return polyData
+
     def _writeSingleVTP(self, output_file, variables):
         if not output_file.endswith('.vtp'):
             output_file += '.vtp'
 
-        points = self.mesh.GetPoints()
-        num_points = points.GetNumberOfPoints()
+        num_points = self.mesh.GetNumberOfPoints()
 
-        if not points or num_points == 0:
+        if num_points == 0:
             raise ValueError("The provided mesh must have valid vtkPoints.")
 
+        dataset = self._outputDataset()
         for var_name, var_data in variables.items():
-            var_array = vtk.vtkDoubleArray()
-            var_array.SetName(var_name)
-
             # Determine if data is for points or cells
             if var_data.shape[0] == num_points:
-                target = self.mesh.GetPointData()
+                target = dataset.GetPointData()
             elif var_data.shape[0] == self.mesh.GetNumberOfCells():
-                target = self.mesh.GetCellData()
+                target = dataset.GetCellData()
             else:
                 raise ValueError(
                     f"Mismatch between '{var_name}' size and mesh. "
                     f"Expected {num_points} for points or {self.mesh.GetNumberOfCells()} for cells."
                 )
 
-            # Set components based on data shape (scalar, vector, tensor)
-            if var_data.ndim == 1:
-                var_array.SetNumberOfComponents(1)
-                for value in var_data:
-                    var_array.InsertNextValue(value)
-            else:
-                var_array.SetNumberOfComponents(var_data.shape[1])
-                for value in var_data:
-                    var_array.InsertNextTuple(value)
+            # Share the buffer; the component count follows the data shape (scalar, vector, tensor)
+            var_array = self._exportArray(var_name, self._extractField(var_data, num_points))
 
             target.AddArray(var_array)
 
         # Write the PolyData mesh to .vtp
         writer = vtk.vtkXMLPolyDataWriter()
         writer.SetFileName(output_file)
-        writer.SetInputData(self.mesh)
+        self._configureWriter(writer)
+        writer.SetInputData(dataset)
         writer.Write()
 
         print(f"PolyData mesh written to {output_file}")
 
     def writeVTS(self, output_dir, variables, time=None, step=None):
+        if not self._isOutputStep(step):
+            return
         os.makedirs(output_dir, exist_ok=True)
         pvd_file = os.path.join(output_dir, os.path.basename(output_dir) + '.pvd')
-
-        # Create new PVD file if it doesn't exist
-        if not os.path.exists(pvd_file):
-            with open(pvd_file, 'w') as f:
-                f.write('<VTKFile type="Collection" version="0.1">\n')
-                f.write('  <Collection>\n')
-                f.write('  </Collection>\n')
-                f.write('</VTKFile>\n')
+        collection = PVDCollection(pvd_file)
 
         time = 0.0 if time is None else time
         step = 0 if step is None else step
@@ -183,12 +394,314 @@ class MeshWriter1D(MeshWriter):
         vtp_file = os.path.join(output_dir, f"output_{step:04d}.vtp")
         self._writeSingleVTP(vtp_file, variables)
 
-        # Update the PVD file with the new VTP entry
-        with open(pvd_file, 'r+') as f:
-            lines = f.readlines()
-            insert_index = len(lines) - 2
-            lines.insert(insert_index, f'    <DataSet timestep="{time}" file="{os.path.basename(vtp_file)}"/>\n')
-            f.seek(0)
-            f.writelines(lines)
+        # Append the new VTP entry to the PVD file
+        collection.append(os.path.basename(vtp_file), time)
 
         print(f"Updated PVD file: {pvd_file}")
+
+
+class AsyncMeshWriter:
+    """
+    Writes time-series output on a background thread so the simulation does not wait on disk.
+
+    Snapshots are copied when they are submitted, so the caller may keep updating its arrays. The queue is
+    bounded: when the background thread falls behind, writeVTS blocks until a slot frees up instead of
+    letting pending snapshots pile up in memory. Errors raised while writing are re-raised on the next call.
+    """
+    def __init__(self, writer, maxQueueSize=2):
+        """
+        Start the background writer thread.
+
+        Args:
+            writer (MeshWriter): Writer that performs the actual output.
+            maxQueueSize (int): Number of snapshots that may wait to be written.
+        """
+        self.writer = writer
+        self._queue = queue.Queue(maxsize=max(1, int(maxQueueSize)))
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="AsyncMeshWriter", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                if self._error is None:
+                    self.writer.writeVTS(*task)
+            except Exception as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _raiseError(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Background output writer failed.") from error
+
+    def writeVTS(self, output_dir, variables, time=None, step=None):
+        """
+        Queue a snapshot for writing. Blocks while the queue is full.
+
+        Args:
+            output_dir (str): Directory to save the output file and PVD file.
+            variables (dict): Dictionary of variables for the timestep; the arrays are copied.
+            time (float, optional): Time value for the current timestep.
+            step (int, optional): Step index for naming the output file.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot write to a closed AsyncMeshWriter.")
+        self._raiseError()
+        snapshot = {name: np.array(data, copy=True) for name, data in variables.items()}
+        self._queue.put((output_dir, snapshot, time, step))
+
+    def flush(self):
+        """
+        Block until every queued snapshot has been written.
+        """
+        self._queue.join()
+        self._raiseError()
+
+    def close(self):
+        """
+        Write the remaining snapshots and stop the background thread.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        self._raiseError()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class XDMFWriter:
+    """
+    Time-series writer storing the mesh geometry once and every field as a chunked, compressed HDF5 dataset
+    with time as its first axis, plus an XDMF sidecar so ParaView can open the series.
+
+    Each step appends one row to the dataset of every field; a field first written at a later step records
+    that step in its 'firstStep' attribute. Datasets are chunked per step, so reading one field or a window
+    of steps only touches the chunks of that field and window.
+    """
+    COMPRESSORS = ("none", "gzip", "lzf")
+    # HDF5 gzip is zlib's deflate, so the VTK compressor name maps onto it
+    COMPRESSOR_ALIASES = {"zlib": "gzip"}
+    CHUNK_ENTRIES = 2 ** 17
+    XDMF_HEADER = ('<?xml version="1.0"?>\n<Xdmf Version="3.0">\n  <Domain>\n'
+                   '    <Grid Name="TimeSeries" GridType="Collection" CollectionType="Temporal">\n')
+    XDMF_FOOTER = '    </Grid>\n  </Domain>\n</Xdmf>\n'
+
+    def __init__(self, mesh, compressor="gzip", compressionLevel=None, precision="float64", writeFrequency=1):
+        """
+        Initialize with a StructuredMesh instance.
+
+        Args:
+            mesh (StructuredMesh): The structured mesh to write.
+            compressor (str): "none", "gzip" (or its alias "zlib") or "lzf".
+            compressionLevel (int, optional): gzip level from 1 (fastest) to 9 (smallest).
+            precision (str): "float64" or "float32" storage of the fields.
+            writeFrequency (int): Only steps that are a multiple of this value are written.
+
+        Raises:
+            ImportError: If h5py is not installed.
+        """
+        if h5py is None:
+            raise ImportError("The XDMF output backend requires h5py.")
+        if not isinstance(mesh, StructuredMesh):
+            raise TypeError("The provided mesh must be an instance of StructuredMesh.")
+        compressor = self.COMPRESSOR_ALIASES.get(compressor, compressor)
+        if compressor not in self.COMPRESSORS:
+            raise ValueError(
+                f"Unsupported compressor '{compressor}' for the xdmf format. "
+                f"Choose from {', '.join(self.COMPRESSORS)} or zlib, an alias of gzip."
+            )
+        if precision not in MeshWriter.PRECISIONS:
+            raise ValueError(f"Unsupported precision '{precision}'. Choose from {', '.join(MeshWriter.PRECISIONS)}.")
+
+        self.mesh = mesh
+        self.compressor = compressor
+        self.compressionLevel = compressionLevel
+        self.dtype = MeshWriter.PRECISIONS[precision][0]
+        self.writeFrequency = max(1, int(writeFrequency))
+        self._file = None
+        self._path = None
+
+    def _open(self, output_dir):
+        """
+        Open (or continue) the HDF5 file of an output directory and write the geometry on first use.
+        """
+        path = os.path.join(output_dir, os.path.basename(output_dir) + '.h5')
+        if self._path == path:
+            return
+        self.close()
+        os.makedirs(output_dir, exist_ok=True)
+        self._file = h5py.File(path, 'a')
+        self._path = path
+
+        if 'mesh' not in self._file:
+            group = self._file.create_group('mesh')
+            group.create_dataset('points', data=self.mesh.pointCoordinates)
+            if isinstance(self.mesh, StructuredMesh1D):
+                group.create_dataset('connectivity', data=self.mesh._computeCellPoints())
+            self._file.create_dataset('time', shape=(0,), maxshape=(None,), dtype=np.float64, chunks=(1024,))
+            self._file.create_group('fields')
+
+    def _fieldDataset(self, name, data, index):
+        """
+        Return the resizable dataset of a field, creating it on first use at timestep ``index``.
+        """
+        fields = self._file['fields']
+        if name not in fields:
+            rows = min(data.shape[0], self.CHUNK_ENTRIES)
+            compression = {} if self.compressor == "none" else {'compression': self.compressor}
+            if self.compressor == "gzip" and self.compressionLevel is not None:
+                compression['compression_opts'] = int(self.compressionLevel)
+            fields.create_dataset(
+                name, shape=(0,) + data.shape, maxshape=(None,) + data.shape, dtype=self.dtype,
+                chunks=(1, rows) + data.shape[1:], shuffle=self.compressor != "none", **compression
+            )
+            fields[name].attrs['firstStep'] = index
+        dataset = fields[name]
+        if dataset.shape[1:] != data.shape:
+            raise ValueError(f"Field '{name}' changed shape from {dataset.shape[1:]} to {data.shape}.")
+        return dataset
+
+    def writeVTS(self, output_dir, variables, time=None, step=None):
+        """
+        Append one timestep to the HDF5 file of the output directory and refresh the XDMF sidecar.
+
+        Args:
+            output_dir (str): Directory holding the .h5 and .xdmf files.
+            variables (dict): Dictionary of point or cell variables for the timestep.
+            time (float, optional): Time value for the current timestep. Defaults to 0.0 for steady-state.
+            step (int, optional): Step index, checked against the write frequency. Stored steps are numbered
+                in the order they are written.
+        """
+        if (0 if step is None else step) % self.writeFrequency:
+            return
+        self._open(output_dir)
+        num_points = self.mesh.GetNumberOfPoints()
+        num_cells = self.mesh.GetNumberOfCells()
+
+        times = self._file['time']
+        index = times.shape[0]
+        for var_name, var_data in variables.items():
+            var_data = np.asarray(var_data)
+            if var_data.shape[0] not in (num_points, num_cells):
+                raise ValueError(
+                    f"Mismatch between '{var_name}' size and mesh. "
+                    f"Expected {num_points} for points or {num_cells} for cells."
+                )
+            dataset = self._fieldDataset(var_name, var_data, index)
+            row = index - dataset.attrs['firstStep']
+            dataset.resize(row + 1, axis=0)
+            dataset[row] = var_data
+
+        # keep every field one row per timestep; fields missing from this step are filled with NaN
+        for var_name, dataset in self._file['fields'].items():
+            if var_name not in variables:
+                row = index - dataset.attrs['firstStep']
+                dataset.resize(row + 1, axis=0)
+                dataset[row] = np.nan
+
+        times.resize(index + 1, axis=0)
+        times[index] = 0.0 if time is None else time
+        self._file.flush()
+        self._writeXDMF()
+
+    def _gridXML(self, index, time):
+        """
+        Return the XDMF grid of one stored timestep, describing its fields as hyperslabs of the field datasets.
+        """
+        h5_name = os.path.basename(self._path)
+        num_points = self._file['mesh/points'].shape[0]
+
+        if isinstance(self.mesh, StructuredMesh1D):
+            num_cells = self._file['mesh/connectivity'].shape[0]
+            gridShapes = {"Node": (num_points,), "Cell": (num_cells,)}
+            topology = (
+                f'<Topology TopologyType="Polyline" NodesPerElement="2" NumberOfElements="{num_cells}">'
+                f'<DataItem Dimensions="{num_cells} 2" NumberType="Int" Precision="8" Format="HDF">'
+                f'{h5_name}:/mesh/connectivity</DataItem></Topology>'
+            )
+        else:
+            nx, ny, nz = self.mesh.divisions
+            # structured grid readers expect attributes shaped like the grid, slowest axis first
+            gridShapes = {"Node": (nz + 1, ny + 1, nx + 1), "Cell": (nz, ny, nx)}
+            topology = f'<Topology TopologyType="3DSMesh" Dimensions="{nz + 1} {ny + 1} {nx + 1}"/>'
+        geometry = (
+            f'<Geometry GeometryType="XYZ"><DataItem Dimensions="{num_points} 3" NumberType="Float" '
+            f'Precision="8" Format="HDF">{h5_name}:/mesh/points</DataItem></Geometry>'
+        )
+        attributeTypes = {1: "Scalar", 3: "Vector", 9: "Tensor"}
+
+        attributes = []
+        for name, dataset in self._file['fields'].items():
+            row = index - dataset.attrs['firstStep']
+            if row < 0:
+                continue
+            shape = dataset.shape[1:]
+            components = shape[1] if len(shape) > 1 else 1
+            center = "Node" if shape[0] == num_points else "Cell"
+            dims = " ".join(str(n) for n in gridShapes[center] + shape[1:])
+            slab = (f'{row} {" ".join(["0"] * len(shape))} '
+                    f'1 {" ".join(["1"] * len(shape))} '
+                    f'1 {" ".join(str(n) for n in shape)}')
+            attributes.append(
+                f'<Attribute Name="{name}" AttributeType="{attributeTypes.get(components, "Matrix")}" Center="{center}">'
+                f'<DataItem ItemType="HyperSlab" Dimensions="{dims}" Type="HyperSlab">'
+                f'<DataItem Dimensions="3 {len(shape) + 1}" Format="XML">{slab}</DataItem>'
+                f'<DataItem Dimensions="{" ".join(str(n) for n in dataset.shape)}" NumberType="Float" '
+                f'Precision="{dataset.dtype.itemsize}" Format="HDF">{h5_name}:/fields/{name}</DataItem>'
+                f'</DataItem></Attribute>'
+            )
+        return (
+            f'      <Grid Name="step_{index:04d}" GridType="Uniform"><Time Value="{time}"/>'
+            f'{topology}{geometry}{"".join(attributes)}</Grid>\n'
+        )
+
+    def _writeXDMF(self):
+        """
+        Add the latest timestep to the XDMF sidecar.
+
+        Like a PVDCollection, the sidecar always ends with its closing tags and only the new grid is written in
+        front of them, so the cost of a step does not depend on how many came before it. A missing sidecar,
+        e.g. when continuing an existing HDF5 file, is written once with every stored timestep.
+        """
+        times = self._file['time']
+        xdmf_path = os.path.splitext(self._path)[0] + '.xdmf'
+        if not os.path.exists(xdmf_path):
+            grids = "".join(self._gridXML(index, time) for index, time in enumerate(times[:]))
+            with open(xdmf_path + '.tmp', 'w') as f:
+                f.write(self.XDMF_HEADER + grids + self.XDMF_FOOTER)
+            os.replace(xdmf_path + '.tmp', xdmf_path)
+            return
+
+        index = times.shape[0] - 1
+        entry = self._gridXML(index, times[index]).encode()
+        with open(xdmf_path, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            footer = self.XDMF_FOOTER.encode()
+            f.seek(size - len(footer))
+            if f.read() != footer:
+                raise ValueError(f"No closing tags found in {xdmf_path}.")
+            f.seek(size - len(footer))
+            f.write(entry + footer)
+            f.truncate()
+            f.flush()
+
+    def close(self):
+        """
+        Close the HDF5 file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._path = None
@@ -21,6 +21,14 @@ def main():
         default='config.yaml', 
         help="Path to the YAML input file"
     )
+    parser.add_argument(
+        '--restart',
+        type=str,
+        nargs='?',
+        const='latest',
+        default=None,
+        help="Restart from a checkpoint directory, or from the latest checkpoint if no path is given"
+    )
     
     args = parser.parse_args()
     input_path = args.input
@@ -33,7 +41,7 @@ def main():
     
     # Instantiate and run the FVM simulation
     fvm_simulation = FVM(config)
-    fvm_simulation.simulate()
+    fvm_simulation.simulate(restart=args.restart)
 
 if __name__ == "__main__":
     main()
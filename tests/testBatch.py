@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+
+from fame.FVM.mesh import StructuredMesh
+from fame.FVM.property import MaterialProperty
+from fame.FVM.batch import BatchedHeatDiffusion1D
+from fame.FVM.discretization import Discretization
+from fame.FVM.boundaryCondition import BoundaryCondition
+
+
+class TestBatchedHeatDiffusion1D(unittest.TestCase):
+
+    def setUp(self):
+        self.bounds = (0, 1)
+        self.divisions = [10]
+        self.batch = BatchedHeatDiffusion1D(self.bounds, self.divisions)
+
+    def _solveMesh(self, conductivity, left, right, h, ambient, volumetricSource):
+        """
+        Solve a single rod through the mesh based discretization.
+        """
+        mesh = StructuredMesh(self.bounds, self.divisions)
+        prop = MaterialProperty('Rod')
+        prop.add_property('thermalConductivity', baseValue=conductivity, referenceTemperature=298.15, method='constant')
+        bc = BoundaryCondition(mesh, convectionCoefficient=h, ambientTemperature=ambient, volumetricSource=volumetricSource)
+        bc.applyBoundaryCondition(x=self.bounds[0], value=left)
+        bc.applyBoundaryCondition(x=self.bounds[1], value=right)
+        Discretization(mesh, None, prop, bc).discretizeHeatDiffusion()
+        return np.linalg.solve(mesh.A.toarray(), mesh.b)
+
+    def testMatchesMeshDiscretization(self):
+        """
+        Test that every rod of the batch matches the mesh based discretization.
+        """
+        conductivity = np.array([1000.0, 200.0, 15.0])
+        left = np.array([100.0, 300.0, 500.0])
+        right = np.array([500.0, 300.0, 100.0])
+        h = np.array([15.0, 0.0, 5.0])
+        volumetricSource = np.array([0.0, 1e3, 50.0])
+
+        temperatures = self.batch.solve(conductivity, leftValue=left, rightValue=right, convectionCoefficient=h,
+                                        ambientTemperature=298, volumetricSource=volumetricSource)
+        self.assertEqual(temperatures.shape, (3, 10))
+        for i in range(3):
+            expected = self._solveMesh(conductivity[i], left[i], right[i], h[i], 298, volumetricSource[i])
+            np.testing.assert_allclose(temperatures[i], expected, rtol=1e-10)
+
+    def testPerCellSources(self):
+        """
+        Test that (batch, n) source arrays are applied cell by cell.
+        """
+        source = np.zeros((2, 10))
+        source[1, 4] = 100.0
+        temperatures = self.batch.solve([50.0, 50.0], leftValue=300, rightValue=300, independentSource=source)
+        np.testing.assert_allclose(temperatures[0], 300.0)
+        self.assertEqual(np.argmax(temperatures[1]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
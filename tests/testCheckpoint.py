@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from fame.FVM.checkpoint import Checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.checkpoint = Checkpoint(self.directory, keep=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def testSaveAndLoad(self):
+        """
+        Test that arrays and metadata round-trip and that arrays are memory-mapped on load.
+        """
+        solution = np.linspace(0, 1, 11)
+        path = self.checkpoint.save(3, {'solution': solution, 'ids': np.arange(4)}, {'time': 1.5})
+
+        metadata, arrays = Checkpoint.load(path)
+        self.assertEqual(metadata['step'], 3)
+        self.assertEqual(metadata['time'], 1.5)
+        self.assertIsInstance(arrays['solution'], np.memmap)
+        np.testing.assert_array_equal(arrays['solution'], solution)
+        np.testing.assert_array_equal(arrays['ids'], np.arange(4))
+
+    def testKeepsLatestCheckpoints(self):
+        """
+        Test that only the most recent checkpoints are kept and incomplete ones are ignored.
+        """
+        for step in range(4):
+            self.checkpoint.save(step, {'solution': np.full(3, step)})
+        os.makedirs(os.path.join(self.directory, 'checkpoint_000009.tmp'))
+
+        self.assertEqual([os.path.basename(p) for p in self.checkpoint.list()], ['checkpoint_000002', 'checkpoint_000003'])
+        metadata, arrays = Checkpoint.load(self.checkpoint.latest())
+        self.assertEqual(metadata['step'], 3)
+
+        with self.assertRaises(FileNotFoundError):
+            Checkpoint.load(os.path.join(self.directory, 'checkpoint_000009.tmp'))
+
+
+if __name__ == '__main__':
+    unittest.main()
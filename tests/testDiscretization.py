@@ -86,3 +86,54 @@ class TestDiscretization(unittest.TestCase):
         self.solver.plotSparseMatrix(self.mesh.A, filename=outputFilename)
 
         print("Sparse matrix visualization saved as 'test_matrix_plot.jpeg'.")
+
+    def testVectorizedAssemblyMatchesLoop(self):
+        """
+        Test that the vectorized COO assembly reproduces the reference cell-by-cell loop.
+        """
+        bounds, divisions = ((0, 2), (0, 1.5), (0, 1)), (4, 3, 2)
+        systems = []
+        for assemble in ('discretizeHeatDiffusion', 'discretizeHeatDiffusionLoop'):
+            mesh = StructuredMesh(bounds, divisions)
+            bc = BoundaryCondition(mesh, convectionCoefficient=15, ambientTemperature=298, dependentSource=-2, independentSource=1, volumetricSource=3)
+            bc.applyBoundaryCondition(x=0, value=300)
+            bc.applyBoundaryCondition(z=1, value=350)
+            getattr(Discretization(mesh, None, self.prop, bc), assemble)()
+            systems.append((mesh.A.toarray(), mesh.b.copy()))
+
+        (A_vectorized, b_vectorized), (A_loop, b_loop) = systems
+        np.testing.assert_allclose(A_vectorized, A_loop, rtol=1e-12)
+        np.testing.assert_allclose(b_vectorized, b_loop, rtol=1e-12)
+
+    def testVectorizedAssemblyMatchesLoop1D(self):
+        """
+        Test that the vectorized assembly reproduces the reference loop on a 1D mesh with a non-unit cross-section.
+        """
+        systems = []
+        for assemble in ('discretizeHeatDiffusion', 'discretizeHeatDiffusionLoop'):
+            mesh = StructuredMesh([0, 3], [6], faceArea=0.5)
+            bc = BoundaryCondition(mesh, convectionCoefficient=15, ambientTemperature=298, volumetricSource=3)
+            bc.applyBoundaryCondition(x=0, value=300)
+            getattr(Discretization(mesh, None, self.prop, bc), assemble)()
+            systems.append((mesh.A.toarray(), mesh.b.copy()))
+
+        (A_vectorized, b_vectorized), (A_loop, b_loop) = systems
+        np.testing.assert_allclose(A_vectorized, A_loop, rtol=1e-12)
+        np.testing.assert_allclose(b_vectorized, b_loop, rtol=1e-12)
+
+    def testReassemblyReusesSparsityPattern(self):
+        """
+        Test that repeated assembly keeps the CSR structure and only updates the matrix values.
+        """
+        self.discretization.discretizeHeatDiffusion()
+        A_first = self.mesh.A
+        indices, indptr, data = A_first.indices.copy(), A_first.indptr.copy(), A_first.data.copy()
+
+        self.prop.add_property('thermalConductivity', baseValue=400, referenceTemperature=298.15, method='constant')
+        self.discretization.discretizeHeatDiffusion()
+
+        self.assertIs(self.mesh.A, A_first)
+        np.testing.assert_array_equal(self.mesh.A.indices, indices)
+        np.testing.assert_array_equal(self.mesh.A.indptr, indptr)
+        np.testing.assert_allclose(self.mesh.A.data, 2 * data)
+        self.assertIs(self.mesh.getSparsityPattern(), self.mesh.getSparsityPattern())
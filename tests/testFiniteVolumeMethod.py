@@ -1,5 +1,11 @@
+import io
 import unittest
+import unittest.mock
 import os
+import copy
+import shutil
+import tempfile
+import time
 import yaml
 import numpy as np
 import scipy.sparse as sp
@@ -8,6 +14,9 @@ from vtkmodules.util import numpy_support
 
 from fame.FVM.finiteVolumeMethod import FVM
 from fame.FVM.solver import Solver
+from fame.FVM.checkpoint import Checkpoint
+from fame.FVM.stencil import StencilOperator
+from fame.FVM.visualization import PVDCollection, h5py
 
 
 class TestDiscretizationBase(unittest.TestCase):
@@ -123,6 +132,80 @@ class TestDiscretizationSmall(TestDiscretization):
         self.assertTrue(os.path.exists(output_path))
         print("Full simulation test passed.")
 
+    def test_initialGuess(self):
+        """
+        Test that a coarse-mesh initial guess and a warm start reduce the iterations of the Krylov solve.
+        """
+        iterations = {}
+        for name, options in (('cold', {}), ('coarse', {'coarseInitialGuess': 2})):
+            config = copy.deepcopy(self.config)
+            config['simulation']['solver'].update(options, tolerance=1e-8, preconditioner='none')
+            fvm = FVM(config)
+            fvm.meshGeneration()
+            fvm.applyBoundaryConditions()
+            fvm.loadMaterialProperty()
+            fvm.discretize()
+            fvm.solveEquations()
+            self.assertTrue(fvm.solution.converged)
+            iterations[name] = fvm.solution.iterations
+        self.assertLess(iterations['coarse'], iterations['cold'])
+
+        fvm.config['simulation']['solver']['warmStart'] = True
+        fvm.solveEquations()
+        self.assertTrue(fvm.solver.warmStart)
+        self.assertLessEqual(fvm.solution.iterations, 1)
+
+        # a restored solution seeds the warm start of a new solver
+        restored = FVM(fvm.config)
+        restored.meshGeneration()
+        restored.applyBoundaryConditions()
+        restored.loadMaterialProperty()
+        restored.discretize()
+        restored.solution = (np.array(fvm.solution[0]), fvm.solution[1], fvm.solution[2])
+        restored.solveEquations()
+        self.assertLessEqual(restored.solution.iterations, 1)
+
+    def test_asynchronousOutputAcrossSteps(self):
+        """
+        Test that one background writer serves every step of a run, writing a step while the next is solved.
+        """
+        config = copy.deepcopy(self.config)
+        directory = tempfile.mkdtemp()
+        config['simulation']['visualization'].update(path=directory, asynchronous=True)
+        config['simulation']['timeControl'] = {'numberOfSteps': 3}
+        fvm = FVM(config)
+        solveEquations, visualizeResults = fvm.solveEquations, fvm.visualizeResults
+        pendingWhileSolving, writers = [], []
+
+        def solve():
+            if fvm.output is not None:
+                pendingWhileSolving.append(fvm.output._queue.unfinished_tasks)
+            solveEquations()
+
+        def visualize():
+            visualizeResults()
+            writers.append(type(fvm.output).__name__)
+
+        append = PVDCollection.append
+
+        def slowAppend(collection, *args, **kwargs):
+            time.sleep(0.2)
+            append(collection, *args, **kwargs)
+
+        fvm.solveEquations, fvm.visualizeResults = solve, visualize
+        try:
+            with unittest.mock.patch.object(PVDCollection, 'append', autospec=True, side_effect=slowAppend):
+                fvm.simulate()
+            self.assertEqual(writers, ['AsyncMeshWriter'] * 3)
+            self.assertEqual(len(pendingWhileSolving), 2)
+            self.assertTrue(all(pending > 0 for pending in pendingWhileSolving))
+            self.assertIsNone(fvm.output)
+            self.assertIsNone(fvm.visualization)
+            for step in range(3):
+                self.assertTrue(os.path.exists(os.path.join(directory, f'output_{step:04d}.vts')))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
 
 class TestDiscretization1D(unittest.TestCase):
     @classmethod
@@ -177,6 +260,150 @@ class TestDiscretization1D(unittest.TestCase):
 
         print("Full 1D simulation test passed.")
 
+    def test_noInitialGuessForBandedSolver(self):
+        """
+        Test that no coarse-mesh initial guess is computed for the banded solver, which ignores it.
+        """
+        config = copy.deepcopy(self.config)
+        config['simulation']['solver']['coarseInitialGuess'] = 2
+        fvm = FVM(config)
+        fvm.meshGeneration()
+        with unittest.mock.patch.object(fvm, '_coarseInitialGuess') as coarseInitialGuess:
+            self.assertIsNone(fvm._initialGuess(config['simulation']['solver']))
+        coarseInitialGuess.assert_not_called()
+
+    def test_bandedOverrideIsLogged(self):
+        """
+        Test that the banded solver replacing the configured method is reported, and that 'banded: false'
+        keeps the configured method.
+        """
+        for banded, expected in ((True, "instead of the configured method"), (False, None)):
+            config = copy.deepcopy(self.config)
+            config['simulation']['solver'].update(method='cg', banded=banded)
+            fvm = FVM(config)
+            fvm.meshGeneration()
+            fvm.applyBoundaryConditions()
+            fvm.loadMaterialProperty()
+            fvm.discretize()
+            with unittest.mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+                fvm.solveEquations()
+            if expected:
+                self.assertIn(expected, stdout.getvalue())
+                self.assertEqual(fvm.solution.iterations, 0)
+            else:
+                self.assertNotIn("instead of the configured method", stdout.getvalue())
+                self.assertGreater(fvm.solution.iterations, 0)
+
+    def test_stepAndTime(self):
+        """
+        Test that a run writes its output at the current step and time, then advances both.
+        """
+        config = copy.deepcopy(self.config)
+        directory = tempfile.mkdtemp()
+        config['simulation']['visualization']['path'] = directory
+        config['simulation'].setdefault('timeControl', {})['timeStep'] = 0.5
+        try:
+            fvm = FVM(config)
+            fvm.step, fvm.time = 3, 1.5
+            fvm.simulate()
+            self.assertEqual((fvm.step, fvm.time), (4, 2.0))
+            self.assertTrue(os.path.exists(os.path.join(directory, 'output_0003.vtp')))
+            with open(os.path.join(directory, os.path.basename(directory) + '.pvd')) as f:
+                self.assertIn('timestep="1.5"', f.read())
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def test_checkpointRestart(self):
+        """
+        Test that a run restarted from its checkpoint restores the mesh, system and solution, and continues at
+        the next step without overwriting the checkpoint it was restored from.
+        """
+        config = copy.deepcopy(self.config)
+        directory = tempfile.mkdtemp()
+        config['simulation']['checkpoint'] = {'path': os.path.join(directory, 'checkpoints'), 'interval': 1}
+        config['simulation']['visualization']['path'] = os.path.join(directory, 'results')
+        checkpoints = Checkpoint(config['simulation']['checkpoint']['path'])
+        try:
+            fvm = FVM(config)
+            fvm.simulate()
+            first = checkpoints.latest()
+            self.assertIsNotNone(first)
+
+            restarted = FVM(config)
+            restarted.simulate(restart='latest')
+            np.testing.assert_array_equal(restarted.mesh.cellCentroids, fvm.mesh.cellCentroids)
+            np.testing.assert_allclose(restarted.mesh.A.toarray(), fvm.mesh.A.toarray())
+            np.testing.assert_allclose(restarted.solution[0], fvm.solution[0])
+            self.assertEqual(restarted.mesh.GetNumberOfPoints(), fvm.mesh.GetNumberOfPoints())
+
+            self.assertEqual(checkpoints.list(), [first, os.path.join(checkpoints.directory, 'checkpoint_000001')])
+            self.assertEqual(Checkpoint.load(checkpoints.latest())[0]['step'], 1)
+            self.assertEqual(restarted.step, 2)
+
+            # with an interval of 2, the restart at step 2 writes, the one at step 3 does not
+            config['simulation']['checkpoint']['interval'] = 2
+            for expected in ('checkpoint_000002', 'checkpoint_000002'):
+                FVM(config).simulate(restart='latest')
+                self.assertEqual(os.path.basename(checkpoints.latest()), expected)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    @unittest.skipIf(h5py is None, "h5py is not installed")
+    def test_readmeConfigurationWithXDMF(self):
+        """
+        Test that the README configuration runs with the xdmf format, mapping the zlib compressor onto gzip and
+        warning about the VTK-only settings.
+        """
+        readme = os.path.join(os.path.dirname(__file__), '..', 'README.md')
+        with open(readme) as f:
+            config = yaml.safe_load(f.read().split('```yaml')[1].split('```')[0])
+        directory = tempfile.mkdtemp()
+        config['simulation']['visualization'].update(path=os.path.join(directory, 'results'), format='xdmf')
+        config['simulation']['checkpoint']['path'] = os.path.join(directory, 'checkpoints')
+        try:
+            with self.assertWarnsRegex(UserWarning, 'encoding, region'):
+                FVM(config).simulate()
+            with h5py.File(os.path.join(directory, 'results', 'results.h5'), 'r') as f:
+                self.assertEqual(f['fields/temperature_cell'].compression, 'gzip')
+                self.assertEqual(f['fields/temperature_cell'].shape, (1, 5))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def test_restartWithSingleCheckpointKept(self):
+        """
+        Test a restart that keeps one checkpoint and steps on: the restored arrays are copied out of the pruned
+        checkpoint, the operator is reused without re-applying boundary conditions, and a changed matrix
+        format is discretized again.
+        """
+        config = copy.deepcopy(self.config)
+        directory = tempfile.mkdtemp()
+        config['simulation']['checkpoint'] = {'path': os.path.join(directory, 'checkpoints'), 'keep': 1}
+        config['simulation']['visualization']['path'] = os.path.join(directory, 'results')
+        checkpoints = Checkpoint(config['simulation']['checkpoint']['path'])
+        try:
+            fvm = FVM(config)
+            fvm.simulate()
+            metadata, _ = Checkpoint.load(checkpoints.latest())
+            self.assertEqual(metadata['solver']['operatorKey'], Solver.operatorKey(fvm.mesh.A))
+
+            config['simulation']['timeControl'] = {'numberOfSteps': 2}
+            restarted = FVM(config)
+            restarted.simulate(restart='latest')
+            self.assertIsNone(restarted.boundaryConditions)
+            self.assertFalse(any(isinstance(array, np.memmap) for array in restarted.mesh.getArrays().values()))
+            self.assertEqual([os.path.basename(path) for path in checkpoints.list()], ['checkpoint_000002'])
+            np.testing.assert_array_equal(restarted.mesh.cellCentroids, fvm.mesh.cellCentroids)
+            np.testing.assert_allclose(restarted.solution[0], fvm.solution[0])
+
+            config['simulation']['solver']['matrixFormat'] = 'matrixFree'
+            rediscretized = FVM(config)
+            rediscretized.simulate(restart='latest')
+            self.assertIsNotNone(rediscretized.boundaryConditions)
+            self.assertIsInstance(rediscretized.mesh.A, StencilOperator)
+            np.testing.assert_allclose(rediscretized.solution[0], fvm.solution[0])
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
     def test_materialProperties(self):
         # Explicitly call the method from the base class
         TestDiscretizationBase.test_materialProperties(self)
@@ -131,6 +131,61 @@ class TestStructuredMesh(unittest.TestCase):
             for boundary_face in cell_info['boundary_faces']:
                 self.assertIsInstance(boundary_face, int)            
 
+    def testFaceOwnership(self):
+        """
+        Test that face-owner and face-neighbour arrays are consistent with the per-cell connectivity.
+        """
+        self.assertEqual(len(self.mesh.faceOwner), len(self.mesh.faces))
+        self.assertTrue(np.all(self.mesh.faceOwner >= 0))
+
+        for cell_id, (neighbors, faces) in enumerate(zip(self.mesh.cellNeighbors, self.mesh.cellFaces)):
+            for neighbor_id, face_id in zip(neighbors, faces):
+                owner, neighbour = self.mesh.faceOwner[face_id], self.mesh.faceNeighbour[face_id]
+                self.assertIn(cell_id, (owner, neighbour))
+                if neighbor_id >= 0:
+                    self.assertEqual({owner, neighbour}, {cell_id, neighbor_id})
+                else:
+                    self.assertEqual(neighbour, -1)
+
+        d = self.divisions
+        expectedBoundaryFaces = 2 * (d[0] * d[1] + d[1] * d[2] + d[0] * d[2])
+        self.assertEqual(len(self.mesh.boundaryFaces), expectedBoundaryFaces)
+        self.assertEqual(len(self.mesh.interiorFaces) + len(self.mesh.boundaryFaces), len(self.mesh.faces))
+
+    def testFaceTable(self):
+        """
+        Test the array-backed face table and its dictionary-style views.
+        """
+        numFaces = len(self.mesh.faces)
+        self.assertEqual(self.mesh.faceConnectivity.shape, (numFaces, 4))
+        self.assertEqual(self.mesh.faceConnectivity.dtype, np.int32)
+        self.assertEqual(self.mesh.faceCentroids.shape, (numFaces, 3))
+        self.assertEqual(self.mesh.faceCentroids.dtype, np.float64)
+
+        d = self.divisions
+        expectedAxisCounts = [(d[0] + 1) * d[1] * d[2], d[0] * (d[1] + 1) * d[2], d[0] * d[1] * (d[2] + 1)]
+        self.assertEqual(np.bincount(self.mesh.faceAxis).tolist(), expectedAxisCounts)
+
+        # Face centers lie on the plane normal to the face axis
+        for face_id in (0, numFaces // 2, numFaces - 1):
+            points = np.array([self.mesh.GetPoint(pid) for pid in self.mesh.faces[face_id]])
+            np.testing.assert_array_almost_equal(points.mean(axis=0), self.mesh.faceCenters[face_id])
+            self.assertTrue(np.allclose(points[:, self.mesh.faceAxis[face_id]], points[0, self.mesh.faceAxis[face_id]]))
+
+        self.assertNotIn(numFaces, self.mesh.faces)
+        self.assertIsNone(self.mesh.getFaceById(numFaces))
+
+    def testSharedFacesMatchSharedCells(self):
+        """
+        Test that each shared face lies between the cell and the shared cell listed at the same position.
+        """
+        for cell_info in self.mesh.sharedCells:
+            for shared_cell, face_id in zip(cell_info['shared_cells'], cell_info['shared_faces']):
+                self.assertEqual(
+                    {self.mesh.faceOwner[face_id], self.mesh.faceNeighbour[face_id]},
+                    {cell_info['cell_id'], shared_cell}
+                )
+
     def testTriangleArea(self):
         """
         Test that the area of a triangle is computed correctly using the calculateArea method.
@@ -408,6 +463,91 @@ class TestStructuredMesh(unittest.TestCase):
             # Assert that the calculated volume matches the expected value
             self.assertAlmostEqual(volume, expected_volume, places=5, msg=f"Mismatch in volume for cell {cell_id}")
 
+    def testGeometryCache(self):
+        """
+        Test precomputed face areas, normals, distances and cell volumes on a mesh with anisotropic cells.
+        """
+        mesh = StructuredMesh([(0, 2), (0, 3), (0, 1)], [4, 3, 4])
+        dx, dy, dz = 0.5, 1.0, 0.25
+        expectedAreas = np.array([dy * dz, dx * dz, dx * dy])[mesh.faceAxis]
+        np.testing.assert_array_almost_equal(mesh.faceAreas, expectedAreas)
+        np.testing.assert_array_almost_equal(mesh.cellVolumes, np.full(mesh.GetNumberOfCells(), dx * dy * dz))
+
+        # Normals are unit vectors along the face axis pointing out of the owner cell
+        np.testing.assert_array_almost_equal(np.linalg.norm(mesh.faceNormals, axis=1), 1.0)
+        outward = mesh.faceCentroids - mesh.cellCentroids[mesh.faceOwner]
+        self.assertTrue(np.all(np.einsum('ij,ij->i', mesh.faceNormals, outward) > 0))
+
+        spacing = np.array([dx, dy, dz])[mesh.faceAxis]
+        isBoundary = mesh.faceNeighbour < 0
+        np.testing.assert_array_almost_equal(mesh.faceDistances, np.where(isBoundary, spacing / 2, spacing))
+
+    def testPointCoordinatesAndPlaneMasks(self):
+        """
+        Test the point coordinate array and the cached boundary plane masks against VTK.
+        """
+        coordinates = self.mesh.pointCoordinates
+        self.assertEqual(coordinates.shape, (self.mesh.GetNumberOfPoints(), 3))
+        for pid in (0, 7, self.mesh.GetNumberOfPoints() - 1):
+            np.testing.assert_allclose(coordinates[pid], self.mesh.GetPoint(pid), rtol=1e-6)
+
+        mask = self.mesh.getPointMaskOnPlane('y', self.bounds[1][1])
+        expected = [abs(self.mesh.GetPoint(pid)[1] - self.bounds[1][1]) <= 1e-6 for pid in range(len(coordinates))]
+        np.testing.assert_array_equal(mask, expected)
+        self.assertIs(mask, self.mesh.getPointMaskOnPlane(1, self.bounds[1][1]))
+
+    def testInterpolateCellValues(self):
+        """
+        Test that a linear cell field is transferred exactly between meshes inside the cell-center range.
+        """
+        coarse = StructuredMesh(self.bounds, [5, 5, 3])
+        fine = StructuredMesh(self.bounds, self.divisions)
+        linear = lambda points: 2.0 * points[:, 0] - points[:, 1] + 0.5 * points[:, 2]
+
+        values = coarse.interpolateCellValues(linear(coarse.cellCentroids), fine.cellCentroids)
+        lower = coarse.cellCentroids.min(axis=0)
+        upper = coarse.cellCentroids.max(axis=0)
+        inside = np.all((fine.cellCentroids >= lower) & (fine.cellCentroids <= upper), axis=1)
+        self.assertTrue(inside.any())
+        np.testing.assert_allclose(values[inside], linear(fine.cellCentroids)[inside], atol=1e-12)
+        self.assertEqual(values.shape, (fine.numCells,))
+
+    def testLazyVTKDataset(self):
+        """
+        Test that the VTK points are only built on demand and then match the NumPy point coordinates.
+        """
+        mesh = StructuredMesh(self.bounds, self.divisions)
+        self.assertEqual(vtk.vtkStructuredGrid.GetNumberOfPoints(mesh), 0)
+        self.assertEqual(mesh.GetNumberOfPoints(), 11 * 6 * 4)
+        self.assertEqual(mesh.GetNumberOfCells(), 10 * 5 * 3)
+        np.testing.assert_allclose(mesh.origin, [0, 0, 0])
+        np.testing.assert_allclose(mesh.spacing, [1, 1, 1])
+
+        self.assertIs(mesh.ensureVTKDataset(), mesh)
+        self.assertEqual(vtk.vtkStructuredGrid.GetNumberOfCells(mesh), mesh.numCells)
+        self.assertEqual(vtk.vtkStructuredGrid.GetBounds(mesh), mesh.GetBounds())
+        vtkPoints = np.array([vtk.vtkStructuredGrid.GetPoint(mesh, pid) for pid in range(mesh.GetNumberOfPoints())])
+        np.testing.assert_array_equal(vtkPoints, mesh.pointCoordinates)
+
+    def testCellToPointMatrix(self):
+        """
+        Test that the cached averaging operator matches averaging over the VTK cell point IDs.
+        """
+        mesh = StructuredMesh([(0, 2), (0, 3), (0, 1)], [4, 3, 2])
+        values = np.random.default_rng(0).random(mesh.GetNumberOfCells())
+
+        expected = np.zeros(mesh.GetNumberOfPoints())
+        counts = np.zeros(mesh.GetNumberOfPoints())
+        for cid in range(mesh.GetNumberOfCells()):
+            pointIds = mesh.GetCell(cid).GetPointIds()
+            for i in range(pointIds.GetNumberOfIds()):
+                expected[pointIds.GetId(i)] += values[cid]
+                counts[pointIds.GetId(i)] += 1
+
+        matrix = mesh.getCellToPointMatrix()
+        self.assertIs(matrix, mesh.getCellToPointMatrix())
+        np.testing.assert_allclose(matrix @ values, expected / counts)
+
     def testGetFacesByX(self):
         
         expectedCellFaces = self.divisions[1] * self.divisions[2]
@@ -588,6 +728,14 @@ class TestStructuredMesh1D(unittest.TestCase):
                 f"calculateArea() should return faceArea for face {face_id}."
             )
 
+    def testCellToPointMatrix(self):
+        """
+        Test that interior points average their two neighbouring cells and end points take their only cell.
+        """
+        values = np.arange(self.mesh.GetNumberOfCells(), dtype=float)
+        nodal = self.mesh.getCellToPointMatrix() @ values
+        np.testing.assert_allclose(nodal, np.concatenate([[values[0]], 0.5 * (values[:-1] + values[1:]), [values[-1]]]))
+
     def testGetFacesByX(self):
         """
         Test retrieval of face IDs by x-coordinate in 1D mesh.
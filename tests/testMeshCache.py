@@ -0,0 +1,108 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+import numpy as np
+
+from fame.FVM.mesh import StructuredMesh, StructuredMesh1D
+from fame.FVM.meshCache import MeshCache
+from fame.FVM.checkpoint import Checkpoint
+
+
+class TestMeshCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = MeshCache(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def testCacheHitMatchesGeneratedMesh(self):
+        """
+        Test that a cached mesh is memory-mapped and identical to a freshly generated one.
+        """
+        bounds, divisions = ((0, 2), (0, 1.5), (0, 1)), (4, 3, 5)
+        reference = StructuredMesh(bounds, divisions)
+        self.cache.getMesh(bounds, divisions)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+        mesh = self.cache.getMesh(bounds, divisions)
+        self.assertIsInstance(mesh.cellVolumes, np.memmap)
+        self.assertEqual(mesh.GetNumberOfCells(), reference.GetNumberOfCells())
+        for name, array in reference.getArrays().items():
+            np.testing.assert_array_equal(mesh.getArrays()[name], array)
+
+    def testKeyDependsOnParameters(self):
+        """
+        Test that bounds, divisions and mesh options all change the cache key.
+        """
+        key = self.cache.key((0, 1), [5], faceArea=1.0)
+        self.assertEqual(key, self.cache.key((0.0, 1.0), (5,), faceArea=1))
+        self.assertNotEqual(key, self.cache.key((0, 2), [5], faceArea=1.0))
+        self.assertNotEqual(key, self.cache.key((0, 1), [6], faceArea=1.0))
+        self.assertNotEqual(key, self.cache.key((0, 1), [5], faceArea=2.0))
+
+        mesh = self.cache.getMesh((0, 1), [5], faceArea=2.0)
+        self.assertIsInstance(mesh, StructuredMesh1D)
+        np.testing.assert_allclose(self.cache.getMesh((0, 1), [5], faceArea=2.0).faceAreas, 2.0)
+
+    def testLeastRecentlyUsedEviction(self):
+        """
+        Test that the least recently used mesh is evicted once the cache exceeds its size bound.
+        """
+        self.cache.MIN_AGE = 0.0
+        self.cache.getMesh((0, 1), [10])
+        entrySize = sum(size for _, size, _ in self.cache._entries())
+        self.cache.maxBytes = 2.5 * entrySize
+
+        self.cache.getMesh((0, 1), [11])
+        # make the first mesh the most recently used one
+        past = time.time() - 10
+        os.utime(os.path.join(self.directory, self.cache.key((0, 1), [11])), (past, past))
+        self.cache.getMesh((0, 1), [10])
+        self.cache.getMesh((0, 1), [12])
+
+        remaining = sorted(os.listdir(self.directory))
+        expected = sorted(self.cache.key((0, 1), [n]) for n in (10, 12))
+        self.assertEqual(remaining, expected)
+
+    def testRecentEntriesAreNotEvicted(self):
+        """
+        Test that entries used within MIN_AGE seconds survive eviction, since other processes may be loading them.
+        """
+        self.cache.getMesh((0, 1), [10])
+        self.cache.maxBytes = 0
+        self.cache.getMesh((0, 1), [11])
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    def testConcurrentlyPublishedEntryIsKept(self):
+        """
+        Test that a mesh published by another process while this one was generating it is loaded, and the
+        private copy discarded.
+        """
+        bounds, divisions = (0, 1), [8]
+        load = Checkpoint.load
+        other = MeshCache(self.directory)
+        lookups = []
+
+        def missThenPublish(path, *args, **kwargs):
+            # the first lookup misses, then another process publishes the same key before this one does
+            lookups.append(path)
+            if len(lookups) == 1:
+                with unittest.mock.patch.object(Checkpoint, 'load', load):
+                    other.getMesh(bounds, divisions)
+                raise FileNotFoundError(path)
+            return load(path, *args, **kwargs)
+
+        with unittest.mock.patch.object(Checkpoint, 'load', side_effect=missThenPublish):
+            mesh = self.cache.getMesh(bounds, divisions)
+
+        self.assertIsInstance(mesh.cellVolumes, np.memmap)
+        self.assertEqual(os.listdir(self.directory), [self.cache.key(bounds, divisions)])
+
+
+if __name__ == '__main__':
+    unittest.main()
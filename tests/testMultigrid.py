@@ -0,0 +1,114 @@
+import unittest
+import numpy as np
+import scipy.sparse as sp
+
+from fame.FVM.mesh import StructuredMesh
+from fame.FVM.property import MaterialProperty
+from fame.FVM.solver import Solver
+from fame.FVM.multigrid import GeometricMultigrid
+from fame.FVM.discretization import Discretization
+from fame.FVM.boundaryCondition import BoundaryCondition
+
+
+class TestGeometricMultigrid(unittest.TestCase):
+
+    def setUp(self):
+        self.prop = MaterialProperty('Aluminum')
+        self.prop.add_property('thermalConductivity', baseValue=200, referenceTemperature=298.15, method='constant')
+
+    def _discretize(self, divisions, matrixFormat='csr', bounds=((0, 2), (0, 1.5), (0, 1))):
+        mesh = StructuredMesh(bounds, divisions)
+        bc = BoundaryCondition(mesh, convectionCoefficient=15, ambientTemperature=298)
+        bc.applyBoundaryCondition(x=0, value=300)
+        Discretization(mesh, None, self.prop, bc).discretizeHeatDiffusion(matrixFormat=matrixFormat)
+        return mesh, mesh.A, mesh.b.copy()
+
+    def testAxisProlongation(self):
+        """
+        Test that the prolongation reproduces constants and linear fields away from the ends.
+        """
+        for n in (8, 9):
+            P = GeometricMultigrid._axisProlongation(n)
+            self.assertEqual(P.shape, (n, (n + 1) // 2))
+            np.testing.assert_allclose(P @ np.ones(P.shape[1]), 1.0)
+
+        P = GeometricMultigrid._axisProlongation(8).toarray()
+        coarseCenters = 2.0 * np.arange(4) + 1.0
+        np.testing.assert_allclose((P @ coarseCenters)[1:-1], (np.arange(8) + 0.5)[1:-1])
+
+    def testIterationsIndependentOfMeshSize(self):
+        """
+        Test that the V-cycle solves the system and needs about the same number of cycles on finer grids.
+        """
+        iterations = []
+        for divisions in ((8, 6, 4), (16, 12, 8), (32, 24, 16)):
+            mesh, A, b = self._discretize(divisions)
+            multigrid = GeometricMultigrid.fromMesh(A, mesh)
+            solution, iteration = multigrid.solve(b, rtol=1e-8)
+            self.assertLessEqual(np.linalg.norm(A @ solution - b), 1e-8 * np.linalg.norm(b))
+            iterations.append(iteration)
+        self.assertGreater(multigrid.numLevels, 2)
+        self.assertLessEqual(max(iterations) - min(iterations), 2)
+
+    def testAnisotropicCells(self):
+        """
+        Test that semi-coarsening keeps the number of cycles bounded on cells with an aspect ratio of 4, with the
+        spacing taken from the mesh or estimated from the operator.
+        """
+        bounds = ((0, 2), (0, 1), (0, 0.5))
+        iterations = []
+        for n in (8, 16, 32):
+            mesh, A, b = self._discretize((n, n, n), bounds=bounds)
+            multigrid = GeometricMultigrid.fromMesh(A, mesh)
+            self.assertEqual(multigrid.gridShapes[1], (n, n, n // 2))
+            solution, iteration = multigrid.solve(b, rtol=1e-8)
+            self.assertLessEqual(np.linalg.norm(A @ solution - b), 1e-8 * np.linalg.norm(b))
+            iterations.append(iteration)
+        self.assertLessEqual(max(iterations), 20)
+        self.assertLessEqual(max(iterations) - min(iterations), 2)
+
+        estimated = GeometricMultigrid(A, mesh.divisions)
+        self.assertEqual(estimated.gridShapes, multigrid.gridShapes)
+
+    def testSolverMethodAndPreconditioner(self):
+        """
+        Test multigrid as a Solver method and as a preconditioner for the scipy and petsc backends.
+        """
+        mesh, A, b = self._discretize((12, 9, 6))
+        reference = sp.linalg.spsolve(A.tocsc(), b)
+
+        solver = Solver(A, b, backend="scipy", gridShape=mesh.divisions,
+                        preconditionerOptions={"multigrid": {"smoother": "gaussSeidel"}})
+        solution, err, iterations = solver.solve(method="multigrid")
+        np.testing.assert_allclose(solution, reference, rtol=1e-8)
+        self.assertEqual(solver._getMultigrid().smoother, "gaussSeidel")
+
+        for backend in ("scipy", "petsc"):
+            solver = Solver(A, b, backend=backend, gridShape=mesh.divisions)
+            solution, err, info = solver.solve(method="cg", preconditioner="multigrid")
+            self.assertLessEqual(err, 1e-4 * np.linalg.norm(b))
+
+        _, A_stencil, b_stencil = self._discretize((12, 9, 6), 'matrixFree')
+        solution, err, info = Solver(A_stencil, b_stencil, backend="scipy").solve(method="bicgstab", preconditioner="multigrid")
+        np.testing.assert_allclose(solution, reference, rtol=1e-6)
+
+        with self.assertRaises(ValueError):
+            Solver(A, b, backend="scipy").solve(method="multigrid")
+
+    def testHierarchyFollowsMatrixValues(self):
+        """
+        Test that the cached hierarchy is rebuilt when the matrix values are overwritten in place.
+        """
+        mesh, A, b = self._discretize((8, 6, 4))
+        solver = Solver(A, b, backend="scipy", gridShape=mesh.divisions)
+        solver.solve(method="multigrid")
+        multigrid = solver._getMultigrid()
+
+        A.data *= 2.0
+        self.assertIsNot(solver._getMultigrid(), multigrid)
+        solution, err, iterations = solver.solve(method="multigrid", tolerance=1e-8)
+        self.assertLessEqual(err, 1e-8 * np.linalg.norm(b))
+
+
+if __name__ == '__main__':
+    unittest.main()
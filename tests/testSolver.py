@@ -1,8 +1,10 @@
+import io
 import unittest
+import unittest.mock
 import numpy as np
 import scipy.sparse as sp
 import os
-from fame.FVM.solver import Solver
+from fame.FVM.solver import Solver, SolverResult, solveTridiagonal, pyamg
 
 class TestSolver(unittest.TestCase):
 
@@ -138,3 +140,233 @@ class TestSolver(unittest.TestCase):
         self.assertTrue(os.path.exists(output_path))
         # Clean up the generated file
         os.remove(output_path)
+
+    # Banded Solver Tests
+    def test_banded_solver(self):
+        """Test the banded direct solver on a tridiagonal system with single and batched right-hand sides."""
+        n = 50
+        A = sp.diags([-np.ones(n - 1), 4 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csr")
+        b = np.random.rand(n)
+        solver = Solver(A, b, backend="scipy")
+        solution, err, info = solver.solve(method="banded")
+        np.testing.assert_allclose(A @ solution, b, atol=1e-10)
+
+        B = np.random.rand(n, 7)
+        solution, err, info = Solver(A, B, backend="petsc").solve(method="banded")
+        np.testing.assert_allclose(A @ solution, B, atol=1e-10)
+
+    def test_banded_layout_is_cached(self):
+        """Test that the banded layout is built once per sparsity pattern and follows in-place value updates."""
+        n = 50
+        A = sp.diags([-np.ones(n - 1), 4 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csr")
+        b = np.random.rand(n)
+        solver = Solver(A, b, backend="scipy")
+        solver.solve(method="banded")
+        layout = solver._banded
+
+        A.data *= 2.0
+        with unittest.mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            result = solver.solve(method="banded")
+        self.assertIs(solver._banded, layout)
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertTrue(result.converged)
+        np.testing.assert_allclose(A @ result.solution, b, atol=1e-10)
+
+    def test_banded_solver_rejects_wide_band(self):
+        """Test that the banded solver refuses matrices that are not tridiagonal."""
+        solver = Solver(self.A, self.b, backend="scipy")
+        with self.assertRaises(ValueError):
+            solver.solve(method="banded")
+
+    # ILU and AMG Preconditioner Tests
+    def test_scipy_solver_ilu_and_amg(self):
+        """Test the ILU and AMG preconditioners of the scipy backend and that they are cached on the solver."""
+        for preconditioner in ("ilu", "amg") if pyamg is not None else ("ilu",):
+            solver = Solver(self.A, self.b, backend="scipy", preconditionerOptions={"ilu": {"dropTolerance": 1e-6}})
+            solution, err, info = solver.solve(method="bicgstab", preconditioner=preconditioner)
+            np.testing.assert_allclose(self.A @ solution, self.b, atol=1e-10)
+
+            operator = solver._getPreconditioner(preconditioner)
+            solver.b = np.random.rand(10)
+            solution, err, info = solver.solve(method="gmres", preconditioner=preconditioner)
+            np.testing.assert_allclose(self.A @ solution, solver.b, atol=1e-10)
+            self.assertIs(solver._getPreconditioner(preconditioner), operator)
+
+    def test_preconditioner_cache_follows_matrix_values(self):
+        """Test that cached preconditioners are rebuilt when the matrix values are overwritten in place."""
+        A = self.A.tocsr().copy()
+        solver = Solver(A, self.b, backend="scipy")
+        solver.solve(method="bicgstab", preconditioner="ilu")
+        operator = solver._getPreconditioner("ilu")
+
+        A.data *= 2.0
+        self.assertIsNot(solver._getPreconditioner("ilu"), operator)
+        solution, err, info = solver.solve(method="bicgstab", preconditioner="ilu")
+        np.testing.assert_allclose(A @ solution, self.b, atol=1e-10)
+
+    def test_petsc_solver_ilu_and_amg(self):
+        """Test the PETSc ILU and GAMG preconditioners."""
+        for preconditioner in ("ilu", "amg"):
+            solver = Solver(self.A, self.b, backend="petsc")
+            solution, err, info = solver.solve(method="gmres", preconditioner=preconditioner)
+            self.assertTrue(err < 1e-4)
+
+    # Tolerance, Iteration Limit and Convergence History Tests
+    def test_solver_result_history(self):
+        """Test that the result unpacks as before and records the iteration count, history and wall time."""
+        n = 200
+        A = sp.diags([-np.ones(n - 1), 2.01 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csr")
+        b = np.random.rand(n)
+        for backend in ("scipy", "petsc"):
+            calls = []
+            result = Solver(A, b, backend=backend).solve(
+                method="cg", tolerance=1e-8, callback=lambda i, r: calls.append((i, r))
+            )
+            self.assertIsInstance(result, SolverResult)
+            solution, err, info = result
+            self.assertIs(result.solution, solution)
+            self.assertTrue(result.converged)
+            self.assertGreater(result.iterations, 0)
+            self.assertEqual(len(result.residualHistory), result.iterations)
+            self.assertEqual([i for i, _ in calls], list(range(1, result.iterations + 1)))
+            self.assertLessEqual(err, 1e-6 * np.linalg.norm(b))
+            self.assertGreaterEqual(result.wallTime, 0.0)
+
+            loose = Solver(A, b, backend=backend).solve(method="cg", tolerance=1e-2)
+            self.assertLess(loose.iterations, result.iterations)
+
+            limited = Solver(A, b, backend=backend).solve(method="cg", tolerance=1e-12, maxIterations=5)
+            self.assertEqual(limited.iterations, 5)
+            self.assertFalse(limited.converged)
+
+    def test_solver_history_is_opt_in(self):
+        """Test that iterations are counted without the residual history, which costs an extra product per step."""
+        n = 200
+        A = sp.diags([-np.ones(n - 1), 2.01 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csr")
+        b = np.random.rand(n)
+        products = []
+
+        def matvec(x):
+            products.append(1)
+            return A @ x
+
+        operator = sp.linalg.LinearOperator(A.shape, matvec=matvec, dtype=np.float64)
+        counted = Solver(operator, b, backend="scipy").solve(method="cg", tolerance=1e-8)
+        countedProducts = len(products)
+        self.assertGreater(counted.iterations, 0)
+        self.assertEqual(len(counted.residualHistory), 0)
+
+        del products[:]
+        recorded = Solver(operator, b, backend="scipy").solve(method="cg", tolerance=1e-8, recordHistory=True)
+        self.assertEqual(recorded.iterations, counted.iterations)
+        self.assertEqual(len(recorded.residualHistory), recorded.iterations)
+        self.assertEqual(len(products), countedProducts + recorded.iterations)
+
+        for backend in ("scipy", "petsc"):
+            result = Solver(A, b, backend=backend).solve(method="gmres", tolerance=1e-8)
+            self.assertGreater(result.iterations, 0)
+            self.assertEqual(len(result.residualHistory), 0)
+
+    def test_initial_guess(self):
+        """Test that an explicit x0 and the warm start mode reduce the iterations for every backend."""
+        n = 200
+        A = sp.diags([-np.ones(n - 1), 2.01 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csr")
+        b = np.random.rand(n)
+        exact = sp.linalg.spsolve(A.tocsc(), b)
+        for backend in ("scipy", "petsc"):
+            cold = Solver(A, b, backend=backend).solve(method="cg", tolerance=1e-8)
+            warm = Solver(A, b, backend=backend).solve(method="cg", tolerance=1e-8, x0=exact * (1 + 1e-6))
+            self.assertLess(warm.iterations, cold.iterations)
+
+            solver = Solver(A, b, backend=backend, warmStart=True)
+            first = solver.solve(method="cg", tolerance=1e-8)
+            solver.b = b * (1 + 1e-6)
+            second = solver.solve(method="cg", tolerance=1e-8)
+            self.assertLess(second.iterations, first.iterations)
+            np.testing.assert_allclose(A @ second.solution, solver.b, atol=1e-6)
+
+        solution, err, info = Solver(A, b, backend="jax").solve(method="cg", tolerance=1e-8, x0=exact)
+        np.testing.assert_allclose(solution, exact, rtol=1e-5)
+
+    def test_warm_start_with_resized_system(self):
+        """Test that the warm start falls back to no initial guess when the previous solution does not fit b."""
+        solver = Solver(self.A, self.b, warmStart=True)
+        solver.solve(method="cg", tolerance=1e-8)
+
+        n = 50
+        solver.A = sp.diags([-np.ones(n - 1), 2.01 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csr")
+        solver.b = np.ones(n)
+        solution, err, info = solver.solve(method="cg", tolerance=1e-8)
+        self.assertEqual(info, 0)
+        np.testing.assert_allclose(solver.A @ solution, solver.b, atol=1e-6)
+
+    def test_jax_solver_result(self):
+        """Test that the JAX result reports no iteration count and judges convergence on the residual."""
+        result = Solver(self.A, self.b, backend="jax").solve(method="cg", tolerance=1e-4)
+        self.assertIsNone(result.iterations)
+        self.assertTrue(result.converged)
+
+        result = Solver(self.A, self.b, backend="jax").solve(method="cg", tolerance=1e-12, maxIterations=1)
+        self.assertIsNone(result.iterations)
+        self.assertFalse(result.converged)
+
+    def test_solver_result_direct_methods(self):
+        """Test the result of the direct and multigrid methods."""
+        result = Solver(self.A, self.b, backend="scipy").solve(method="direct")
+        self.assertEqual(result.iterations, 0)
+        self.assertTrue(result.converged)
+
+        result = Solver(self.A, self.b, backend="scipy", gridShape=(10,)).solve(
+            method="multigrid", tolerance=1e-8, recordHistory=True
+        )
+        self.assertEqual(len(result.residualHistory), result.iterations)
+        self.assertTrue(result.converged)
+
+    # Direct Solver Tests
+    def test_direct_solver(self):
+        """Test the direct LU solver for each backend with single and batched right-hand sides."""
+        B = np.random.rand(10, 3)
+        for backend in ("scipy", "jax", "petsc"):
+            solution, err, info = Solver(self.A, self.b, backend=backend).solve(method="direct")
+            np.testing.assert_allclose(self.A @ solution, self.b, atol=1e-10)
+            solution, err, info = Solver(self.A, B, backend=backend).solve(method="direct")
+            np.testing.assert_allclose(self.A @ solution, B, atol=1e-10)
+
+    def test_direct_solver_factor_cache(self):
+        """Test that each solver reuses its LU factors for unchanged values and keeps at most factorCacheSize."""
+        solver = Solver(self.A, self.b, backend="scipy")
+        solver.solve(method="direct")
+        factor = solver._factorize()
+        solver.A, solver.b = self.A.copy(), np.random.rand(10)
+        self.assertIs(solver._factorize(), factor)
+        self.assertEqual(len(Solver(self.A, self.b, backend="scipy")._factorCache), 0)
+
+        A_shifted = self.A + sp.eye(10)
+        solver.A = A_shifted
+        self.assertIsNot(solver._factorize(), factor)
+        solution, err, info = solver.solve(method="direct")
+        np.testing.assert_allclose(A_shifted @ solution, solver.b, atol=1e-10)
+
+        small = Solver(self.A, self.b, backend="scipy", factorCacheSize=1)
+        small._factorize()
+        small.A = A_shifted
+        small._factorize()
+        self.assertEqual(len(small._factorCache), 1)
+        small.clearFactorCache()
+        self.assertEqual(len(small._factorCache), 0)
+
+        disabled = Solver(self.A, self.b, backend="scipy", factorCacheSize=0)
+        self.assertIsNot(disabled._factorize(), disabled._factorize())
+        self.assertEqual(len(disabled._factorCache), 0)
+
+    def test_solve_tridiagonal_batch(self):
+        """Test the vectorized Thomas algorithm against a dense solve for a batch of systems."""
+        rng = np.random.default_rng(0)
+        batch, n = 5, 8
+        lower, upper = -rng.random((batch, n)), -rng.random((batch, n))
+        diagonal = 3 + rng.random((batch, n))
+        rhs = rng.random((batch, n))
+        solution = solveTridiagonal(lower, diagonal, upper, rhs)
+        for k in range(batch):
+            A = np.diag(diagonal[k]) + np.diag(lower[k, 1:], -1) + np.diag(upper[k, :-1], 1)
+            np.testing.assert_allclose(A @ solution[k], rhs[k], atol=1e-12)
@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+import jax.numpy as jnp
+
+from fame.FVM.mesh import StructuredMesh
+from fame.FVM.property import MaterialProperty
+from fame.FVM.solver import Solver
+from fame.FVM.stencil import StencilOperator
+from fame.FVM.discretization import Discretization
+from fame.FVM.boundaryCondition import BoundaryCondition
+
+
+class TestStencilOperator(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Assemble the same heat diffusion problem as a CSR matrix and as a matrix-free stencil.
+        """
+        self.prop = MaterialProperty('Aluminum')
+        self.prop.add_property('thermalConductivity', baseValue=200, referenceTemperature=298.15, method='constant')
+
+        self.A_csr, self.b = self._discretize(((0, 2), (0, 1.5), (0, 1)), (4, 3, 5), 'csr')
+        self.A_stencil, self.b_stencil = self._discretize(((0, 2), (0, 1.5), (0, 1)), (4, 3, 5), 'matrixFree')
+
+    def _discretize(self, bounds, divisions, matrixFormat):
+        mesh = StructuredMesh(bounds, divisions)
+        bc = BoundaryCondition(mesh, convectionCoefficient=15, ambientTemperature=298)
+        bc.applyBoundaryCondition(x=bounds[0][0] if len(divisions) > 1 else bounds[0], value=300)
+        Discretization(mesh, None, self.prop, bc).discretizeHeatDiffusion(matrixFormat=matrixFormat)
+        return mesh.A, mesh.b.copy()
+
+    def testMatvecMatchesCSR(self):
+        """
+        Test that the stencil matvec and its assembled CSR form match the CSR assembly.
+        """
+        self.assertIsInstance(self.A_stencil, StencilOperator)
+        np.testing.assert_allclose(self.b_stencil, self.b)
+
+        x = np.random.default_rng(0).random(self.A_csr.shape[0])
+        np.testing.assert_allclose(self.A_stencil @ x, self.A_csr @ x, rtol=1e-12)
+        np.testing.assert_allclose(self.A_stencil.diagonal(), self.A_csr.diagonal(), rtol=1e-12)
+        np.testing.assert_allclose(self.A_stencil.tocsr().toarray(), self.A_csr.toarray(), rtol=1e-12)
+
+    def testMatvec1D(self):
+        """
+        Test the 3-point stencil on a 1D mesh.
+        """
+        A_csr, _ = self._discretize((0, 1), [6], 'csr')
+        A_stencil, _ = self._discretize((0, 1), [6], 'matrixFree')
+        x = np.random.default_rng(2).random(6)
+        np.testing.assert_allclose(A_stencil @ x, A_csr @ x, rtol=1e-12)
+
+    def testJaxMatvec(self):
+        """
+        Test that the JAX stencil matches the NumPy stencil.
+        """
+        x = np.random.default_rng(1).random(self.A_csr.shape[0])
+        np.testing.assert_allclose(np.asarray(self.A_stencil.toJax()(jnp.asarray(x))), self.A_stencil @ x, rtol=1e-5)
+
+    def testSolverAcceptsStencil(self):
+        """
+        Test that the scipy and JAX Krylov solvers accept the matrix-free operator.
+        """
+        reference = np.linalg.solve(self.A_csr.toarray(), self.b)
+        for backend, tolerance in (("scipy", 1e-6), ("jax", 1e-3)):
+            solver = Solver(self.A_stencil, self.b_stencil, backend=backend)
+            solution, err, info = solver.solve(method="bicgstab", preconditioner="jacobi")
+            np.testing.assert_allclose(solution, reference, rtol=tolerance)
+
+    def testDiaStorage(self):
+        """
+        Test that DIA storage keeps exactly the stencil diagonals and reproduces the CSR operator.
+        """
+        bounds, divisions = ((0, 2), (0, 1.5), (0, 1)), (4, 3, 5)
+        A_dia, b = self._discretize(bounds, divisions, 'dia')
+        self.assertEqual(A_dia.format, 'dia')
+        self.assertEqual(sorted(A_dia.offsets.tolist()), [-12, -4, -1, 0, 1, 4, 12])
+        np.testing.assert_allclose(A_dia.toarray(), self.A_csr.toarray(), rtol=1e-12)
+        np.testing.assert_allclose(A_dia.diagonal(), self.A_csr.diagonal(), rtol=1e-12)
+
+        A_dia1D, _ = self._discretize((0, 1), [6], 'dia')
+        self.assertEqual(sorted(A_dia1D.offsets.tolist()), [-1, 0, 1])
+
+        solution, err, info = Solver(A_dia, b, backend="scipy").solve(method="bicgstab", preconditioner="jacobi")
+        np.testing.assert_allclose(solution, np.linalg.solve(self.A_csr.toarray(), self.b), rtol=1e-6)
@@ -1,9 +1,12 @@
 import os
 import shutil
 import unittest
+from xml.etree import ElementTree
+import vtk
 import numpy as np
+from vtkmodules.util import numpy_support
 from fame.FVM.mesh import StructuredMesh
-from fame.FVM.visualization import MeshWriter
+from fame.FVM.visualization import MeshWriter, PVDCollection, AsyncMeshWriter, XDMFWriter, h5py
 
 
 class TestMeshWriter(unittest.TestCase):
@@ -134,6 +137,180 @@ class TestMeshWriter(unittest.TestCase):
         self.assertTrue(os.path.exists(pvdFile), "PVD file not created for steady-state with fixed values.")
         self.assertTrue(os.path.exists(vtsFile), "VTS file not created for steady-state with fixed values.")
 
+    def testZeroCopyExport(self):
+        """
+        Test that exported arrays share the NumPy buffers and that the written file holds the same values.
+        """
+        num_points = self.mesh.GetNumberOfPoints()
+        num_cells = self.mesh.GetNumberOfCells()
+        variables = {
+            "temperature_point": np.random.rand(num_points),
+            "velocity_cell": np.random.rand(num_cells, 3)
+        }
+        self.writer.writeVTS(self.outputDir, variables, step=7)
+
+        for name, data in variables.items():
+            target = self.mesh.GetPointData() if data.shape[0] == num_points else self.mesh.GetCellData()
+            self.assertTrue(np.shares_memory(numpy_support.vtk_to_numpy(target.GetArray(name)), data))
+
+        reader = vtk.vtkXMLStructuredGridReader()
+        reader.SetFileName(os.path.join(self.outputDir, "output_0007.vts"))
+        reader.Update()
+        output = reader.GetOutput()
+        np.testing.assert_array_equal(numpy_support.vtk_to_numpy(output.GetPointData().GetArray("temperature_point")), variables["temperature_point"])
+        np.testing.assert_array_equal(numpy_support.vtk_to_numpy(output.GetCellData().GetArray("velocity_cell")), variables["velocity_cell"])
+
+    def testEncodingOptions(self):
+        """
+        Test ascii output, compressed float32 output and rejection of unknown settings.
+        """
+        data = np.random.rand(self.mesh.GetNumberOfCells())
+
+        MeshWriter(self.mesh, encoding="ascii")._writeSingleVTS(os.path.join(self.outputDir, "ascii.vts"), {"temperature_cell": data})
+        with open(os.path.join(self.outputDir, "ascii.vts")) as f:
+            self.assertIn('format="ascii"', f.read())
+
+        writer = MeshWriter(self.mesh, compressor="lz4", compressionLevel=5, precision="float32")
+        writer._writeSingleVTS(os.path.join(self.outputDir, "float32.vts"), {"temperature_cell": data})
+        reader = vtk.vtkXMLStructuredGridReader()
+        reader.SetFileName(os.path.join(self.outputDir, "float32.vts"))
+        reader.Update()
+        array = reader.GetOutput().GetCellData().GetArray("temperature_cell")
+        self.assertEqual(array.GetDataType(), vtk.VTK_FLOAT)
+        np.testing.assert_allclose(numpy_support.vtk_to_numpy(array), data, rtol=1e-6)
+
+        with self.assertRaises(ValueError):
+            MeshWriter(self.mesh, encoding="hdf5")
+        with self.assertRaises(ValueError):
+            MeshWriter(self.mesh, compressor="zstd")
+
+    def testPVDCollectionAppend(self):
+        """
+        Test that the collection stays valid XML after every append and continues existing files.
+        """
+        pvdFile = os.path.join(self.outputDir, "collection.pvd")
+        collection = PVDCollection(pvdFile)
+        for step in range(20):
+            collection.append(f"output_{step:04d}.vts", float(step), group="", part=0)
+            entries = ElementTree.parse(pvdFile).getroot().find("Collection")
+            self.assertEqual(len(entries), step + 1)
+        self.assertEqual(entries[-1].get("file"), "output_0019.vts")
+        self.assertEqual(entries[-1].get("timestep"), "19.0")
+
+        # A file written with Windows line endings by an earlier version is continued in place
+        legacyFile = os.path.join(self.outputDir, "legacy.pvd")
+        with open(legacyFile, "w", newline="\r\n") as f:
+            f.write('<VTKFile type="Collection" version="0.1">\n  <Collection>\n'
+                    '    <DataSet timestep="0.0" file="output_0000.vtp"/>\n  </Collection>\n</VTKFile>\n')
+        PVDCollection(legacyFile).append("output_0001.vtp", 1.0)
+        entries = ElementTree.parse(legacyFile).getroot().find("Collection")
+        self.assertEqual([entry.get("file") for entry in entries], ["output_0000.vtp", "output_0001.vtp"])
+
+    def testAsyncWriter(self):
+        """
+        Test that the background writer writes copies of the submitted snapshots in order.
+        """
+        outputDir = os.path.join(self.outputDir, "async")
+        data = np.zeros(self.mesh.GetNumberOfCells())
+        with AsyncMeshWriter(MeshWriter(self.mesh), maxQueueSize=1) as writer:
+            for step in range(3):
+                data[:] = step
+                writer.writeVTS(outputDir, {"temperature_cell": data}, time=float(step), step=step)
+            writer.flush()
+            self.assertTrue(os.path.exists(os.path.join(outputDir, "output_0002.vts")))
+
+        for step in range(3):
+            reader = vtk.vtkXMLStructuredGridReader()
+            reader.SetFileName(os.path.join(outputDir, f"output_{step:04d}.vts"))
+            reader.Update()
+            written = numpy_support.vtk_to_numpy(reader.GetOutput().GetCellData().GetArray("temperature_cell"))
+            np.testing.assert_array_equal(written, step)
+        entries = ElementTree.parse(os.path.join(outputDir, "async.pvd")).getroot().find("Collection")
+        self.assertEqual([entry.get("timestep") for entry in entries], ["0.0", "1.0", "2.0"])
+
+        with self.assertRaises(RuntimeError):
+            writer.writeVTS(outputDir, {"temperature_cell": data})
+
+    def testAsyncWriterReportsErrors(self):
+        """
+        Test that a failure on the background thread is raised to the caller.
+        """
+        writer = AsyncMeshWriter(MeshWriter(self.mesh))
+        writer.writeVTS(self.outputDir, {"wrong_size": np.zeros(3)})
+        with self.assertRaises(RuntimeError):
+            writer.close()
+
+    @unittest.skipIf(h5py is None, "h5py is not installed")
+    def testXDMFWriter(self):
+        """
+        Test that the XDMF backend stores geometry once and appends each step to chunked field datasets.
+        """
+        outputDir = os.path.join(self.outputDir, "series")
+        writer = XDMFWriter(self.mesh, compressor="gzip", compressionLevel=4)
+        sidecars = []
+        for step in range(3):
+            writer.writeVTS(outputDir, {
+                "temperature_cell": np.full(self.mesh.GetNumberOfCells(), float(step)),
+                "velocity_node": np.full((self.mesh.GetNumberOfPoints(), 3), float(step))
+            }, time=0.5 * step, step=step)
+            with open(os.path.join(outputDir, "series.xdmf")) as f:
+                sidecars.append(f.read())
+        writer.close()
+
+        # each step only appends its grid in front of the closing tags
+        for previous, current in zip(sidecars, sidecars[1:]):
+            self.assertTrue(current.startswith(previous[:-len(XDMFWriter.XDMF_FOOTER)]))
+            self.assertTrue(current.endswith(XDMFWriter.XDMF_FOOTER))
+
+        with h5py.File(os.path.join(outputDir, "series.h5"), "r") as f:
+            np.testing.assert_allclose(f["mesh/points"][:], self.mesh.pointCoordinates)
+            np.testing.assert_allclose(f["time"][:], [0.0, 0.5, 1.0])
+            cells = f["fields/temperature_cell"]
+            self.assertEqual(cells.shape, (3, self.mesh.GetNumberOfCells()))
+            self.assertEqual(cells.chunks[0], 1)
+            self.assertEqual(cells.compression, "gzip")
+            np.testing.assert_array_equal(cells[1], 1.0)
+            self.assertEqual(f["fields/velocity_node"].shape, (3, self.mesh.GetNumberOfPoints(), 3))
+
+        grids = ElementTree.parse(os.path.join(outputDir, "series.xdmf")).getroot().findall(".//Grid[@GridType='Uniform']")
+        self.assertEqual(len(grids), 3)
+        self.assertEqual(grids[2].find("Time").get("Value"), "1.0")
+        self.assertEqual({a.get("Center") for a in grids[0].findall("Attribute")}, {"Cell", "Node"})
+
+        self.assertEqual(XDMFWriter(self.mesh, compressor="zlib").compressor, "gzip")
+        with self.assertRaisesRegex(ValueError, "xdmf format"):
+            XDMFWriter(self.mesh, compressor="lz4")
+
+    def testRegionAndStride(self):
+        """
+        Test that sub-box extraction with a stride writes the matching points, cells and extent.
+        """
+        outputDir = os.path.join(self.outputDir, "region")
+        writer = MeshWriter(self.mesh, region={"x": [2, 8], "z": [4, 10]}, stride=2, writeFrequency=2)
+        pointIds = np.arange(self.mesh.GetNumberOfPoints(), dtype=float)
+        cellIds = np.arange(self.mesh.GetNumberOfCells(), dtype=float)
+        for step in range(3):
+            writer.writeVTS(outputDir, {"point_id": pointIds, "cell_id": cellIds}, time=float(step), step=step)
+        self.assertFalse(os.path.exists(os.path.join(outputDir, "output_0001.vts")))
+
+        reader = vtk.vtkXMLStructuredGridReader()
+        reader.SetFileName(os.path.join(outputDir, "output_0002.vts"))
+        reader.Update()
+        grid = reader.GetOutput()
+        self.assertEqual(grid.GetExtent(), (1, 4, 0, 5, 2, 5))
+
+        i, j, k = np.meshgrid(np.arange(2, 9, 2), np.arange(0, 11, 2), np.arange(4, 11, 2), indexing="ij")
+        expectedPoints = (i + 11 * (j + 11 * k)).ravel(order="F")
+        np.testing.assert_array_equal(numpy_support.vtk_to_numpy(grid.GetPointData().GetArray("point_id")), expectedPoints)
+        np.testing.assert_allclose(numpy_support.vtk_to_numpy(grid.GetPoints().GetData()), self.mesh.pointCoordinates[expectedPoints], atol=1e-6)
+
+        i, j, k = np.meshgrid(np.arange(2, 8, 2), np.arange(0, 10, 2), np.arange(4, 10, 2), indexing="ij")
+        expectedCells = (i + 10 * (j + 10 * k)).ravel(order="F")
+        np.testing.assert_array_equal(numpy_support.vtk_to_numpy(grid.GetCellData().GetArray("cell_id")), expectedCells)
+
+        with self.assertRaises(ValueError):
+            MeshWriter(self.mesh, region={"x": [5, 20]})
+
     def testSteadyStateWithIncreasingValues(self):
         """
         Test writing steady-state data with monotonously increasing scalar, vector, and tensor fields for points and cells.